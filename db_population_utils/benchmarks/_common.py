@@ -0,0 +1,34 @@
+"""
+Shared benchmark helpers
+
+Importing this module makes the subpackages importable as
+db_population_utils.* without running db_population_utils/__init__, which
+needs the database dependencies, so the scripts import it before the package.
+"""
+
+import sys
+import time
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+package = types.ModuleType('db_population_utils')
+package.__path__ = [str(ROOT)]
+sys.modules.setdefault('db_population_utils', package)
+
+
+def timed(func, *args, **kwargs):
+    """(seconds, result) of one call"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def write_repeated(source, target, copies):
+    """Write source's header once and its data rows copies times, to scale up a real file"""
+    lines = source.read_bytes().splitlines(keepends=True)
+    with open(target, 'wb') as f:
+        f.write(lines[0])
+        for _ in range(copies):
+            f.writelines(lines[1:])
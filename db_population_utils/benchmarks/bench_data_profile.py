@@ -0,0 +1,100 @@
+"""
+Benchmark: streaming DataProfile against exact pandas statistics
+
+Profiles a synthetic listings frame in chunks with DataProcessor.profile()
+and compares it with exact pandas results: mean/std must match, quantiles
+are reported with their rank error, top-value counts with their error
+bound. Also times merging per-chunk profiles and the JSON round trip.
+
+Usage:
+    python db_population_utils/benchmarks/bench_data_profile.py [--rows N] [--chunksize N]
+"""
+
+import argparse
+import math
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Registers db_population_utils without running its __init__
+import _common  # noqa: F401
+from db_population_utils.data_processor.data_processor import DataProcessor
+from db_population_utils.data_processor.data_profile import DataProfile, QUANTILES
+
+
+def make_frame(rows, seed=3):
+    rng = np.random.default_rng(seed)
+    rent = rng.lognormal(6.6, 0.45, rows)
+    rent[rng.random(rows) < 0.02] = np.nan
+    return pd.DataFrame({
+        'kaltmiete': rent,
+        'zimmer': rng.integers(1, 7, rows),
+        'bezirk': rng.choice([f'bezirk_{i:02d}' for i in range(12)], rows, p=np.linspace(2, 0.5, 12) / 15),
+        'strasse': pd.Series(rng.integers(0, 50_000, rows)).map('strasse_{}'.format),
+        'eingestellt': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365 * 24 * 3600, rows), 's'),
+    })
+
+
+def chunks_of(df, size):
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    processor = DataProcessor()
+
+    start = time.perf_counter()
+    profile = processor.profile(chunks_of(df, args.chunksize))
+    profiled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rent = df['kaltmiete']
+    exact = {'mean': rent.mean(), 'std': rent.std(), **{q: rent.quantile(q) for q in QUANTILES}}
+    counts = df['bezirk'].value_counts()
+    exact_seconds = time.perf_counter() - start
+
+    print(f"{args.rows:,} rows in chunks of {args.chunksize:,}: profile {profiled:.2f}s, "
+          f"exact pandas stats of two columns {exact_seconds:.2f}s")
+    stats = profile.summary()['columns']['kaltmiete']
+    assert math.isclose(stats['mean'], exact['mean'], rel_tol=1e-9), (stats['mean'], exact['mean'])
+    assert math.isclose(stats['std'], exact['std'], rel_tol=1e-9), (stats['std'], exact['std'])
+    print(f"    kaltmiete mean {stats['mean']:.2f} std {stats['std']:.2f} (exact)")
+    ranked = np.sort(rent.dropna().to_numpy())
+    for q in QUANTILES:
+        key = f"p{round(q * 100)}"
+        rank = np.searchsorted(ranked, stats[key]) / len(ranked)
+        print(f"    {key:>4} {stats[key]:9.2f} exact {exact[q]:9.2f}  rank error {abs(rank - q) * 100:.3f}%")
+
+    bezirk = profile.summary()['columns']['bezirk']
+    for value, n in bezirk['top_values'][:3]:
+        assert 0 <= counts[value] - n <= bezirk['topk_error'], (value, n, counts[value])
+        print(f"    {value}: {n:,} counted, {counts[value]:,} exact (error bound {bezirk['topk_error']:,})")
+
+    start = time.perf_counter()
+    merged = DataProfile()
+    for chunk in chunks_of(df, args.chunksize):
+        merged.merge(processor.profile(chunk))
+    merged_seconds = time.perf_counter() - start
+    assert merged.rows == profile.rows
+    assert math.isclose(merged.summary()['columns']['kaltmiete']['mean'], exact['mean'], rel_tol=1e-9)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'profile.json'
+        profile.save(path)
+        size = path.stat().st_size
+        assert DataProfile.load(path).summary() == profile.summary()
+    print(f"    merging {math.ceil(args.rows / args.chunksize)} chunk profiles {merged_seconds:.2f}s, "
+          f"JSON {size / 1024:.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
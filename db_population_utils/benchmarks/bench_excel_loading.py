@@ -0,0 +1,66 @@
+"""
+Benchmark: Excel sheet selection and multi-sheet loading
+
+Compares the legacy sheet selection (one pd.read_excel(nrows=1) per sheet)
+with the single read-only inspection, on the 20-sheet crime atlas and the
+broker_20XX.xls files, and sequential vs process-pool loading of all
+sheets with load_excel_many().
+
+Usage:
+    python db_population_utils/benchmarks/bench_excel_loading.py [--workers N]
+"""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+# Registers db_population_utils without running its __init__
+from _common import timed
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ATLAS = REPO_ROOT / 'crime_statistics' / 'sources' / 'crime_atlas' / 'kriminalitaetsatlas_2015-2024.xlsx'
+BROKER_FILES = sorted((REPO_ROOT / 'real_estate_statistics' / 'sources' / 'raw_files').glob('broker_*.xls'))
+
+
+def legacy_select_sheet(source):
+    """Pre-inspection sheet selection, kept here as the baseline"""
+    sheet_names = pd.ExcelFile(source).sheet_names
+    best_sheet, max_columns = sheet_names[0], 0
+    for sheet in sheet_names:
+        columns = len(pd.read_excel(source, sheet_name=sheet, nrows=1).columns)
+        if columns > max_columns:
+            best_sheet, max_columns = sheet, columns
+    return best_sheet
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=None, help='load_excel_many pool size')
+    args = parser.parse_args()
+
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+    rows = []
+
+    for label, files in [(ATLAS.name, [ATLAS]), (f'{len(BROKER_FILES)} broker files', BROKER_FILES)]:
+        legacy_time, legacy = timed(lambda: [legacy_select_sheet(f) for f in files])
+        inspect_time, params = timed(lambda: [loader.inspect_excel(str(f)) for f in files])
+        rows.append((f'select sheet: {label}', legacy_time, inspect_time))
+        changed = [(f.name, old, p.recommended_sheet)
+                   for f, old, p in zip(files, legacy, params) if old != p.recommended_sheet]
+        for name, old, new in changed:
+            print(f"{name}: selected '{old}' before, '{new}' after")
+
+    serial_time, serial = timed(loader.load_excel_many, str(ATLAS), max_workers=1)
+    pool_time, pooled = timed(loader.load_excel_many, str(ATLAS), max_workers=args.workers)
+    assert all(serial[sheet].equals(pooled[sheet]) for sheet in serial), 'results differ'
+    rows.append((f'load {len(serial)} sheets (1 vs pool)', serial_time, pool_time))
+
+    print(f"{'':48}{'before (s)':>12}{'after (s)':>12}")
+    for name, before, after in rows:
+        print(f"{name:48}{before:>12.3f}{after:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
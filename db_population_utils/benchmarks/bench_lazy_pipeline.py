@@ -0,0 +1,101 @@
+"""
+Benchmark: lazy DataProcessor pipeline against eager step-by-step calls
+
+Writes a synthetic listings CSV (German prices, years with gaps, districts),
+runs the same five steps eagerly on the loaded frame and lazily over the
+loader's chunk stream, and prints time, frame copies and peak allocation
+(tracemalloc) of both. Checks that the results are equal.
+
+Usage:
+    python db_population_utils/benchmarks/bench_lazy_pipeline.py [--rows N] [--chunksize N]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# The data_processor package imports data_loader relatively, so load both
+# as subpackages of db_population_utils without running its __init__
+import _common  # noqa: F401
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+from db_population_utils.data_processor.data_processor import DataProcessor
+
+
+def write_csv(path, rows, seed=3):
+    rng = np.random.default_rng(seed)
+    pd.DataFrame({
+        'Kalt Miete': [f'{v:.2f} €'.replace('.', ',') for v in rng.uniform(300, 3000, rows)],
+        'Baujahr': rng.choice(['1910', '1972', '2015', None], rows),
+        'Zimmer': rng.choice(['1', '2', '3', '4'], rows),
+        'Bezirk': rng.choice(['Mitte', 'Pankow', 'Neukölln', None], rows),
+        'Fläche': [f'{v:.1f}'.replace('.', ',') for v in rng.uniform(20, 150, rows)],
+    }).to_csv(path, index=False)
+
+
+def eager(processor, df):
+    df = processor.standardize_columns(df)
+    df = processor.parse_numbers(df, ['kalt_miete', 'fläche'])
+    df = processor.coerce_types(df, {'baujahr': 'float64'})
+    df = processor.coerce_types(df, {'zimmer': 'float64'})
+    return processor.handle_nulls(df, {'bezirk': 'ffill'})
+
+
+def peak_of(function):
+    """(result, seconds, peak MB); timed on its own, since tracemalloc slows parsing down"""
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    args = parser.parse_args()
+
+    processor = DataProcessor()
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+    pipeline = (processor.lazy()
+                .standardize_columns()
+                .parse_numbers(['kalt_miete', 'fläche'])
+                .coerce_types({'baujahr': 'float64'})
+                .coerce_types({'zimmer': 'float64'})
+                .handle_nulls({'bezirk': 'ffill'}))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'listings.csv'
+        write_csv(path, args.rows)
+
+        expected, eager_seconds, eager_peak = peak_of(lambda: eager(processor, loader.load(str(path))))
+
+        def stream():
+            rows = 0
+            for chunk in pipeline.iter_chunks(loader.load(str(path), chunksize=args.chunksize)):
+                rows += len(chunk)  # e.g. written out, then dropped
+            return rows, pipeline.result
+        (rows, result), lazy_seconds, lazy_peak = peak_of(stream)
+
+        collected, _ = pipeline.collect(loader.load(str(path), chunksize=args.chunksize))
+        pd.testing.assert_frame_equal(collected, expected, check_dtype=False)
+        assert rows == len(expected)
+
+    print(f"{args.rows:,} rows, plan: {' → '.join(result.plan)}")
+    print(f"    eager  {eager_seconds:6.2f}s  copies {5:3}  peak {eager_peak:8.1f} MB")
+    print(f"    lazy   {lazy_seconds:6.2f}s  copies {result.copies:3}  peak {lazy_peak:8.1f} MB "
+          f"({result.chunks} chunks of {args.chunksize:,})")
+    for name, stats in result.step_timings.items():
+        print(f"        {name:30}{stats['seconds']:8.3f}s{stats['calls']:5}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: batch loading of the layer source files
+
+Loads every */sources/*.csv and */sources/*.geojson of the repository
+file by file with load(), then with load_many() sequentially and in a
+process pool, once pickling the frames back and once sending them as
+Arrow IPC buffers.
+
+Usage:
+    python db_population_utils/benchmarks/bench_load_many.py [--workers N]
+"""
+
+import argparse
+from pathlib import Path
+
+# Registers db_population_utils without running its __init__
+from _common import timed
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+PATTERNS = [str(REPO_ROOT / '*' / 'sources' / '*.csv'), str(REPO_ROOT / '*' / 'sources' / '*.geojson')]
+
+
+def load_serially(loader, sources):
+    frames = {}
+    for source in sources:
+        try:
+            frames[source] = loader.load(source)
+        except Exception:
+            pass
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=None, help='load_many pool size')
+    args = parser.parse_args()
+
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+    _, (_, report) = timed(loader.load_many, PATTERNS, max_workers=1)
+    sources = list(report.files)
+    print(f"{len(sources)} files, {report.total_rows} rows, {len(report.failed)} failed")
+    for source in report.failed:
+        print(f"   {Path(source).relative_to(REPO_ROOT)}: {report.files[source]['error']}")
+
+    baseline_time, baseline = timed(load_serially, loader, sources)
+    rows = []
+    for label, workers, transfer in [('load_many, 1 worker', 1, 'pickle'),
+                                     ('load_many, pool + pickle', args.workers, 'pickle'),
+                                     ('load_many, pool + Arrow IPC', args.workers, 'arrow')]:
+        elapsed, (frames, report) = timed(loader.load_many, sources, max_workers=workers,
+                                          transfer=transfer)
+        assert frames.keys() == baseline.keys(), 'different files loaded'
+        assert all(frames[s].equals(baseline[s]) for s in frames), 'results differ'
+        rows.append((f'{label} ({report.workers})', elapsed))
+
+    print(f"{'':48}{'seconds':>12}{'speedup':>10}")
+    print(f"{'load() per file':48}{baseline_time:>12.3f}{1:>10.2f}")
+    for name, elapsed in rows:
+        print(f"{name:48}{elapsed:>12.3f}{baseline_time / elapsed:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
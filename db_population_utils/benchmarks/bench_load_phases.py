@@ -0,0 +1,89 @@
+"""
+Benchmark: per-phase load timings
+
+Loads a synthetic ";" CSV (German and English decimals, dates, categories),
+plain and gzip-compressed, through build_report(), and prints where the time went
+per phase, with and without allocation tracking. Checks that the phases
+account for the load time, that decode only shows up for the compressed
+file and that the on_phase callback saw every timed step.
+
+Usage:
+    python db_population_utils/benchmarks/bench_load_phases.py [--rows N]
+"""
+
+import argparse
+import gzip
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Registers db_population_utils without running its __init__
+import _common  # noqa: F401
+from db_population_utils.data_loader.load_phases import PHASES
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+
+def write_csv(path, rows, seed=11):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'id': np.arange(rows),
+        'betrag': [f'{v:.2f}'.replace('.', ',') for v in rng.uniform(0, 1e4, rows)],
+        'datum': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D'),
+        'bezirk': rng.choice(['Mitte', 'Pankow', 'Neukölln', 'Spandau'], rows),
+        'wert': rng.normal(size=rows),
+    })
+    frame['datum'] = frame['datum'].dt.strftime('%d.%m.%Y')
+    frame.to_csv(path, sep=';', index=False)
+
+
+def report_phases(path, track_allocations):
+    events = []
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False, track_allocations=track_allocations,
+                                 on_phase=lambda phase, stats: events.append(phase))
+    start = time.perf_counter()
+    report = loader.build_report(str(path))
+    wall = time.perf_counter() - start
+    assert report.success, report.errors
+    assert len(events) == sum(stats['calls'] for stats in report.phase_timings.values())
+    return report, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = Path(tmp) / 'phases.csv'
+        write_csv(plain, args.rows)
+        compressed = Path(tmp) / 'phases.csv.gz'
+        with open(plain, 'rb') as f, gzip.open(compressed, 'wb') as g:
+            shutil.copyfileobj(f, g)
+
+        for path in (plain, compressed):
+            report_phases(path, False)  # Warm the probe cache and imports
+            for track in (False, True):
+                report, wall = report_phases(path, track)
+                timings = report.phase_timings
+                accounted = sum(stats['seconds'] for stats in timings.values())
+                assert accounted <= wall, (accounted, wall)
+                assert ('decode' in timings) == (path is compressed), list(timings)
+                assert {'parse', 'number_parsing', 'datetime_parsing', 'quality_analysis'} <= set(timings)
+                assert all(stats['peak_alloc_mb'] is not None for name, stats in timings.items()
+                           if name != 'decode') == track
+
+                label = f"{path.name}{', tracemalloc' if track else ''}"
+                print(f"{label:28} total {wall:6.3f}s, phases cover {accounted / wall:6.1%}")
+                for name in PHASES:
+                    if name in timings:
+                        stats = timings[name]
+                        peak = f"{stats['peak_alloc_mb']:8.1f} MB" if stats['peak_alloc_mb'] is not None else ''
+                        print(f"    {name:20}{stats['seconds']:8.3f}s{stats['calls']:5}x {peak}")
+
+
+if __name__ == '__main__':
+    main()
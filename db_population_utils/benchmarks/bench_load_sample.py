@@ -0,0 +1,50 @@
+"""
+Benchmark: sampled reports on a large CSV
+
+Builds public_bus_data_cleaned.csv repeated --copies times, then compares
+build_report() on the fully loaded file with build_report(sample_rows=N)
+for each load_sample() method. Every sampled row must be a row of the file.
+
+Usage:
+    python db_population_utils/benchmarks/bench_load_sample.py [--copies K] [--rows N]
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+# Registers db_population_utils without running its __init__
+from _common import timed, write_repeated
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BUS_DATA = REPO_ROOT / 'public-transport' / 'sources' / 'public_bus_data_cleaned.csv'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--copies', type=int, default=50, help='repetitions of the bus data')
+    parser.add_argument('--rows', type=int, default=10000, help='sample size')
+    args = parser.parse_args()
+
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'bus_repeated.csv'
+        write_repeated(BUS_DATA, path, args.copies)
+        print(f"{path.stat().st_size / (1024 * 1024):.1f} MB")
+
+        full_time, full = timed(loader.build_report, str(path))
+        df = loader.load(str(path)).drop_duplicates()
+        print(f"{'':28}{'seconds':>10}{'total_rows':>12}{'date columns':>14}")
+        print(f"{'full load':28}{full_time:>10.3f}{full.total_rows:>12}{len(full.date_columns_found):>14}")
+        for method in ('random_offsets', 'reservoir', 'head'):
+            elapsed, report = timed(loader.build_report, str(path), sample_rows=args.rows,
+                                    sample_method=method)
+            sample = loader.load_sample(str(path), args.rows, method, seed=0)
+            assert len(sample.merge(df, how='inner')) == len(sample), f'{method}: rows not in the file'
+            print(f"{method:28}{elapsed:>10.3f}{report.total_rows:>12}"
+                  f"{len(report.date_columns_found):>14}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: localized number parsing
+
+Converts a million-row synthetic column of German number text ("1.234,56 €",
+"12,5 %", "3 500 €", "1.200,-", "(7,25)", "99,90-") with the per-value
+.apply cleaning used in the notebooks and with to_numeric_localized, once
+with all-distinct values and once with a few thousand repeating ones
+(memoized). Then loads a ';' CSV of such columns with load_csv(), where
+read_csv applies the sniffed decimal/thousands separators itself, against
+reading text and cleaning it per value. All results are checked against
+each other.
+
+Usage:
+    python db_population_utils/benchmarks/bench_number_parsing.py [--rows N]
+"""
+
+import argparse
+import re
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Registers db_population_utils without running its __init__
+from _common import timed
+from db_population_utils.data_loader.number_parsing import to_numeric_localized
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+TEMPLATES = ['{} €', '{} %', '{}', 'EUR {}', '{}\u00a0€']
+
+
+def german(value, decimals=2):
+    text = f'{abs(value):,.{decimals}f}'.replace(',', ' ').replace('.', ',').replace(' ', '.')
+    return text, value < 0
+
+
+def synthetic_column(rows, distinct, seed=3):
+    """German number text and the values it encodes"""
+    rng = np.random.default_rng(seed)
+    values = np.round(rng.uniform(-1e6, 1e6, distinct), 2)
+    texts = []
+    for i, value in enumerate(values):
+        text, negative = german(value)
+        if negative:
+            text = ['-' + text, text + '-', f'({text})', '−' + text][i % 4]
+        elif text.endswith(',00') and i % 2:
+            text = text[:-2] + '-'  # "1.200,-"
+        texts.append(TEMPLATES[i % len(TEMPLATES)].format(text))
+    picks = rng.integers(0, distinct, rows) if distinct < rows else np.arange(rows)
+    return pd.Series(np.array(texts, dtype=object)[picks]), values[picks]
+
+
+def legacy_parse(value):
+    """Per-value cleaning as done in the notebooks, kept here as the baseline"""
+    if not isinstance(value, str):
+        return np.nan
+    text = value.replace('\u00a0', ' ').replace('€', '').replace('EUR', '').replace('%', '').strip()
+    text = text.replace('−', '-')
+    if text.endswith(',-'):
+        text = text[:-2]
+    negative = text.startswith(('-', '(')) or text.endswith(('-', ')'))
+    text = re.sub(r'[()\-\s]', '', text).replace('.', '').replace(',', '.')
+    try:
+        number = float(text)
+    except ValueError:
+        return np.nan
+    return -number if negative else number
+
+
+def write_csv(path, rows, seed=5):
+    rng = np.random.default_rng(seed)
+    prices = np.round(rng.uniform(-1e5, 1e6, rows), 2)
+    counts = rng.integers(0, 10 ** 7, rows)
+    shares = np.round(rng.uniform(0, 100, rows), 1)
+    frame = pd.DataFrame({
+        'preis': [('-' if p < 0 else '') + german(p)[0] for p in prices],
+        'anzahl': [german(c, 0)[0] for c in counts],
+        'anteil': [german(s, 1)[0] for s in shares],
+        'bezirk': rng.choice(['Mitte', 'Pankow', 'Neukölln'], rows),
+    })
+    frame.to_csv(path, sep=';', index=False)
+    return {'preis': prices, 'anzahl': counts, 'anteil': shares}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'':34}{'apply (s)':>11}{'vectorized (s)':>16}{'speedup':>9}")
+    for label, distinct in (('distinct values', args.rows), ('5,000 repeating values', 5000)):
+        column, expected = synthetic_column(args.rows, distinct)
+        legacy_time, legacy = timed(column.apply, legacy_parse)
+        fast_time, (fast, stats) = timed(to_numeric_localized, column, ',', '.')
+        assert np.allclose(legacy.to_numpy(), expected) and np.allclose(fast.to_numpy(), expected), label
+        assert stats['unparsed'] == 0 and stats['memoized'] == (distinct < args.rows)
+        print(f"{label:34}{legacy_time:>11.3f}{fast_time:>16.3f}{legacy_time / fast_time:>8.1f}x")
+
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'german_numbers.csv'
+        expected = write_csv(path, args.rows)
+
+        def read_and_apply():
+            df = pd.read_csv(path, sep=';', dtype=str)
+            for col in expected:
+                df[col] = df[col].apply(legacy_parse)
+            return df
+
+        legacy_time, legacy = timed(read_and_apply)
+        native_time, native = timed(loader.load_csv, str(path))
+        for col, values in expected.items():
+            assert np.allclose(legacy[col].to_numpy(), values), col
+            assert np.allclose(native[col].to_numpy(), values), col
+        assert not loader._last_load['number_format']['convert'], 'expected read_csv to parse every column'
+        print(f"{'load_csv, ' + path.name:34}{legacy_time:>11.3f}{native_time:>16.3f}"
+              f"{legacy_time / native_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: parallel parsing of one large CSV
+
+Compares load_csv() with load_csv(parallel=N) on public_bus_data_cleaned.csv
+(repeated to --copies times its size) and on a generated file whose text
+fields hold quoted newlines, escaped quotes and delimiters. The generated
+file is also split with several range counts and scan block sizes, and every
+result is checked against the serial parse.
+
+Usage:
+    python db_population_utils/benchmarks/bench_parallel_csv.py [--workers N] [--copies K]
+"""
+
+import argparse
+import csv
+import io
+import random
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# Registers db_population_utils without running its __init__
+from _common import timed, write_repeated
+from db_population_utils.data_loader.byte_sampling import record_boundaries
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BUS_DATA = REPO_ROOT / 'public-transport' / 'sources' / 'public_bus_data_cleaned.csv'
+
+QUOTED_TEXTS = ['plain', 'with\nnewline', 'quote "x" inside', 'a,b,c', 'multi\n\nline "q"\n',
+                '', 'ends with a quote ""', '\n']
+
+
+def write_quoted(target, rows, seed=7):
+    rng = random.Random(seed)
+    with open(target, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['id', 'comment', 'score', 'day', 'flag'])
+        for i in range(rows):
+            writer.writerow([i, rng.choice(QUOTED_TEXTS), round(rng.random() * 100, 3),
+                             f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+                             rng.choice([True, False])])
+
+
+def check_boundaries(path):
+    """Every split of the quoted file must parse to exactly the serial frame"""
+    data = Path(path).read_bytes()
+    expected = pd.read_csv(path)
+    for n_parts in (2, 7, 32):
+        for block_size in (997, 64 * 1024):
+            _, boundaries = record_boundaries(str(path), n_parts, block_size=block_size)
+            parts = [pd.read_csv(io.BytesIO(data[start:end]), header=None, names=list(expected.columns))
+                     for start, end in zip(boundaries, boundaries[1:])]
+            assert pd.concat(parts, ignore_index=True).equals(expected), (n_parts, block_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=4, help='parallel=N')
+    parser.add_argument('--copies', type=int, default=20, help='repetitions of the bus data')
+    args = parser.parse_args()
+
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        bus = Path(tmp) / 'bus_repeated.csv'
+        quoted = Path(tmp) / 'quoted_newlines.csv'
+        write_repeated(BUS_DATA, bus, args.copies)
+        write_quoted(quoted, rows=400000)
+        check_boundaries(quoted)
+
+        print(f"{'':40}{'MB':>8}{'serial (s)':>12}{'parallel (s)':>14}")
+        for path in (bus, quoted):
+            serial_time, serial = timed(loader.load_csv, str(path))
+            parallel_time, parallel = timed(loader.load_csv, str(path), parallel=args.workers)
+            assert serial.equals(parallel), f'{path.name}: results differ'
+            size_mb = path.stat().st_size / (1024 * 1024)
+            print(f"{path.name:40}{size_mb:>8.1f}{serial_time:>12.3f}{parallel_time:>14.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: partitioned run_pipeline against a single process
+
+Runs a row-independent OSM-style cleaning pipeline (text normalisation,
+coordinate parsing, a per-id dedup) followed by a global dedup barrier on
+a synthetic frame, sequentially and with parallel=2/4/8, contiguous and
+partitioned by osm_id. Checks that every run returns the sequential result.
+
+Usage:
+    python db_population_utils/benchmarks/bench_parallel_pipeline.py [--rows N]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Registers db_population_utils without running its __init__
+import _common  # noqa: F401
+from db_population_utils.data_processor.data_processor import DataProcessor
+from db_population_utils.data_processor.partitioned import partition_safe
+
+
+@partition_safe
+def clean(df):
+    df = df.copy()
+    df['name'] = df['name'].fillna('Unknown Gym').str.strip().str.title()
+    df['website'] = df['website'].fillna('').str.lower().str.strip()
+    df['street'] = df['street'].fillna('').str.replace(r'\s+', ' ', regex=True).str.strip()
+    df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
+    df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
+    df['type'] = np.where(df['leisure'].fillna('') != '', df['leisure'], df['sport'])
+    return df[df['latitude'].between(52.3, 52.7) & df['longitude'].between(13.0, 13.8)]
+
+
+@partition_safe
+def latest_per_osm_id(df):
+    return df.drop_duplicates('osm_id', keep='last')
+
+
+def dedup_by_address(df):
+    return df.drop_duplicates(['street', 'name'])
+
+
+def make_frame(rows, seed=8):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'osm_id': rng.integers(0, rows // 2, rows),
+        'name': rng.choice([' fit one ', 'McFit', None, 'urban sports club '], rows),
+        'website': rng.choice(['HTTPS://A.DE ', None, 'https://b.de'], rows),
+        'street': [f'Straße  {v}' for v in rng.integers(0, 5000, rows)],
+        'latitude': (52.3 + rng.random(rows) * 0.5).round(5).astype(str),
+        'longitude': (13.0 + rng.random(rows) * 0.9).round(5).astype(str),
+        'leisure': rng.choice(['fitness_centre', None], rows),
+        'sport': rng.choice(['yoga', 'climbing', None], rows),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    processor = DataProcessor()
+    steps = [clean, latest_per_osm_id, dedup_by_address]
+
+    start = time.perf_counter()
+    expected = processor.run_pipeline(df, steps)
+    sequential = time.perf_counter() - start
+    print(f"{args.rows:,} rows on {os.cpu_count()} CPUs, sequential {sequential:6.2f}s")
+
+    for partition_by in (None, 'osm_id'):
+        # latest_per_osm_id is only partition-safe when all rows of an id share a partition
+        run = steps if partition_by else [clean, dedup_by_address]
+        reference = expected if partition_by else processor.run_pipeline(df, run)
+        for parallel in (2, 4, 8):
+            start = time.perf_counter()
+            result = processor.run_pipeline(df, run, parallel=parallel, partition_by=partition_by)
+            seconds = time.perf_counter() - start
+            pd.testing.assert_frame_equal(result, reference)
+            stages = ', '.join(f"{'||' if stage['parallel'] else '--'} {stage['seconds']:.2f}s"
+                               for stage in processor._pipeline_stats['stages'])
+            print(f"    parallel={parallel} partition_by={partition_by!s:7} {seconds:6.2f}s  ({stages})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: blocking-based POI deduplication across sources
+
+Generates places at a constant density (about 5 per km², so blocks keep
+their size as the area grows) and lists each in one to three synthetic
+sources the way the vet clinic merge sees them: "osm" with name, street,
+house number, postcode and coordinates; "bpt" with a titled name, the
+house number inside the street and coordinates a few metres off; "taek"
+with an abbreviated street and postcode only, and occasional typos. A
+tenth of the places share a building with another place.
+DataProcessor.deduplicate() is timed at growing sizes and its clusters
+scored against the true places (pairwise precision and recall).
+
+Usage:
+    python db_population_utils/benchmarks/bench_poi_dedup.py [--places N ...]
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+# Registers db_population_utils without running its __init__
+import _common  # noqa: F401
+from db_population_utils.data_processor.data_processor import DataProcessor
+
+PLACES_PER_KM2 = 5
+SYLLABLES = ['ber', 'lin', 'mar', 'kow', 'ski', 'hau', 'sen', 'mül', 'ler', 'schu', 'ma', 'cher',
+             'wag', 'ner', 'beck', 'ers', 'hoff', 'mann', 'kel', 'rich', 'ter', 'wolf', 'fisch']
+KINDS = ['Tierarztpraxis', 'Tierklinik', 'Kleintierpraxis', 'Praxis']
+STREET_TYPES = [('straße', 'str.'), ('weg', 'weg'), ('allee', 'allee'), ('damm', 'damm')]
+
+
+def words(rng, n, parts):
+    picks = rng.integers(0, len(SYLLABLES), (n, parts))
+    return [''.join(SYLLABLES[i] for i in row).capitalize() for row in picks]
+
+
+def typo(rng, text):
+    i = int(rng.integers(1, len(text) - 1))
+    return text[:i] + text[i + 1:]
+
+
+def make_sources(places, seed=5):
+    rng = np.random.default_rng(seed)
+    side_km = math.sqrt(places / PLACES_PER_KM2)
+    lat = 52.3 + rng.random(places) * side_km / 111.2
+    lon = 13.0 + rng.random(places) * side_km / 67.9
+    postcode = 10000 + (np.floor((lat - 52.3) * 111.2 / 2) * 1000 + np.floor((lon - 13.0) * 67.9 / 2)).astype(int)
+    surname = words(rng, places, 3)
+    kind = rng.choice(KINDS, places)
+    street_type = rng.integers(0, len(STREET_TYPES), places)
+    street = np.array(words(rng, places, 2))
+    number = rng.integers(1, 200, places).astype(str)
+    # A tenth of the places share a building with another one (different names)
+    shared = np.flatnonzero(rng.random(places) < 0.1)
+    host = rng.integers(0, places, len(shared))
+    for values in (lat, lon, postcode, street_type, street, number):
+        values[shared] = values[host]
+
+    records = []
+    for source, share in (('osm', 0.8), ('bpt', 0.6), ('taek', 0.4)):
+        for i in np.flatnonzero(rng.random(places) < share):
+            long_type, short_type = STREET_TYPES[street_type[i]]
+            if source == 'osm':
+                records.append({'name': f"{kind[i]} {surname[i]}", 'street': street[i] + long_type,
+                                'housenumber': number[i], 'postcode': postcode[i],
+                                'latitude': lat[i], 'longitude': lon[i]})
+            elif source == 'bpt':
+                records.append({'name': f"Dr. med. vet. {surname[i]}",
+                                'street': f"{street[i]}{long_type} {number[i]}", 'postcode': float(postcode[i]),
+                                'latitude': lat[i] + rng.normal(0, 0.0002), 'longitude': lon[i] + rng.normal(0, 0.0003)})
+            else:
+                name = f"{kind[i]} {surname[i]}"
+                records.append({'name': typo(rng, name) if rng.random() < 0.3 else name,
+                                'street': f"{street[i]}{short_type}", 'housenumber': number[i],
+                                'postcode': str(postcode[i])})
+            records[-1].update(source=source, place=i)
+    df = pd.DataFrame(records)
+    return df.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def pair_scores(truth, predicted):
+    """Pairwise precision and recall of predicted clusters against true ones"""
+    def pairs(labels):
+        sizes = pd.Series(labels).value_counts()
+        return int((sizes * (sizes - 1) // 2).sum())
+
+    both = pairs(pd.Series(list(zip(truth, predicted))).astype(str))
+    return both / max(pairs(predicted), 1), both / max(pairs(truth), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, nargs='+', default=[25_000, 50_000, 100_000])
+    args = parser.parse_args()
+
+    processor = DataProcessor()
+    previous = None
+    for places in args.places:
+        df = make_sources(places)
+        start = time.perf_counter()
+        result = processor.deduplicate(df.drop(columns='place'), source_priority=['osm', 'bpt', 'taek'])
+        seconds = time.perf_counter() - start
+        precision, recall = pair_scores(df['place'].to_numpy(), result.clusters['cluster_id'].to_numpy())
+        stats = result.stats
+        scaling = f", {seconds / previous[1]:.2f}x time for {len(df) / previous[0]:.2f}x rows" if previous else ''
+        print(f"{len(df):,} records of {places:,} places: {seconds:.2f}s{scaling}")
+        print(f"    {stats['candidate_pairs']:,} candidate pairs instead of {stats['naive_pairs']:,}, "
+              f"{len(result.frame):,} survivors, precision {precision:.3f} recall {recall:.3f}")
+        print("    " + ", ".join(f"{phase} {value:.2f}s" for phase, value in stats['seconds'].items()))
+        previous = (len(df), seconds)
+
+
+if __name__ == '__main__':
+    main()
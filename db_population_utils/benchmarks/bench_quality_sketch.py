@@ -0,0 +1,87 @@
+"""
+Benchmark: sketch-based quality analysis against exact nunique()/duplicated()
+
+Builds a synthetic frame (ids, high-cardinality floats, categories with
+gaps, timestamps, 2% duplicated rows) and compares the exact per-column
+analysis with sketch_frame(): time, peak allocation (tracemalloc) and the
+error of the distinct and duplicate counts. Also checks that sketches of
+four slices merged together match the sketch of the whole frame.
+
+Usage:
+    python db_population_utils/benchmarks/bench_quality_sketch.py [--rows N]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+# Registers db_population_utils without running its __init__
+import _common  # noqa: F401
+from db_population_utils.data_loader.quality_sketch import QualitySketch, sketch_frame
+
+
+def make_frame(rows, seed=5):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'id': np.arange(rows),
+        'wert': rng.normal(size=rows).round(3),
+        'bezirk': rng.choice(['Mitte', 'Pankow', 'Neukölln', 'Spandau', None], rows),
+        'zeit': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 10 ** 7, rows), unit='s'),
+        'name': [f'poi-{v}' for v in rng.integers(0, rows // 4, rows)],
+    })
+    repeats = frame.sample(frac=0.02, random_state=seed)
+    return pd.concat([frame, repeats], ignore_index=True)
+
+
+def measure(function):
+    """(result, seconds, peak MB); timed on its own, since tracemalloc slows hashing down"""
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def exact(df):
+    return df.nunique().to_dict(), int(df.duplicated().sum()), int(df.isna().sum().sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    (distinct, duplicates, nulls), exact_seconds, exact_peak = measure(lambda: exact(df))
+    sketch, sketch_seconds, sketch_peak = measure(lambda: sketch_frame(df))
+    report = sketch.to_report()
+
+    print(f"{len(df):,} rows, {len(df.columns)} columns")
+    print(f"    exact   {exact_seconds:7.2f}s  peak {exact_peak:8.1f} MB")
+    print(f"    sketch  {sketch_seconds:7.2f}s  peak {sketch_peak:8.1f} MB")
+    for name, true in distinct.items():
+        estimate = report.unique_values_per_column[name]
+        error = abs(estimate - true) / true
+        print(f"    {name:8} distinct {true:>10,} ~ {estimate:>10,}  error {error:6.2%}")
+        assert error <= report.distinct_relative_error * 1.5, (name, true, estimate)
+    print(f"    duplicate rows {duplicates:,} ~ {report.duplicate_rows:,} "
+          f"({'exact' if report.duplicates_exact else 'estimated'})")
+    assert report.duplicate_rows == duplicates
+    assert sum(stats['nulls'] for stats in report.column_stats.values()) == nulls
+
+    merged = QualitySketch()
+    for part in np.array_split(np.arange(len(df)), 4):
+        merged.merge(sketch_frame(df.iloc[part]))
+    assert merged.to_report().unique_values_per_column == report.unique_values_per_column
+    assert merged.duplicate_rows == duplicates
+    print(f"    4 merged slices match the whole frame, quality_score {report.quality_score}")
+
+
+if __name__ == '__main__':
+    main()
@@ -21,6 +21,7 @@ __author__ = "Data Pool Team"
 # Core imports
 try:
     from .smart_auto_data_loader import SmartAutoDataLoader, LoadReport
+    from .batch_loading import BatchLoadReport
     
     # Backward compatibility with old complex API
     DataLoader = SmartAutoDataLoader  # For legacy code
@@ -29,6 +30,7 @@ try:
     __all__ = [
         "SmartAutoDataLoader",  # Primary class
         "LoadReport",           # Result reporting
+        "BatchLoadReport",      # load_many() results
         "DataLoader",           # Legacy compatibility
     ]
     
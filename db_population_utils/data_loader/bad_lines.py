@@ -0,0 +1,237 @@
+"""
+Bad-Line Quarantine
+=====================================
+
+Single-pass handling of malformed CSV records for load(on_bad_lines=...):
+
+- iter_record_blocks: cuts the (decompressed) byte stream into blocks of
+  whole records; quote-aware, so a quoted newline never splits a record
+- BadLineQuarantine: parses each block with the C engine, takes the records
+  the parser skipped (too many fields, a quote never closed) out of it and
+  writes them to a quarantine file with their line number and raw bytes,
+  while the good rows go on to the caller
+
+The load aborts with BadLinesError as soon as the share of bad rows passes
+error_tolerance (percent), so a broken export is not read to the end.
+
+Quarantine files are JSON Lines next to the source (data.csv →
+data.csv.quarantine.jsonl), one object per bad record: line (1-based, in
+the decompressed file), error and raw. raw is the record decoded with
+surrogateescape, so raw.encode(encoding, 'surrogateescape') gives back the
+exact bytes.
+"""
+
+import io
+import json
+import re
+import warnings
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from .compressed_source import split_member
+from .data_loader import BadLinesError
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+BAD_LINE_MODES = ('error', 'warn', 'skip', 'quarantine')
+
+QUARANTINE_SUFFIX = '.quarantine.jsonl'
+
+# Bytes read per block; every block is parsed on its own
+BLOCK_BYTES = 8 * 1024 * 1024
+
+_SKIPPED = re.compile(r'Skipping line (\d+): (.*)')
+_EOF_IN_QUOTES = re.compile(r'EOF inside string starting at row (\d+)')
+
+
+def iter_record_blocks(stream: BinaryIO, block_size: int = BLOCK_BYTES,
+                       quote: bytes = b'"') -> Iterator[bytes]:
+    """
+    Blocks of whole records from a binary stream
+
+    Each block ends at the last newline outside quotes; the rest is carried
+    into the next one. A quote that is never closed carries everything up to
+    the end of the stream into the last block.
+    """
+    carry = b''
+    while True:
+        data = stream.read(block_size)
+        if not data:
+            if carry:
+                yield carry
+            return
+        buffer = carry + data
+        cut = _last_record_end(buffer, quote)
+        if cut > 0:
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+        carry = buffer
+
+
+def split_records(block: bytes, quote: bytes = b'"') -> List[bytes]:
+    """Records of a block (newline included), with quoted newlines kept inside their record"""
+    records, pending, inside = [], [], False
+    for line in block.splitlines(keepends=True):
+        pending.append(line)
+        inside ^= bool(line.count(quote) & 1)
+        if not inside:
+            records.append(b''.join(pending))
+            pending = []
+    if pending:
+        records.append(b''.join(pending))
+    return records
+
+
+def quarantine_path(source: str) -> Path:
+    """Default quarantine file: next to the source (archive members: next to the archive)"""
+    path, member = split_member(source)
+    name = Path(member).name if member else Path(path).name
+    return Path(path).parent / f"{name}{QUARANTINE_SUFFIX}"
+
+
+class BadLineQuarantine:
+    """
+    Bad-row accounting for one CSV load
+
+    mode is 'warn' (bad rows reported and dropped), 'skip' (dropped) or
+    'quarantine' (dropped and written to path). error_tolerance is the
+    percentage of bad rows allowed, checked after every block; None allows
+    any number.
+    """
+
+    def __init__(self, source: str, mode: str = 'quarantine', error_tolerance: Optional[float] = None,
+                 path: Optional[str] = None, quote_char: str = '"', encoding: str = 'utf-8'):
+        if mode not in BAD_LINE_MODES[1:]:
+            raise ValueError(f"on_bad_lines must be one of {BAD_LINE_MODES}, got {mode!r}")
+        self.source = source
+        self.mode = mode
+        self.error_tolerance = error_tolerance
+        self.path = Path(path) if path else quarantine_path(source)
+        self.quote = quote_char.encode('ascii')
+        self.encoding = encoding
+        self.rows_scanned = 0
+        self.bad_rows = 0
+        self._lines = 0  # Physical lines before the current block
+        self._file = None
+        if mode == 'quarantine' and self.path.exists():
+            self.path.unlink()  # Left over from an earlier load
+
+    def parse(self, block: bytes, first: bool = False, **read_kwargs) -> 'pd.DataFrame':
+        """
+        Good rows of a block of whole records (read_kwargs go to pd.read_csv)
+
+        first=True drops the header record at the start of the block.
+        Raises BadLinesError when the bad-row rate passes error_tolerance.
+        """
+        if first:
+            header_end = _first_record_end(block, self.quote)
+            self._lines += block.count(b'\n', 0, header_end)
+            block = block[header_end:]
+
+        df, bad = self._read_block(block, read_kwargs)
+        if bad:
+            self._record(block, bad)
+        self.rows_scanned += len(df) + len(bad)
+        self._lines += block.count(b'\n')
+        self._check_tolerance()
+        return df
+
+    def stats(self) -> Dict[str, Any]:
+        """rows_scanned, bad_rows, recovery_percentage, mode, error_tolerance, quarantine_path"""
+        recovered = 100.0 * (self.rows_scanned - self.bad_rows) / self.rows_scanned if self.rows_scanned else 100.0
+        return {'mode': self.mode, 'rows_scanned': self.rows_scanned, 'bad_rows': self.bad_rows,
+                'recovery_percentage': recovered, 'error_tolerance': self.error_tolerance,
+                'quarantine_path': str(self.path) if self._file is not None else None}
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    def _read_block(self, block: bytes, read_kwargs: Dict[str, Any]
+                    ) -> Tuple['pd.DataFrame', List[Tuple[int, str]]]:
+        """Parse a block, returning (good rows, [(record index in block, error)])"""
+        import pandas as pd
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', pd.errors.ParserWarning)
+            try:
+                df = pd.read_csv(io.BytesIO(block), header=None, index_col=False, on_bad_lines='warn',
+                                 **read_kwargs)
+            except pd.errors.ParserError as e:
+                match = _EOF_IN_QUOTES.search(str(e))
+                if match is None:
+                    raise
+                # Everything from the unclosed quote on is one bad record
+                records = split_records(block, self.quote)
+                row = int(match.group(1))
+                df, bad = self._read_block(b''.join(records[:row]), read_kwargs)
+                return df, bad + [(row, 'EOF inside a quoted field')]
+
+        bad = []
+        for warning in caught:
+            if issubclass(warning.category, pd.errors.ParserWarning):
+                bad += [(int(line) - 1, error) for line, error in _SKIPPED.findall(str(warning.message))]
+            else:
+                warnings.warn_explicit(warning.message, warning.category, warning.filename, warning.lineno)
+        return df, bad
+
+    def _record(self, block: bytes, bad: List[Tuple[int, str]]) -> None:
+        self.bad_rows += len(bad)
+        if self.mode == 'skip':
+            return
+
+        records = split_records(block, self.quote)
+        first_lines = [self._lines + 1]
+        for record in records:
+            first_lines.append(first_lines[-1] + record.count(b'\n'))
+
+        if self.mode == 'warn':
+            for row, error in bad:
+                warnings.warn(f"{self.source}, line {first_lines[row]}: bad line skipped ({error})")
+            return
+
+        if self._file is None:
+            self._file = open(self.path, 'w', encoding='utf-8')
+        for row, error in bad:
+            entry = {'line': first_lines[row], 'error': error,
+                     'raw': records[row].rstrip(b'\r\n').decode(self.encoding, 'surrogateescape')}
+            self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+
+    def _check_tolerance(self) -> None:
+        if self.error_tolerance is None or not self.rows_scanned:
+            return
+        rate = 100.0 * self.bad_rows / self.rows_scanned
+        if rate > self.error_tolerance:
+            self.close()
+            where = f", see {self.path}" if self._file is not None else ""
+            raise BadLinesError(f"{self.bad_rows} of {self.rows_scanned} rows are malformed "
+                                f"({rate:.2f}% > error_tolerance={self.error_tolerance}%){where}")
+
+
+def _last_record_end(buffer: bytes, quote: bytes) -> int:
+    """Offset after the last newline outside quotes (0 if none)"""
+    parity = buffer.count(quote) & 1
+    end = len(buffer)
+    newline = buffer.rfind(b'\n')
+    while newline >= 0:
+        parity ^= buffer.count(quote, newline, end) & 1
+        if not parity:
+            return newline + 1
+        end = newline
+        newline = buffer.rfind(b'\n', 0, newline)
+    return 0
+
+
+def _first_record_end(buffer: bytes, quote: bytes) -> int:
+    """Offset after the first newline outside quotes (len(buffer) if none)"""
+    parity, start = 0, 0
+    newline = buffer.find(b'\n')
+    while newline >= 0:
+        parity ^= buffer.count(quote, start, newline) & 1
+        if not parity:
+            return newline + 1
+        start = newline
+        newline = buffer.find(b'\n', newline + 1)
+    return len(buffer)
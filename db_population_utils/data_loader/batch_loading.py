@@ -0,0 +1,137 @@
+"""
+Batch Loading
+=====================================
+
+Helpers for SmartAutoDataLoader.load_many(), which loads many files in a
+process pool:
+
+- expand_sources: paths and glob patterns ('*/sources/*.csv') → file list
+- frame_to_ipc / frame_from_ipc: hand a worker's DataFrame to the parent as
+  one Arrow IPC buffer instead of pickling it column by column
+
+Arrow transfer needs pyarrow. GeoDataFrames and frames Arrow cannot
+represent (mixed-type object columns) fall back to pickle.
+"""
+
+import glob
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+from .compressed_source import split_member
+from .data_loader import DataQualityReport
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TRANSFERS = ('pickle', 'arrow')
+
+ARROW_INSTALL_HINT = "transfer='arrow' needs pyarrow: pip install pyarrow"
+
+_GLOB_CHARS = frozenset('*?[')
+
+
+@dataclass
+class BatchLoadReport:
+    """Aggregated result of load_many()"""
+    # Per source: format, rows, columns, memory_mb, seconds (in the worker),
+    # transfer ('arrow'/'pickle'/None), error (None if loaded), phases
+    # (the worker's per-phase timings, see load_phases.py) and, with
+    # quality=True, quality (the file's DataQualityReport)
+    files: Dict[str, Dict[str, Any]]
+    total_rows: int
+    total_seconds: float  # wall clock, including pool start-up and transfer
+    workers: int
+    failed: List[str] = field(default_factory=list)
+    # load_many(quality=True): the files' sketches merged, None unless all
+    # loaded files have the same columns and dtypes
+    quality: Optional[DataQualityReport] = None
+
+
+def expand_sources(sources: Union[str, Sequence[str]]) -> List[str]:
+    """
+    Expand glob patterns (recursive '**' included) and drop duplicates
+
+    Plain paths are kept even if missing so they are reported as failed
+    loads; patterns matching nothing raise FileNotFoundError.
+    """
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+
+    expanded = []
+    for source in map(str, sources):
+        if _GLOB_CHARS.isdisjoint(split_member(source)[0]):
+            expanded.append(source)
+            continue
+        matches = sorted(path for path in glob.glob(source, recursive=True) if Path(path).is_file())
+        if not matches:
+            raise FileNotFoundError(f"No files match {source}")
+        expanded.extend(matches)
+    return list(dict.fromkeys(expanded))
+
+
+def largest_first(sources: List[str]) -> List[str]:
+    """Sources ordered by size on disk, so the longest loads start first"""
+    def size(source):
+        try:
+            return Path(split_member(source)[0]).stat().st_size
+        except OSError:
+            return 0
+    return sorted(sources, key=size, reverse=True)
+
+
+def frame_to_ipc(df: 'pd.DataFrame') -> Tuple[str, Any, Dict[str, Any]]:
+    """
+    ('arrow', IPC stream bytes, dtype hints) for the parent to rebuild, or
+    ('pickle', df, {}) when Arrow cannot carry the frame as it is
+
+    Frames loaded with Arrow-backed dtypes (LoadStrategy.PERFORMANCE) are
+    rebuilt without conversion; other extension dtypes the pandas metadata
+    does not restore exactly (string storage) are listed in the hints.
+    """
+    import pandas as pd
+    import pyarrow as pa
+
+    if type(df) is not pd.DataFrame:
+        return 'pickle', df, {}  # GeoDataFrame: geometry has no Arrow mapping here
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return 'pickle', df, {}
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    arrow_backed = len(df.columns) > 0 and all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    dtypes = {} if arrow_backed else {col: dtype for col, dtype in df.dtypes.items()
+                                      if isinstance(dtype, (pd.StringDtype, pd.ArrowDtype))}
+    return 'arrow', sink.getvalue().to_pybytes(), {'arrow_backed': arrow_backed, 'dtypes': dtypes}
+
+
+def frame_from_ipc(payload: Tuple[str, Any, Dict[str, Any]]) -> 'pd.DataFrame':
+    """DataFrame from a frame_to_ipc() payload"""
+    kind, data, hints = payload
+    if kind == 'pickle':
+        return data
+
+    import pandas as pd
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(data).read_all()
+    if hints['arrow_backed']:
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    df = table.to_pandas()
+    for col, dtype in hints['dtypes'].items():
+        if df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def require_pyarrow() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(ARROW_INSTALL_HINT) from e
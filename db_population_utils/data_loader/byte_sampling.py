@@ -0,0 +1,216 @@
+"""
+Byte-Range Sampling
+=====================================
+
+Reads small byte ranges spread over a text file and aligns each one to
+whole lines, so a sample of rows can be parsed without reading the file.
+Used for memory estimation and sample loading.
+
+read_record_ranges does the same at random offsets for load_sample(). A
+random offset may land inside a quoted field, so the quote state there is
+guessed from the first quote char whose neighbours tell an opening quote
+(after a delimiter) from a closing one (before a delimiter), and the range
+starts at the next newline outside quotes.
+
+record_boundaries splits a whole file into ranges of complete records for
+parallel parsing. It is quote-aware: a newline inside a quoted field never
+ends a range.
+"""
+
+import random
+from typing import BinaryIO, List, Optional, Tuple
+
+SAMPLE_METHODS = ('random_offsets', 'reservoir', 'head')
+
+# Byte ranges read by load_sample(method='random_offsets')
+SAMPLE_RANGES = 32
+
+# Rows per chunk of a reservoir sampling pass
+SAMPLE_CHUNKSIZE = 100000
+
+# Bytes scanned per read when looking for record boundaries
+SCAN_BLOCK = 4 * 1024 * 1024
+
+# Smallest range worth handing to a parser process
+MIN_RANGE_BYTES = 1024 * 1024
+
+
+def header_end(head: bytes) -> int:
+    """Byte offset where the data starts (after the first line)"""
+    newline = head.find(b'\n')
+    return newline + 1 if newline >= 0 else len(head)
+
+
+def stratified_offsets(data_start: int, size: int, n_ranges: int) -> List[int]:
+    """n_ranges offsets evenly spread over [data_start, size)"""
+    span = size - data_start
+    if span <= 0 or n_ranges <= 0:
+        return []
+    return [data_start + (span * i) // n_ranges for i in range(n_ranges)]
+
+
+def read_aligned_ranges(path: str, offsets: List[int], range_bytes: int) -> List[bytes]:
+    """
+    Read range_bytes at each offset, extended to whole lines
+
+    A range that starts inside a line skips to the next line start, and
+    every range is completed up to (and including) its last newline.
+    """
+    blocks = []
+    with open(path, 'rb') as f:
+        for offset in offsets:
+            if offset > 0:
+                # Stepping back one byte keeps a line that starts exactly at offset
+                f.seek(offset - 1)
+                f.readline()
+            else:
+                f.seek(0)
+
+            block = f.read(range_bytes)
+            if not block:
+                continue
+            if not block.endswith(b'\n'):
+                block += f.readline()
+            blocks.append(block if block.endswith(b'\n') else block + b'\n')
+    return blocks
+
+
+def random_offsets(data_start: int, size: int, n_ranges: int, range_bytes: int,
+                   seed: Optional[int] = None) -> List[int]:
+    """
+    n_ranges sorted random offsets in [data_start, size), one per stratum
+
+    Each offset is drawn within its own 1/n_ranges of the file, early enough
+    that a range of range_bytes from it does not run into the next stratum,
+    so ranges do not overlap.
+    """
+    span = size - data_start
+    if span <= 0 or n_ranges <= 0:
+        return []
+    rng = random.Random(seed)
+    stratum = span // n_ranges
+    return [data_start + stratum * i + rng.randrange(max(stratum - range_bytes, 1))
+            for i in range(n_ranges)]
+
+
+def read_record_ranges(path: str, offsets: List[int], range_bytes: int, quote_char: str = '"',
+                       delimiter: str = ',') -> List[bytes]:
+    """
+    Read range_bytes at each offset, extended to whole records
+
+    Like read_aligned_ranges, but quote-aware: a range starts at the first
+    newline outside quotes after its offset and ends at the first one after
+    range_bytes, so quoted newlines never split a record.
+    """
+    quote = quote_char.encode('ascii')
+    sep = delimiter.encode('ascii')
+    blocks = []
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        for offset in offsets:
+            f.seek(offset)
+            inside = guess_quote_state(f.read(min(range_bytes, 64 * 1024)), quote, sep)
+            start = _next_record_start(f, offset, quote, SCAN_BLOCK, size, inside) if offset else 0
+            if start >= size:
+                continue
+            f.seek(start)
+            block = f.read(range_bytes)
+            end = _next_record_start(f, start + len(block), quote, SCAN_BLOCK, size,
+                                     bool(block.count(quote) & 1))
+            f.seek(start + len(block))
+            block += f.read(end - start - len(block))
+            blocks.append(block if block.endswith(b'\n') else block + b'\n')
+    return blocks
+
+
+def guess_quote_state(block: bytes, quote: bytes = b'"', delimiter: bytes = b',') -> bool:
+    """
+    Whether the start of block lies inside a quoted field (best guess)
+
+    Doubled quotes ("" escapes, empty fields) are skipped. The first quote
+    preceded by a delimiter or newline and followed by field text opens a
+    field, so the start was outside quotes; the first one followed by a
+    delimiter or newline after field text closes one. Quotes in between that
+    decide nothing flip the answer. A block without any is taken as outside.
+    """
+    separators = (delimiter, b'\n', b'\r')
+    flips = 0
+    i = block.find(quote)
+    while 0 <= i < len(block) - 1:
+        before = block[i - 1:i] if i else b''
+        after = block[i + 1:i + 2]
+        if after == quote:
+            i = block.find(quote, i + 2)
+            continue
+        if before in separators and after not in separators:
+            return bool(flips & 1)
+        if after in separators and before not in separators and before:
+            return not flips & 1
+        flips += 1
+        i = block.find(quote, i + 1)
+    return False
+
+
+def record_boundaries(path: str, n_parts: int, quote_char: str = '"',
+                      block_size: int = SCAN_BLOCK) -> Tuple[int, List[int]]:
+    """
+    Split a CSV into up to n_parts byte ranges of whole records
+
+    Quote state is tracked by counting quote chars from the start of the
+    file (an escaped "" counts twice and keeps the parity), so a range only
+    ends at a newline outside quotes. The file is read once; bytes.count
+    keeps that pass much cheaper than parsing.
+
+    Returns:
+        (data_start, boundaries): the offset after the header record, and
+        offsets [data_start, ..., file size] whose consecutive pairs are the ranges
+    """
+    quote = quote_char.encode('ascii')
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        f.seek(0)
+        data_start = _next_record_start(f, 0, quote, block_size, size)
+        targets = [data_start + (size - data_start) * i // n_parts for i in range(1, n_parts)]
+
+        boundaries, pos, inside = [data_start], data_start, False
+        f.seek(data_start)
+        for target in targets:
+            if target <= boundaries[-1]:
+                continue
+            # Quote parity at the target, from the counts since the last boundary
+            while pos < target:
+                block = f.read(min(block_size, target - pos))
+                if not block:
+                    break
+                inside ^= bool(block.count(quote) & 1)
+                pos += len(block)
+            boundary = _next_record_start(f, pos, quote, block_size, size, inside)
+            if boundary >= size:
+                break
+            boundaries.append(boundary)
+            f.seek(boundary)
+            pos, inside = boundary, False
+
+    boundaries.append(size)
+    return data_start, boundaries
+
+
+def _next_record_start(f: BinaryIO, pos: int, quote: bytes, block_size: int, size: int,
+                       inside: bool = False) -> int:
+    """Offset after the first newline at or after pos that lies outside quotes (size if none)"""
+    f.seek(pos)
+    while True:
+        block = f.read(block_size)
+        if not block:
+            return size
+        i = 0
+        while True:
+            newline = block.find(b'\n', i)
+            if newline < 0:
+                inside ^= bool(block.count(quote, i) & 1)
+                break
+            inside ^= bool(block.count(quote, i, newline) & 1)
+            if not inside:
+                return pos + newline + 1
+            i = newline + 1
+        pos += len(block)
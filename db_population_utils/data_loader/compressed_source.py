@@ -0,0 +1,213 @@
+"""
+Compressed and Archived Sources
+=====================================
+
+gzip, bz2, xz and zstd files and members of zip archives are read through a
+decompressing stream: nothing is extracted to a temporary file, and the
+probe, the chunked CSV parser and the Overpass streamer all see the plain
+bytes as they are decompressed.
+
+Zip members are addressed as 'archive.zip::member.csv'. An archive holding
+a single data file can be given without the member. Compression is
+recognized from the magic bytes rather than the suffix, since exports are
+often misnamed (a zip saved as .gz). zip files that are OOXML packages
+(.xlsx) are workbooks, not archives.
+
+zstd needs the optional zstandard package.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import struct
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Collection, Iterator, Optional, Tuple, Union
+
+# Separates an archive path from the member to read
+MEMBER_SEPARATOR = '::'
+
+MAGIC = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+    (b'PK\x03\x04', 'zip'),
+]
+
+# Suffixes dropped to find the format of the decompressed data (data.csv.gz → .csv)
+COMPRESSION_SUFFIXES = ('.gz', '.gzip', '.bz2', '.xz', '.zst', '.zstd', '.zip')
+
+ZSTD_INSTALL_HINT = "zstd sources need the zstandard package: pip install zstandard"
+
+# Present in every OOXML package (xlsx/xlsm/docx), never in a plain archive
+_OOXML_MARKER = '[Content_Types].xml'
+
+
+def split_member(source: str) -> Tuple[str, Optional[str]]:
+    """'archive.zip::dir/member.csv' → ('archive.zip', 'dir/member.csv'); plain paths → (path, None)"""
+    path, sep, member = str(source).partition(MEMBER_SEPARATOR)
+    return path, (member or None) if sep else None
+
+
+def detect_compression(path: str, member: Optional[str] = None) -> Optional[str]:
+    """Compression of a file from its magic bytes (None: plain file or OOXML workbook)"""
+    with open(path, 'rb') as f:
+        magic = f.read(6)
+
+    for signature, compression in MAGIC:
+        if magic.startswith(signature):
+            if compression == 'zip' and member is None and _is_ooxml(path):
+                return None
+            return compression
+    return None
+
+
+def resolve_member(path: str, member: Optional[str],
+                   data_suffixes: Collection[str] = ()) -> str:
+    """
+    The zip member to read: the requested one, or the only data file in the archive
+
+    Without a member, an archive with one file (or exactly one file whose
+    suffix is in data_suffixes, e.g. a zipped shapefile's .shp) resolves to
+    it; anything else raises ValueError listing the members.
+    """
+    with zipfile.ZipFile(path) as archive:
+        names = [name for name in archive.namelist()
+                 if not name.endswith('/') and not name.startswith('__MACOSX/')]
+
+    if member is not None:
+        if member not in names:
+            raise FileNotFoundError(f"'{member}' not found in {path}, members: {names}")
+        return member
+
+    candidates = names if len(names) == 1 else [
+        name for name in names if Path(name).suffix.lower() in data_suffixes]
+    if len(candidates) != 1:
+        raise ValueError(f"{path} holds {len(names)} files, pick one with "
+                         f"'{path}{MEMBER_SEPARATOR}<member>': {names}")
+    return candidates[0]
+
+
+def data_name(path: str, member: Optional[str], compression: Optional[str]) -> str:
+    """Name of the decompressed data, whose suffix tells its format (data.csv.gz → data.csv)"""
+    if member is not None:
+        return member
+    name = Path(path).name
+    if compression is not None and Path(name).suffix.lower() in COMPRESSION_SUFFIXES:
+        return name[:-len(Path(name).suffix)]
+    return name
+
+
+def uncompressed_size(path: str, member: Optional[str], compression: Optional[str]) -> Optional[int]:
+    """
+    Size of the decompressed data when the container records it
+
+    zip stores it per member and gzip in its trailer (modulo 4 GiB, so a
+    trailer smaller than the compressed file is ignored); bz2, xz and zstd
+    streams are not inspected (None).
+    """
+    if compression is None:
+        return Path(path).stat().st_size
+    if compression == 'zip':
+        with zipfile.ZipFile(path) as archive:
+            return archive.getinfo(member).file_size
+    if compression == 'gzip':
+        with open(path, 'rb') as f:
+            f.seek(-4, io.SEEK_END)
+            size = struct.unpack('<I', f.read(4))[0]
+            return size if size >= f.tell() else None
+    return None
+
+
+def estimate_data_size(size_bytes: int, head: bytes, compression: str) -> int:
+    """
+    Decompressed size from the compression ratio of the head sample
+
+    For streams that do not record their size: the head is recompressed with
+    the same codec and its ratio applied to the compressed file size.
+    """
+    if compression == 'bz2':
+        compressed = bz2.compress(head)
+    elif compression == 'xz':
+        compressed = lzma.compress(head)
+    elif compression == 'zstd':
+        import zstandard
+        compressed = zstandard.ZstdCompressor().compress(head)
+    else:
+        compressed = gzip.compress(head)
+    return int(size_bytes * len(head) / max(len(compressed), 1))
+
+
+def open_decompressed(path: str, member: Optional[str] = None,
+                      compression: Optional[str] = None) -> BinaryIO:
+    """Binary stream of the decompressed data (the raw file when compression is None)"""
+    if compression is None:
+        return open(path, 'rb')
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'bz2':
+        return bz2.open(path, 'rb')
+    if compression == 'xz':
+        return lzma.open(path, 'rb')
+    if compression == 'zstd':
+        return _open_zstd(path)
+    if compression == 'zip':
+        archive = zipfile.ZipFile(path)
+        try:
+            # The member stream keeps the file open after the archive is closed
+            return archive.open(member)
+        finally:
+            archive.close()
+    raise ValueError(f"Unsupported compression: {compression!r}")
+
+
+@contextmanager
+def open_source(path: str, member: Optional[str] = None, compression: Optional[str] = None,
+                *, seekable: bool = False) -> Iterator[Union[str, BinaryIO]]:
+    """
+    What to hand to a reader: the path itself for plain files (so readers
+    keep their own fast file access), otherwise a decompressing stream
+
+    seekable=True buffers the decompressed data in memory, for readers that
+    jump around the file (Excel workbooks).
+    """
+    if compression is None:
+        yield path
+        return
+
+    with open_decompressed(path, member, compression) as stream:
+        if seekable:
+            yield io.BytesIO(stream.read())
+        else:
+            yield stream
+
+
+def gdal_path(path: str, member: Optional[str], compression: Optional[str]) -> Optional[str]:
+    """GDAL virtual file system path streaming a zip member or gzip file (None otherwise)"""
+    if compression == 'zip':
+        return f"/vsizip/{Path(path).resolve()}/{member}"
+    if compression == 'gzip':
+        return f"/vsigzip/{Path(path).resolve()}"
+    return None
+
+
+def _is_ooxml(path: str) -> bool:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            return _OOXML_MARKER in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def _open_zstd(path: str) -> BinaryIO:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(ZSTD_INSTALL_HINT) from e
+
+    raw = open(path, 'rb')
+    reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return io.BufferedReader(reader)
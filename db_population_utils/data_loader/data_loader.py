@@ -11,6 +11,9 @@ Key Design Philosophy:
     - **Quality Focused**: Built-in data validation, profiling, and quality assessment (no transformation)
     - **Requirements**: Exactly 10 methods focusing on critical functionality
     - **Core Formats**: Only 3 essential file formats (CSV 95%, Excel 80%, JSON 70%)
+    - **Geospatial Layers**: GeoJSON, GeoPackage and Shapefile (optional geopandas + pyogrio)
+    - **Compressed Sources**: gzip/bz2/xz/zstd files and zip members (archive.zip::member.csv), streamed
+    - **Bad-Line Quarantine**: malformed CSV rows set aside in the same pass that loads the good ones
     - **Integration Ready**: Seamless integration with DataProcessor and DBConnector
     - **Comprehensive Operations**: Single-call methods combining detection, loading, and reporting
 
@@ -77,6 +80,7 @@ Format Support (Manager Priority Only):
     CSV/TSV    │    ✓      │     ✓      │    ✓     │ 95% (CRITICAL) │ REQUIRED
     Excel      │    ✓      │     ✓      │    ✓     │ 80% (HIGH)     │ REQUIRED  
     JSON       │    ✓      │     ✓      │    ✓     │ 70% (MEDIUM)   │ REQUIRED
+    Geo layers │    ✓      │     ✓      │    ✓     │ spatial inputs │ OPTIONAL
 
 
 """
@@ -99,8 +103,11 @@ if TYPE_CHECKING:
 # Type definitions (Manager Requirements Only)
 PathLike = Union[str, Path]
 SourceLike = Union[PathLike, "IOBase"]  # Local files only per manager requirements
-Kind = Literal["auto", "csv", "tsv", "excel", "json"]  # Only 3 core formats per manager
-CompressionType = Literal["infer", "gzip", "bz2", "zip", None]  # Basic compression only
+Kind = Literal["auto", "csv", "tsv", "excel", "json", "geojson", "gpkg", "shapefile"]
+CompressionType = Literal["infer", "gzip", "bz2", "xz", "zstd", "zip", None]  # None: read as is
+
+# on_phase(phase, stats) hook, see load_phases.py for the phases and stats
+from .load_phases import PhaseCallback
 
 
 # -----------------------
@@ -150,10 +157,25 @@ class JsonParams:
     record_path: Optional[Union[str, List[str]]] = None
     orient: Optional[str] = None
     # Detection results
-    structure_type: str = "unknown"  # "flat", "nested", "array_of_objects"
+    structure_type: str = "unknown"  # "flat", "nested", "array_of_objects", "overpass"
     estimated_records: Optional[int] = None
 
 
+@dataclass
+class GeoParams:
+    """Parameters for geospatial file loading (GeoJSON, GeoPackage, Shapefile)."""
+    layer: Optional[Union[str, int]] = None
+    bbox: Optional[Tuple[float, float, float, float]] = None  # xmin, ymin, xmax, ymax in the layer CRS
+    columns: Optional[List[str]] = None
+    geometry: bool = True  # False: attribute table only
+    # Detection results
+    available_layers: List[str] = field(default_factory=list)
+    crs: Optional[str] = None
+    geometry_type: Optional[str] = None
+    feature_count: Optional[int] = None
+    total_bounds: Optional[Tuple[float, float, float, float]] = None
+
+
 @dataclass
 class LoadOptions:
     """High-level overrides to control loading behavior across formats."""
@@ -164,6 +186,9 @@ class LoadOptions:
     
     # Performance options
     chunksize: Optional[int] = None
+    parallel: Optional[int] = None  # CSV: parse byte ranges in this many processes
+    columns: Optional[List[str]] = None  # Column projection, applied by the parser
+    filters: Optional[List[Tuple[str, str, Any]]] = None  # Row predicates: (column, op, value)
     nrows: Optional[int] = None
     low_memory: bool = True
     dtype_overrides: Optional[Dict[str, Any]] = None
@@ -180,17 +205,23 @@ class LoadOptions:
     flatten_json: bool = True
     record_path: Optional[Union[str, List[str]]] = None
     
+    # Geospatial specific
+    layer: Optional[Union[str, int]] = None
+    bbox: Optional[Tuple[float, float, float, float]] = None
+    geometry: bool = True
+    
     # Datetime handling (Manager priority: parse_datetimes)
     date_columns: Optional[List[str]] = None
     detect_time_columns: bool = True
     infer_datetime_format: bool = True
     
     # Error handling
-    on_bad_lines: str = "error"  # "error", "warn", "skip"
+    on_bad_lines: str = "error"  # "error", "warn", "skip", "quarantine" (written to quarantine_path)
     error_tolerance: float = 0.0  # percentage of errors to tolerate
+    quarantine_path: Optional[str] = None  # default: <source>.quarantine.jsonl
     
     # Memory and performance
-    load_strategy: LoadStrategy = LoadStrategy.PERFORMANCE
+    load_strategy: Optional[LoadStrategy] = None  # None: the loader's load_strategy
 
 
 @dataclass
@@ -204,13 +235,18 @@ class MemoryEstimate:
 
 @dataclass
 class DataQualityReport:
-    """Data quality assessment."""
+    """Data quality assessment (from a mergeable QualitySketch, see quality_sketch.py)."""
     missing_data_ratio: float = 0.0
     duplicate_rows: int = 0
-    unique_values_per_column: Dict[str, int] = field(default_factory=dict)
+    unique_values_per_column: Dict[str, int] = field(default_factory=dict)  # HyperLogLog estimates above 4096
     data_types_detected: Dict[str, str] = field(default_factory=dict)
     quality_score: float = 0.0  # 0-100
     recommendations: List[str] = field(default_factory=list)
+    rows_analyzed: int = 0
+    duplicates_exact: bool = True  # False: estimated from a sketch of the row hashes
+    distinct_relative_error: float = 0.0  # ~95% of the estimated distinct counts are within this share
+    # Per column: dtype, nulls, null_ratio, distinct, distinct_exact, min, max
+    column_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
 @dataclass
@@ -227,6 +263,7 @@ class LoadReport:
     csv_params: Optional[CsvParams] = None
     excel_params: Optional[ExcelParams] = None
     json_params: Optional[JsonParams] = None
+    geo_params: Optional[GeoParams] = None
     
     # Data characteristics  
     shape: Optional[Tuple[int, int]] = None
@@ -245,6 +282,9 @@ class LoadReport:
     memory_usage_mb: float = 0.0
     rows_processed: int = 0
     processing_speed_rows_per_sec: float = 0.0
+    # Where load_time_seconds went, per phase (probe, decode, parse, number_parsing,
+    # dtype_optimization, datetime_parsing, quality_analysis): seconds, calls, peak_alloc_mb
+    phase_timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     
     # Issues and notes
     warnings: List[str] = field(default_factory=list)
@@ -275,6 +315,10 @@ class LoadingMemoryError(DataLoaderError):
     """Raised when estimated memory usage exceeds limits."""
 
 
+class BadLinesError(DataLoaderError):
+    """Raised when the share of malformed rows exceeds error_tolerance."""
+
+
 # -----------------------
 # DataLoader (EXACT Manager Requirements - 10 Methods)
 # -----------------------
@@ -310,6 +354,8 @@ class DataLoader:
         default_encoding: str = 'utf-8',
         logger: Optional[logging.Logger] = None,
         load_strategy: LoadStrategy = LoadStrategy.PERFORMANCE,
+        on_phase: Optional[PhaseCallback] = None,
+        track_allocations: bool = False,
     ):
         """
         Initialize essential DataLoader.
@@ -320,12 +366,17 @@ class DataLoader:
             default_encoding: Default text encoding
             logger: Custom logger instance
             load_strategy: Default loading strategy
+            on_phase: Called as on_phase(phase, stats) after each timed load step,
+                e.g. to flag the phase that regressed when a refresh slows down
+            track_allocations: Record peak allocation per phase (tracemalloc, slower)
         """
         self.verbose = verbose
         self.max_memory_usage_gb = max_memory_usage_gb
         self.default_encoding = default_encoding
         self.logger = logger or logging.getLogger(__name__)
         self.load_strategy = load_strategy
+        self.on_phase = on_phase
+        self.track_allocations = track_allocations
         
         # Internal state for reporting
         self._current_report = None
@@ -352,7 +403,7 @@ class DataLoader:
         
         Args:
             source: Local file path or file-like object
-            kind: Format type ('auto', 'csv', 'excel', 'json')
+            kind: Format type ('auto', 'csv', 'excel', 'json', 'geojson', 'gpkg', 'shapefile')
             options: Loading configuration options
             
         Returns:
@@ -436,6 +487,25 @@ class DataLoader:
         """
         raise NotImplementedError
 
+    def load_geospatial(
+        self,
+        source: SourceLike,
+        *,
+        params: Optional[GeoParams] = None,
+    ) -> "pd.DataFrame":
+        """
+        GeoJSON/GeoPackage/Shapefile loader through a vectorized Arrow reader.
+
+
+        Args:
+            source: Geospatial file path (.geojson, .gpkg, .shp)
+            params: Layer, bbox, column projection and geometry=False (attributes only)
+
+        Returns:
+            GeoDataFrame with its spatial index built (DataFrame if geometry=False)
+        """
+        raise NotImplementedError
+
     def parse_datetimes(
         self,
         df: "pd.DataFrame",
@@ -593,7 +663,8 @@ class DataLoader:
             LoadReport with comprehensive loading metrics and analysis
             
         Report Contents:
-            - Loading performance metrics
+            - Loading performance metrics, with per-phase wall time and peak
+              allocation (phase_timings)
             - Data quality assessment
             - Detection results and confidence scores
             - Errors, warnings, and recommendations
@@ -737,7 +808,14 @@ class DataLoader:
     # -----------------------
     
     def _analyze_data_quality(self, df: "pd.DataFrame") -> DataQualityReport:
-        """Internal method for data quality analysis."""
+        """
+        Internal method for data quality analysis.
+        
+        Built chunk by chunk from a QualitySketch (quality_sketch.py) instead
+        of exact nunique()/duplicated(): HyperLogLog distinct counts, row
+        hashes for duplicates, mergeable null/min/max counters, so streamed
+        and parallel loads combine their sketches.
+        """
         raise NotImplementedError
 
     def _detect_file_format(self, source: SourceLike) -> Kind:
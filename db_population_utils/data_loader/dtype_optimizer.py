@@ -0,0 +1,102 @@
+"""
+Load-Time Dtype Optimizer
+=====================================
+
+Plans compact dtypes from a parsed sample so they can be passed straight to
+read_csv(dtype=...), instead of materializing object/int64/float64 columns
+and shrinking them afterwards.
+
+Per column, from cardinality and range in the sample:
+- text with few distinct values  → category
+- integers → Int32 / Int64
+- booleans → boolean
+
+Floats are never planned from a sample: a row beyond it would be rounded
+silently (read_csv does not fail on precision). downcast_floats() turns
+float64 columns into float32 after the full parse, where every row
+survives the round trip exactly.
+"""
+
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Text columns with at most this share of distinct values become categories
+MAX_CATEGORY_RATIO = 0.5
+
+INT32_MIN, INT32_MAX = -2**31, 2**31 - 1
+
+
+def plan_dtypes(
+    sample: 'pd.DataFrame',
+    *,
+    exclude: Optional[List[str]] = None,
+    max_category_ratio: float = MAX_CATEGORY_RATIO,
+) -> Dict[str, str]:
+    """
+    Choose a compact dtype per column of a sample
+
+    Integer plans are nullable so rows beyond the sample may hold gaps;
+    text columns that are empty in the sample are left out of the plan.
+
+    Args:
+        sample: Head of the source parsed with default dtypes
+        exclude: Columns to leave to default parsing (e.g. detected dates)
+        max_category_ratio: Distinct/non-null ratio up to which text becomes category
+    """
+    import pandas as pd
+
+    exclude = set(exclude or [])
+    plan = {}
+
+    for col, series in sample.items():
+        if col in exclude:
+            continue
+
+        dtype = series.dtype
+        values = series.dropna()
+
+        if pd.api.types.is_bool_dtype(dtype):
+            plan[col] = 'boolean'
+        elif pd.api.types.is_integer_dtype(dtype):
+            plan[col] = _int_dtype(values)
+        elif pd.api.types.is_string_dtype(dtype) and not values.empty:  # object, str, string[pyarrow]
+            if values.nunique() <= max_category_ratio * len(values):
+                plan[col] = 'category'
+
+    return plan
+
+
+def safe_plan(plan: Dict[str, str]) -> Dict[str, str]:
+    """The part of a plan that cannot fail on rows beyond the sample"""
+    return {col: dtype for col, dtype in plan.items() if dtype == 'category'}
+
+
+def downcast_floats(df: 'pd.DataFrame') -> List[str]:
+    """
+    Turn float64 columns into float32 in place where no value changes
+
+    Only for fully parsed frames: every row must come back exactly from
+    float32 (NaN included). Returns the converted columns.
+    """
+    converted = []
+    for col in df.columns[(df.dtypes == 'float64').to_numpy()]:
+        values = df[col]
+        as_float32 = values.astype('float32')
+        if (as_float32.astype('float64') == values).sum() == values.notna().sum():
+            df[col] = as_float32
+            converted.append(col)
+    return converted
+
+
+def column_bytes(df: 'pd.DataFrame') -> Dict[str, int]:
+    """Deep memory usage per column in bytes"""
+    usage = df.memory_usage(deep=True, index=False)
+    return {col: int(usage[col]) for col in df.columns}
+
+
+def _int_dtype(values: 'pd.Series') -> str:
+    if values.empty or (values.min() >= INT32_MIN and values.max() <= INT32_MAX):
+        return 'Int32'
+    return 'Int64'
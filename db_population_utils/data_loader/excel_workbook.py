@@ -0,0 +1,94 @@
+"""
+Excel Workbook Inspection
+=====================================
+
+Opens a workbook once to list its sheets and their dimensions, without
+parsing cell data, so the sheet to load can be chosen before pandas reads
+anything:
+
+- .xlsx/.xlsm: openpyxl in read-only mode, shapes from each sheet's stored
+  <dimension> (scanned only when a writer omitted it)
+- .xls: xlrd with on_demand loading, one sheet in memory at a time
+
+Sources are paths or seekable binary streams (workbooks decompressed from
+an archive).
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple, Union
+
+from .data_loader import ExcelParams
+
+# Compound File (legacy .xls) signature
+OLE_MAGIC = b'\xd0\xcf\x11\xe0'
+
+
+def is_legacy_xls(source: Union[str, BinaryIO]) -> bool:
+    """True for BIFF (.xls) workbooks, by signature rather than suffix"""
+    if not isinstance(source, str):
+        magic = source.read(len(OLE_MAGIC))
+        source.seek(0)
+        return magic == OLE_MAGIC
+    with open(source, 'rb') as f:
+        return f.read(len(OLE_MAGIC)) == OLE_MAGIC
+
+
+def inspect_workbook(source: Union[str, BinaryIO]) -> ExcelParams:
+    """
+    Sheet names and (rows, columns) per sheet from a single open
+
+    Returns:
+        ExcelParams with available_sheets, sheet_shapes and recommended_sheet
+    """
+    if isinstance(source, str) and not Path(source).exists():
+        raise FileNotFoundError(f"Excel file not found: {source}")
+
+    legacy = is_legacy_xls(source)
+    shapes = _xls_shapes(source) if legacy else _xlsx_shapes(source)
+    return ExcelParams(
+        engine='xlrd' if legacy else 'openpyxl',
+        available_sheets=list(shapes),
+        sheet_shapes=shapes,
+        recommended_sheet=best_sheet(shapes),
+    )
+
+
+def best_sheet(shapes: Dict[str, Tuple[int, int]]) -> Optional[str]:
+    """Sheet with the most columns; the first one wins ties"""
+    if not shapes:
+        return None
+    return max(shapes, key=lambda name: shapes[name][1])
+
+
+def _xlsx_shapes(source: Union[str, BinaryIO]) -> Dict[str, Tuple[int, int]]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+    try:
+        shapes = {}
+        for sheet in workbook.worksheets:
+            if sheet.max_row is None or sheet.max_column is None:
+                # No stored dimension: scan the sheet once to size it
+                sheet.calculate_dimension(force=True)
+            shapes[sheet.title] = (sheet.max_row or 0, sheet.max_column or 0)
+        return shapes
+    finally:
+        workbook.close()
+
+
+def _xls_shapes(source: Union[str, BinaryIO]) -> Dict[str, Tuple[int, int]]:
+    import xlrd
+
+    if isinstance(source, str):
+        book = xlrd.open_workbook(source, on_demand=True)
+    else:
+        book = xlrd.open_workbook(file_contents=source.read(), on_demand=True)
+    try:
+        shapes = {}
+        for name in book.sheet_names():
+            sheet = book.sheet_by_name(name)
+            shapes[name] = (sheet.nrows, sheet.ncols)
+            book.unload_sheet(name)
+        return shapes
+    finally:
+        book.release_resources()
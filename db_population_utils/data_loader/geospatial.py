@@ -0,0 +1,96 @@
+"""
+Geospatial Layers
+=====================================
+
+GeoJSON, GeoPackage and Shapefile loading through pyogrio's vectorized
+reader (GDAL → Arrow → GeoDataFrame, no per-feature Python objects).
+
+Filters are pushed down into GDAL so unneeded data is never materialized:
+- bbox: only features intersecting (xmin, ymin, xmax, ymax), in the layer CRS
+- columns: only these attribute fields
+- where: only features matching an OGR SQL attribute filter
+- geometry=False: attribute table only, as a plain DataFrame
+
+Needs the optional geopandas and pyogrio packages.
+"""
+
+import importlib.util
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
+
+from .data_loader import GeoParams
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+GEO_FORMATS = ('geojson', 'gpkg', 'shapefile')
+
+INSTALL_HINT = "Geospatial formats need geopandas and pyogrio: pip install geopandas pyogrio"
+
+
+def inspect_layer(source: str, layer: Optional[Union[str, int]] = None) -> GeoParams:
+    """
+    Layer metadata (layers, CRS, geometry type, feature count, bounds) without reading features
+
+    Args:
+        source: Geospatial file path
+        layer: Layer name or index (default: the first layer)
+    """
+    pyogrio = _require_pyogrio()
+
+    layers = [str(name) for name, _ in pyogrio.list_layers(source)]
+    if layer is None and layers:
+        layer = layers[0]  # Named, so GDAL does not warn about picking it in a multi-layer file
+    info = pyogrio.read_info(source, layer=layer)
+    bounds = info.get('total_bounds')
+    return GeoParams(
+        layer=layer,
+        available_layers=layers,
+        crs=info.get('crs'),
+        geometry_type=info.get('geometry_type'),
+        feature_count=info.get('features'),
+        total_bounds=tuple(bounds) if bounds is not None else None,
+    )
+
+
+def read_layer(
+    source: str,
+    *,
+    layer: Optional[Union[str, int]] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+    columns: Optional[List[str]] = None,
+    geometry: bool = True,
+    where: Optional[str] = None,
+) -> 'pd.DataFrame':
+    """
+    Read one layer with bbox/column/attribute-filter pushdown
+
+    where is an OGR SQL WHERE clause, e.g. pushdown.to_ogr_where(filters).
+
+    Returns:
+        GeoDataFrame with its spatial index built, or a DataFrame of the
+        attributes when geometry=False
+    """
+    pyogrio = _require_pyogrio()
+
+    df = pyogrio.read_dataframe(
+        source,
+        layer=layer,
+        bbox=bbox,
+        columns=columns,
+        where=where,
+        read_geometry=geometry,
+        use_arrow=importlib.util.find_spec('pyarrow') is not None,
+    )
+
+    if geometry and len(df):
+        df.sindex  # Build the STRtree now rather than on the first spatial query
+    return df
+
+
+def _require_pyogrio():
+    try:
+        import geopandas  # noqa: F401
+        import pyogrio
+    except ImportError as e:
+        raise ImportError(INSTALL_HINT) from e
+    return pyogrio
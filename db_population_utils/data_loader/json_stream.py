@@ -0,0 +1,226 @@
+"""
+Streaming JSON Arrays
+=====================================
+
+Incremental reader for JSON documents whose records sit in one large array,
+either at the top level or under a top-level key. Overpass API responses
+(and the osmnx cache files) keep every OSM object in "elements":
+
+    {"version": 0.6, "generator": "Overpass API ...", "osm3s": {...},
+     "elements": [{"type": "node", "id": 1, "lat": ..., "lon": ..., "tags": {...}}, ...]}
+
+Records are decoded one at a time from a bounded text buffer, so memory
+stays flat regardless of document size. Overpass elements are flattened into
+one row each: osm_type, osm_id, lat/lon (from "center" for ways and
+relations queried with `out center`), then one column per tag.
+"""
+
+import io
+import json
+import re
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, TextIO, Union
+
+# Characters decoded per read from the underlying stream
+CHUNK_CHARS = 1024 * 1024
+
+# Records per DataFrame when an Overpass document is loaded in batches
+RECORD_BATCH = 50000
+
+OVERPASS_RECORD_KEY = 'elements'
+
+# Columns taken from the element itself rather than from its tags
+ELEMENT_COLUMNS = ('osm_type', 'osm_id', 'lat', 'lon')
+
+_WHITESPACE = re.compile(r'\s*')
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+_OVERPASS_MARKER = re.compile(r'"(?:osm3s|generator)"\s*:')
+_OVERPASS_RECORDS = re.compile(r'"elements"\s*:\s*\[')
+
+
+class _JsonReader:
+    """Buffered tokenizer that decodes one JSON value at a time"""
+
+    def __init__(self, stream: TextIO, chunk_chars: int = CHUNK_CHARS):
+        self._stream = stream
+        self._chunk_chars = chunk_chars
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._consumed = 0  # characters dropped from the front of the buffer
+        self._eof = False
+
+    @property
+    def offset(self) -> int:
+        """Characters read and consumed so far"""
+        return self._consumed + self._pos
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        data = self._stream.read(self._chunk_chars)
+        if not data:
+            self._eof = True
+            return False
+        self._consumed += self._pos
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, '' at the end of the document"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def take(self, expected: str) -> None:
+        found = self.peek()
+        if found != expected:
+            raise ValueError(f"Expected '{expected}' at character {self.offset}, found {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value, reading more input as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number cut by the buffer end (e.g. '0.' of '0.6') continues in the next read
+                if self._eof or (end < len(self._buffer) and self._buffer[end] not in _NUMBER_CHARS):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+
+def iter_records(stream: TextIO, record_key: Optional[str] = None,
+                 chunk_chars: int = CHUNK_CHARS) -> Iterator[Any]:
+    """
+    Yield the items of a JSON array one at a time
+
+    Args:
+        stream: Text stream positioned at the start of the document
+        record_key: Top-level key holding the array (None: the document is the array)
+        chunk_chars: Characters read from the stream at a time
+    """
+    reader = _JsonReader(stream, chunk_chars)
+    yield from _iter_reader(reader, record_key)
+
+
+def _iter_reader(reader: _JsonReader, record_key: Optional[str]) -> Iterator[Any]:
+    if record_key is None:
+        yield from _iter_array(reader)
+        return
+
+    reader.take('{')
+    while reader.peek() not in ('}', ''):
+        key = reader.value()
+        reader.take(':')
+        if key == record_key:
+            yield from _iter_array(reader)
+        else:
+            reader.value()  # metadata such as version/osm3s, small
+        if reader.peek() == ',':
+            reader.take(',')
+
+
+def _iter_array(reader: _JsonReader) -> Iterator[Any]:
+    reader.take('[')
+    if reader.peek() == ']':
+        reader.take(']')
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() != ',':
+            reader.take(']')
+            return
+        reader.take(',')
+
+
+def is_overpass(head_text: str) -> bool:
+    """True if a document head looks like an Overpass API response"""
+    return (head_text.lstrip().startswith('{')
+            and bool(_OVERPASS_MARKER.search(head_text))
+            and bool(_OVERPASS_RECORDS.search(head_text)))
+
+
+def estimate_records(head: bytes, size_bytes: Optional[int], encoding: str,
+                     record_key: Optional[str] = None) -> Optional[int]:
+    """
+    Estimate the number of records from the complete ones in the head sample
+
+    Exact when the head holds the whole document; otherwise the byte span of
+    the decoded records is extrapolated to the rest of the file (None when
+    the document size is unknown, e.g. for a bz2 stream).
+    """
+    text = head.decode(encoding, errors='ignore')
+    reader = _JsonReader(io.StringIO(text), chunk_chars=len(text) + 1)
+    count, first, last = 0, None, None
+    try:
+        for _ in _iter_reader(reader, record_key):
+            count += 1
+            if first is None:
+                first = reader.offset
+            last = reader.offset
+    except ValueError:
+        pass  # the head ends inside a record
+
+    if size_bytes is not None and len(head) >= size_bytes:
+        return count
+    if size_bytes is None or count < 2 or last <= first:
+        return None
+
+    bytes_per_char = len(head) / max(len(text), 1)
+    bytes_per_record = (last - first) / (count - 1) * bytes_per_char
+    start_bytes = first * bytes_per_char - bytes_per_record
+    return int(round((size_bytes - start_bytes) / bytes_per_record))
+
+
+def flatten_element(element: Dict[str, Any], tags: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    One flat row per Overpass element
+
+    Coordinates come from lat/lon on nodes and from "center" on ways and
+    relations. With a tags whitelist only those tags become columns (missing
+    ones as None), otherwise every tag does.
+    """
+    center = element.get('center') or {}
+    # Element fields come first; a tag with the same name never overrides them
+    record = {
+        'osm_type': element.get('type'),
+        'osm_id': element.get('id'),
+        'lat': element.get('lat', center.get('lat')),
+        'lon': element.get('lon', center.get('lon')),
+    }
+
+    element_tags = element.get('tags') or {}
+    if tags is None:
+        for key, value in element_tags.items():
+            record.setdefault(key, value)
+    else:
+        for key in tags:
+            record.setdefault(key, element_tags.get(key))
+    return record
+
+
+def iter_overpass_batches(source: Union[str, BinaryIO], encoding: str = 'utf-8', *,
+                          batch_size: int = RECORD_BATCH,
+                          tags: Optional[List[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+    """Stream an Overpass document (a path or a binary stream) as lists of flattened element rows"""
+    batch = []
+    if isinstance(source, str):
+        text = open(source, 'r', encoding=encoding, newline='')
+    else:
+        text = io.TextIOWrapper(source, encoding=encoding, newline='')
+    with text as f:
+        for element in iter_records(f, OVERPASS_RECORD_KEY):
+            batch.append(flatten_element(element, tags))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
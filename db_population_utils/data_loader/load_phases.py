@@ -0,0 +1,210 @@
+"""
+Load Phase Timing
+=====================================
+
+Where the time of a load goes. SmartAutoDataLoader records each step of a
+load under one of the PHASES below: wall time always, peak Python-visible
+allocation (tracemalloc, which sees NumPy buffers but not Arrow's memory
+pool) when asked to, since tracing allocations slows pandas down
+noticeably. Totals per phase end up in LoadReport.phase_timings, and an
+optional callback is told about every timed step as it finishes, so a
+scheduler can flag the phase that regressed when a refresh slows down.
+
+Phases nest (a date column parsed while planning dtypes, decompression
+while parsing): every phase is charged only the time not spent in the
+phases inside it, so the totals add up to the instrumented wall time.
+
+decode is the time spent decompressing gzip/bz2/xz/zstd files and zip
+members (measured in the stream's read calls). Plain files are decoded by
+the parser itself, so for them it is part of parse.
+"""
+
+import io
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
+
+# In the order a load runs through them
+PHASES = ('probe', 'decode', 'parse', 'number_parsing', 'dtype_optimization',
+          'datetime_parsing', 'quality_analysis')
+
+# on_phase(phase, {'phase', 'seconds', 'peak_alloc_mb', 'source'})
+PhaseCallback = Callable[[str, Dict[str, Any]], None]
+
+T = TypeVar('T')
+
+
+@dataclass
+class _Frame:
+    """An open phase: its start, traced memory at entry and time charged to inner phases"""
+    name: str
+    start: float
+    base_bytes: int = 0
+    peak_bytes: int = 0
+    inner_seconds: float = 0.0
+
+
+class PhaseRecorder:
+    """
+    Per-phase wall time and peak allocation of one load
+
+    Args:
+        callback: Called with (phase, stats) after every timed step; an
+            exception it raises is turned into a warning, the load goes on
+        track_allocations: Trace allocations with tracemalloc (started here
+            if it is not running, stopped again by close())
+        source: Passed on to the callback in stats['source']
+    """
+
+    def __init__(self, callback: Optional[PhaseCallback] = None, track_allocations: bool = False,
+                 source: Optional[str] = None):
+        self.callback = callback
+        self.track_allocations = track_allocations
+        self.source = source
+        self._totals: Dict[str, Dict[str, Any]] = {}
+        self._stack: List[_Frame] = []
+        self._started_tracing = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the block under phase name"""
+        frame = _Frame(name, 0.0)
+        if self._tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].peak_bytes = max(self._stack[-1].peak_bytes, peak)
+            tracemalloc.reset_peak()
+            frame.base_bytes = frame.peak_bytes = current
+        self._stack.append(frame)
+        frame.start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame.start
+            self._stack.pop()
+            peak_mb = None
+            if self.track_allocations and tracemalloc.is_tracing():
+                peak = max(tracemalloc.get_traced_memory()[1], frame.peak_bytes)
+                peak_mb = (peak - frame.base_bytes) / (1024 * 1024)
+                if self._stack:
+                    self._stack[-1].peak_bytes = max(self._stack[-1].peak_bytes, peak)
+            self._charge(elapsed)
+            self._record(name, elapsed - frame.inner_seconds, peak_mb)
+
+    @contextmanager
+    def decoding(self, opened: ContextManager[Union[str, BinaryIO]]) -> Iterator[Union[str, BinaryIO]]:
+        """
+        Enter a source context (see compressed_source.open_source), timing
+        its opening and every read of the stream it yields as decode
+        """
+        start = time.perf_counter()
+        with opened as src:
+            seconds = time.perf_counter() - start
+            self._charge(seconds)
+            if isinstance(src, (str, io.BytesIO)):
+                stream = None  # A path, or data decompressed on entry
+            else:
+                src = stream = _TimedReader(src, self)
+            try:
+                yield src
+            finally:
+                self._record('decode', seconds + (stream.seconds if stream is not None else 0.0), None)
+
+    def iterate(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Yield from items, timing the production of each one under phase name"""
+        iterator = iter(items)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def timings(self) -> Dict[str, Dict[str, Any]]:
+        """Per phase that ran: seconds, calls, peak_alloc_mb (None without allocation tracking)"""
+        order = {name: i for i, name in enumerate(PHASES)}
+        return {name: dict(stats)
+                for name, stats in sorted(self._totals.items(), key=lambda item: order.get(item[0], len(order)))}
+
+    def close(self) -> None:
+        """Stop tracemalloc if this recorder started it"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _tracing(self) -> bool:
+        if not self.track_allocations:
+            return False
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return True
+
+    def _charge(self, seconds: float) -> None:
+        """Deduct time spent in an inner phase from the enclosing one"""
+        if self._stack:
+            self._stack[-1].inner_seconds += seconds
+
+    def _record(self, name: str, seconds: float, peak_mb: Optional[float]) -> None:
+        totals = self._totals.setdefault(name, {'seconds': 0.0, 'calls': 0, 'peak_alloc_mb': None})
+        totals['seconds'] += seconds
+        totals['calls'] += 1
+        if peak_mb is not None:
+            totals['peak_alloc_mb'] = max(totals['peak_alloc_mb'] or 0.0, peak_mb)
+
+        if self.callback is not None:
+            try:
+                self.callback(name, {'phase': name, 'seconds': seconds, 'peak_alloc_mb': peak_mb,
+                                     'source': self.source})
+            except Exception as e:
+                warnings.warn(f"on_phase callback failed for phase '{name}': {e}", RuntimeWarning)
+
+
+class _TimedReader(io.BufferedIOBase):
+    """Binary stream wrapper adding the time spent in read calls to the decode phase"""
+
+    def __init__(self, raw: BinaryIO, recorder: PhaseRecorder):
+        super().__init__()
+        self.raw = raw
+        self.recorder = recorder
+        self.seconds = 0.0
+
+    def _timed(self, method: Callable[..., Any], *args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.seconds += elapsed
+            self.recorder._charge(elapsed)
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._timed(self.raw.read, size)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self._timed(getattr(self.raw, 'read1', self.raw.read), size)
+
+    def readinto(self, buffer: Any) -> int:
+        return self._timed(self.raw.readinto, buffer)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        return self._timed(self.raw.readline, size)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self.raw.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self.raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.raw.tell()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
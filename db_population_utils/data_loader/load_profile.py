@@ -0,0 +1,84 @@
+"""
+Load Profiles
+=====================================
+
+Sidecar profiles that remember how a file family was loaded last time:
+encoding, delimiter, number separators, dtypes, date columns/formats and
+the selected Excel sheet. Repeat loads reuse the profile and skip detection entirely.
+
+A file family groups files whose names differ only in digits, e.g.
+gyms_osm_berlin_2025-09-24.csv and gyms_osm_berlin_2025-10-01.csv share
+the sidecar .gyms_osm_berlin_N-N-N.csv.loadprofile.json in their directory.
+Each load strategy keeps its own sidecar (.….csv.performance.loadprofile.json),
+since the stored dtypes are the ones that strategy's reader produced
+(Arrow dtypes, compact categories; float32 is checked again on every load).
+"""
+
+import csv
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .compressed_source import split_member
+
+PROFILE_VERSION = 2
+PROFILE_SUFFIX = '.loadprofile.json'
+
+
+@dataclass
+class LoadProfile:
+    """Everything needed to repeat a successful load without detection"""
+    family: str
+    detected_format: str  # 'csv' or 'excel'
+    header: List[str]     # Raw header fields, used for drift detection
+    dtypes: Dict[str, str]
+    date_formats: Dict[str, str] = field(default_factory=dict)
+    encoding: Optional[str] = None
+    delimiter: Optional[str] = None
+    quote_char: Optional[str] = None
+    sheet_name: Optional[str] = None
+    # number_parsing.NumberFormat as a dict; its convert columns are read as text
+    number_format: Dict[str, Any] = field(default_factory=dict)
+    load_strategy: Optional[str] = None  # LoadStrategy value the dtypes came from (None: default)
+    version: int = PROFILE_VERSION
+
+
+def family_name(source: str) -> str:
+    """File family key: the file name with every digit run collapsed to N"""
+    path, member = split_member(source)
+    name = Path(path).name if member is None else f"{Path(path).name}.{Path(member).name}"
+    return re.sub(r'\d+', 'N', name)
+
+
+def profile_path(source: str, load_strategy: Optional[str] = None) -> Path:
+    """Sidecar location for the family of a source file (next to the archive for zip members)"""
+    path = Path(split_member(source)[0])
+    strategy = f".{load_strategy}" if load_strategy else ''
+    return path.parent / f".{family_name(source)}{strategy}{PROFILE_SUFFIX}"
+
+
+def read_profile(source: str, load_strategy: Optional[str] = None) -> Optional[LoadProfile]:
+    """Return the stored profile for a source's family and load strategy, or None if absent/unreadable"""
+    sidecar = profile_path(source, load_strategy)
+    try:
+        data = json.loads(sidecar.read_text(encoding='utf-8'))
+        if data.get('version') != PROFILE_VERSION or data.get('load_strategy') != load_strategy:
+            return None
+        return LoadProfile(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def write_profile(source: str, profile: LoadProfile) -> Path:
+    """Write a profile next to the source file; raises OSError if not writable"""
+    sidecar = profile_path(source, profile.load_strategy)
+    sidecar.write_text(json.dumps(asdict(profile), indent=2, ensure_ascii=False), encoding='utf-8')
+    return sidecar
+
+
+def parse_header_line(line: str, delimiter: str, quote_char: str) -> List[str]:
+    """Split a raw CSV header line into its fields"""
+    line = line.rstrip('\r')
+    return next(csv.reader([line], delimiter=delimiter, quotechar=quote_char), [])
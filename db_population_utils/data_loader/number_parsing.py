@@ -0,0 +1,244 @@
+"""
+Localized Number Parsing
+=====================================
+
+Berlin sources write numbers the German way ("1.234,56", "12,5 %",
+"3 500 €", "1.200,-") next to English exports ("4,169" cases in the IBB
+tables). Two pieces:
+
+- sniff_number_format: decides decimal/thousands separators per column from
+  a head sample read as text, and which of them pd.read_csv can apply
+  natively without corrupting other columns (a thousands='.' would turn the
+  date "24.09.2025" into 24092025)
+- is_number_text: which values are numbers with units/currency around them,
+  so whole text columns can be picked for conversion
+- to_numeric_localized: vectorized conversion of whole text columns - units,
+  currency and spaces stripped, trailing minus, parentheses and Unicode
+  minus read as negatives - with each distinct value parsed once when the
+  cardinality is low, like to_datetime_memoized
+
+Used by SmartAutoDataLoader.load_csv and DataProcessor.parse_numbers.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .datetime_parsing import CARDINALITY_SAMPLE, MAX_UNIQUE_RATIO
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# (decimal, thousands) conventions told apart by the sniffer
+NUMBER_STYLES = (('.', ','), (',', '.'))
+
+# Area/volume units whose digit would otherwise join the number ('50 m2')
+_AREA_UNITS = r'(?i)[kcd]?m[23]\b'
+_MINUS_SIGNS = ('\u2212', '\u2013')  # minus sign, en dash
+_VALID = r'[0-9]+\.?[0-9]*|\.[0-9]+'
+_NUMBER_LIKE = r'[-+]?[\d.,]+'
+
+# Units and currencies is_number_text accepts around a number
+_UNIT_WORDS = r'(?i)€|\$|%|‰|/|\b(?:eur|euro|usd|qm)\b|[kcd]?m[²³23]\b'
+_SIGNED_NUMBER = r'[(+\-−–]?[\d.,]*\d[\d.,]*(?:,-+)?[)\-−–]?'
+
+# Stand-ins for a missing number in German statistics exports; they keep
+# read_csv from parsing the column, so such columns are converted instead
+PLACEHOLDERS = ('-', '\u2013', '\u2014', '.', 'x', 'k.A.', 'k. A.', '\u2026')
+
+
+@dataclass
+class NumberFormat:
+    """Separators for one CSV, as sniffed from its head"""
+    decimal: str = '.'
+    thousands: Optional[str] = None  # Passed to read_csv only when no other column contains it
+    grouped: List[str] = field(default_factory=list)  # Columns parsed natively with thousands
+    # Columns read as text and converted after parsing: {column: [decimal, thousands]}
+    convert: Dict[str, List[Optional[str]]] = field(default_factory=dict)
+    # Every number column of the head; one read_csv still leaves as text
+    # (e.g. a "-" further down) is converted with its style as well
+    styles: Dict[str, List[Optional[str]]] = field(default_factory=dict)
+
+    def read_kwargs(self) -> Dict[str, Any]:
+        """decimal/thousands keywords for pd.read_csv (empty for the pandas defaults)"""
+        kwargs = {}
+        if self.decimal != '.':
+            kwargs['decimal'] = self.decimal
+        if self.thousands is not None:
+            kwargs['thousands'] = self.thousands
+        return kwargs
+
+    def without_thousands(self) -> 'NumberFormat':
+        """The same format for readers without a thousands option (the Arrow engine)"""
+        convert = dict(self.convert)
+        for col in self.grouped:
+            convert[col] = [self.decimal, self.thousands]
+        return NumberFormat(self.decimal, None, [], convert, dict(self.styles))
+
+
+def sniff_number_format(head: 'pd.DataFrame', delimiter: str = ',') -> NumberFormat:
+    """
+    Decimal and thousands separators from a head sample read with dtype=str
+
+    Columns whose values are all numbers with '.'/',' are classified: a
+    decimal part that is not three digits, or both separators in one value,
+    settles the style; values like "4,169" (one group of three) fit both and
+    are read as thousands grouping. The file decimal follows the majority of
+    the settled columns, or the delimiter when nothing settles it (';' files
+    are German exports). The thousands separator is applied natively only if
+    no other number-like column contains it; otherwise, and for columns in
+    the other style or with PLACEHOLDERS ("-" for no value), the columns are
+    listed in convert.
+    """
+    settled, ambiguous, number_like, padded = {}, {}, {}, set()
+    for col in head.columns:
+        values = head[col].dropna().astype(str).str.strip()
+        values = values[values != '']
+        placeholder = values.isin(PLACEHOLDERS)
+        values = values[~placeholder]
+        if values.empty or not values.str.fullmatch(_NUMBER_LIKE).all():
+            continue
+        number_like[col] = values
+        if placeholder.any():
+            padded.add(col)
+        if not values.str.contains('[.,]').any():
+            continue
+        fits = [style for style in NUMBER_STYLES if values.str.fullmatch(_style_pattern(*style)).all()]
+        if len(fits) == 2:
+            ambiguous[col] = '.' if values.str.contains('.', regex=False).any() else ','
+        elif fits:
+            settled[col] = fits[0]
+
+    votes = [decimal for decimal, _ in settled.values()]
+    if votes and votes.count(',') != votes.count('.'):
+        decimal = max(('.', ','), key=votes.count)
+    else:
+        decimal = ',' if delimiter == ';' else '.'
+    thousands = ',' if decimal == '.' else '.'
+
+    styles = dict(settled)
+    for col, separator in ambiguous.items():
+        styles[col] = (decimal, thousands) if separator == thousands else (decimal, None)
+
+    for col in padded.difference(styles):
+        styles[col] = (decimal, None)  # Whole numbers
+
+    grouped = [col for col, (col_decimal, _) in styles.items()
+               if col_decimal == decimal and col not in padded
+               and number_like[col].str.contains(thousands, regex=False).any()]
+    convert = {col: list(style) for col, style in styles.items() if style[0] != decimal or col in padded}
+
+    # Any other number-like column holding the separator would be misread
+    # (padded columns stay text for read_csv either way)
+    native = bool(grouped) and not any(values.str.contains(thousands, regex=False).any()
+                                       for col, values in number_like.items()
+                                       if col not in grouped and col not in padded)
+    if not native:
+        convert.update({col: [decimal, thousands] for col in grouped})
+        grouped = []
+
+    return NumberFormat(decimal, thousands if native else None, grouped, convert,
+                        {col: list(style) for col, style in styles.items()})
+
+
+def is_number_text(series: 'pd.Series') -> 'pd.Series':
+    """
+    Boolean mask of the values that are a number once units, currency and
+    whitespace are dropped ("1.234,56 €", "12,5 %", "(3 500)"), with
+    PLACEHOLDERS counted as numbers; missing values are False
+    """
+    text = series.astype('string')
+    stripped = text.str.replace(_UNIT_WORDS, '', regex=True).str.replace(r'\s+', '', regex=True)
+    mask = stripped.str.fullmatch(_SIGNED_NUMBER) | text.str.strip().isin(PLACEHOLDERS)
+    return mask.fillna(False).astype(bool)
+
+
+def to_numeric_localized(
+    series: 'pd.Series',
+    decimal: str = ',',
+    thousands: Optional[str] = '.',
+    *,
+    max_unique_ratio: float = MAX_UNIQUE_RATIO,
+) -> Tuple['pd.Series', Dict[str, Any]]:
+    """
+    Float column from localized number text ("1.234,56 €", "(12,5 %)", "3 500-")
+
+    Units, currency symbols and whitespace are dropped, "1.200,-" reads as
+    1200, and a leading or trailing minus (also U+2212/U+2013) or enclosing
+    parentheses make a value negative. Values without digits become NaN.
+    Each step is one pandas string operation over the whole column (Arrow
+    compute kernels when pyarrow is installed), mostly plain substring
+    replacements; with low cardinality only the distinct values are converted.
+
+    Returns:
+        Tuple of (float64 series, stats) where stats holds rows,
+        unique_parsed, memoized, unparsed (non-null values that became NaN)
+        and seconds
+    """
+    import numpy as np
+    import pandas as pd
+
+    start = time.perf_counter()
+    rows = len(series)
+
+    head = series.iloc[:CARDINALITY_SAMPLE]
+    memoized = rows > 0 and head.nunique(dropna=True) <= max_unique_ratio * len(head)
+    if memoized:
+        codes, uniques = pd.factorize(series)
+        memoized = 0 < len(uniques) <= max_unique_ratio * rows
+
+    if memoized:
+        parsed = _parse_text(pd.Series(uniques, dtype=object), decimal, thousands)
+        values = np.where(codes >= 0, parsed[codes], np.nan)
+        parsed_count = len(uniques)
+    else:
+        values = _parse_text(series, decimal, thousands)
+        parsed_count = rows
+
+    result = pd.Series(values, index=series.index, name=series.name, dtype='float64')
+    stats = {
+        'rows': rows,
+        'unique_parsed': parsed_count,
+        'memoized': bool(memoized),
+        'unparsed': int((result.isna() & series.notna()).sum()),
+        'seconds': time.perf_counter() - start,
+    }
+    return result, stats
+
+
+def _style_pattern(decimal: str, thousands: str) -> str:
+    d, t = re.escape(decimal), re.escape(thousands)
+    return rf'[-+]?(?:\d{{1,3}}(?:{t}\d{{3}})+|\d+)(?:{d}\d+)?'
+
+
+def _parse_text(series: 'pd.Series', decimal: str, thousands: Optional[str]) -> 'np.ndarray':
+    """Vectorized core of to_numeric_localized, returning float64 values"""
+    import numpy as np
+
+    try:
+        import pyarrow  # noqa: F401
+        text, float_dtype = series.astype('string[pyarrow]'), 'float64[pyarrow]'
+    except ImportError:
+        text, float_dtype = series.astype('string'), 'Float64'
+
+    if text.str.contains(_AREA_UNITS, regex=True).any():
+        text = text.str.replace(_AREA_UNITS, '', regex=True)
+    for sign in _MINUS_SIGNS:
+        text = text.str.replace(sign, '-', regex=False)
+    # Currency, units, '%' and any whitespace (NBSP, thin spaces) go in one pass
+    text = text.str.replace(r'[^0-9.,()+\-]+', '', regex=True)
+    if text.str.contains(decimal + '-', regex=False).any():
+        text = text.str.replace(re.escape(decimal) + '-+$', '', regex=True)  # "1.200,-": no cents
+
+    negative = text.str.startswith(('-', '(')) | text.str.endswith(('-', ')'))
+    for char in '()+-' + (thousands if thousands in ('.', ',') else ''):
+        text = text.str.replace(char, '', regex=False)
+    if decimal != '.':
+        text = text.str.replace(decimal, '.', regex=False)
+
+    valid = text.str.fullmatch(_VALID).fillna(False).astype(bool)
+    values = text.where(valid).astype(float_dtype).to_numpy(dtype='float64', na_value=np.nan, copy=True)
+    values[negative.fillna(False).to_numpy(dtype=bool)] *= -1
+    return values
@@ -0,0 +1,167 @@
+"""
+Column Projection and Row Predicates
+=====================================
+
+Filters are simple (column, operator, value) triples, as in
+pd.read_parquet(filters=...):
+
+    [('city', '==', 'Berlin'), ('lat', 'between', (52.45, 52.55))]
+
+Operators: ==, !=, <, <=, >, >=, in, not in, between (inclusive).
+
+The loaders read only the requested columns plus the ones the filters need,
+evaluate the filters vectorized on each parsed chunk, and drop the
+filter-only columns again, so skipped columns and rows are never
+accumulated. Filters see the values as parsed by the reader (detected date
+columns are still text at that point), except number columns the reader
+left as text (localized formats, a "-" for no value), which the CSV loader
+converts chunk by chunk before filtering.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+Filter = Tuple[str, str, Any]
+
+# Rows parsed with all columns to estimate what the pushdown saved
+PUSHDOWN_SAMPLE_ROWS = 1000
+
+# Rows per parser chunk when filters are evaluated during parsing
+PUSHDOWN_CHUNKSIZE = 100000
+
+OPERATORS = ('==', '!=', '<', '<=', '>', '>=', 'in', 'not in', 'between')
+
+# (x, y) column pairs a bbox is matched against in tabular sources, in order of preference
+COORDINATE_COLUMNS = (('lon', 'lat'), ('lng', 'lat'), ('longitude', 'latitude'), ('x', 'y'))
+
+_OGR_OPERATORS = {'==': '=', '!=': '<>', '<': '<', '<=': '<=', '>': '>', '>=': '>='}
+
+
+def validate_filters(filters: Optional[Sequence[Filter]]) -> List[Filter]:
+    """Normalize filters to a list of triples; raises ValueError on unknown operators"""
+    normalized = []
+    for item in filters or []:
+        if len(item) != 3:
+            raise ValueError(f"Filter must be (column, operator, value), got {item!r}")
+        column, op, value = item
+        if op not in OPERATORS:
+            raise ValueError(f"Unsupported filter operator {op!r}, expected one of {OPERATORS}")
+        if op == 'between' and len(value) != 2:
+            raise ValueError(f"'between' needs (low, high), got {value!r}")
+        normalized.append((column, op, value))
+    return normalized
+
+
+def bbox_filters(bbox: Tuple[float, float, float, float],
+                 x: str = 'lon', y: str = 'lat') -> List[Filter]:
+    """Filters keeping rows whose x/y columns fall inside (xmin, ymin, xmax, ymax)"""
+    xmin, ymin, xmax, ymax = bbox
+    return [(x, 'between', (xmin, xmax)), (y, 'between', (ymin, ymax))]
+
+
+def coordinate_columns(header: Sequence[str]) -> Tuple[str, str]:
+    """(x, y) columns of a header for bbox_filters, matched case-insensitively (default lon/lat)"""
+    names = {str(name).lower(): name for name in header}
+    for x, y in COORDINATE_COLUMNS:
+        if x in names and y in names:
+            return names[x], names[y]
+    return 'lon', 'lat'
+
+
+def read_columns(columns: Optional[Sequence[str]], filters: List[Filter]) -> Optional[List[str]]:
+    """Columns to parse: the requested ones plus those only the filters need (None: all)"""
+    if columns is None:
+        return None
+    needed = list(columns)
+    for column, _, _ in filters:
+        if column not in needed:
+            needed.append(column)
+    return needed
+
+
+def row_mask(df: 'pd.DataFrame', filters: List[Filter]) -> 'np.ndarray':
+    """Boolean mask of the rows matching all filters (missing values never match)"""
+    import numpy as np
+
+    mask = np.ones(len(df), dtype=bool)
+    for column, op, value in filters:
+        series = df[column]
+        if op == 'in':
+            matched = series.isin(list(value))
+        elif op == 'not in':
+            matched = ~series.isin(list(value)) & series.notna()
+        elif op == 'between':
+            matched = series.between(value[0], value[1])
+        elif op == '==':
+            matched = series == value
+        elif op == '!=':
+            matched = (series != value) & series.notna()
+        elif op == '<':
+            matched = series < value
+        elif op == '<=':
+            matched = series <= value
+        elif op == '>':
+            matched = series > value
+        else:
+            matched = series >= value
+        mask &= matched.fillna(False).to_numpy(dtype=bool)
+    return mask
+
+
+def apply_pushdown(df: 'pd.DataFrame', columns: Optional[Sequence[str]],
+                   filters: List[Filter]) -> 'pd.DataFrame':
+    """Keep the matching rows and the requested columns of a parsed chunk"""
+    if filters:
+        mask = row_mask(df, filters)
+        if not mask.all():
+            df = df[mask]
+    if columns is not None and list(df.columns) != list(columns):
+        df = df[[col for col in columns if col in df.columns]]
+    return df
+
+
+def to_ogr_where(filters: List[Filter]) -> Optional[str]:
+    """OGR SQL WHERE clause equivalent to the filters (for GDAL-side evaluation)"""
+    if not filters:
+        return None
+
+    clauses = []
+    for column, op, value in filters:
+        field = '"' + column.replace('"', '""') + '"'
+        if op == 'between':
+            clauses.append(f"{field} BETWEEN {_ogr_literal(value[0])} AND {_ogr_literal(value[1])}")
+        elif op in ('in', 'not in'):
+            values = ', '.join(_ogr_literal(v) for v in value)
+            clauses.append(f"{field} {op.upper()} ({values})")
+        else:
+            clauses.append(f"{field} {_OGR_OPERATORS[op]} {_ogr_literal(value)}")
+    return ' AND '.join(clauses)
+
+
+def _ogr_literal(value: Any) -> str:
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(value)
+
+
+def pushdown_stats(full_bytes_per_row: float, columns_total: int, columns_read: int,
+                   rows_scanned: int, rows_kept: int, bytes_loaded: int) -> Dict[str, Any]:
+    """
+    What projection and filtering saved
+
+    bytes_full_estimate is the size the unfiltered, unprojected frame would
+    have had (deep bytes per row of an all-column sample × rows scanned).
+    """
+    full_bytes = int(full_bytes_per_row * rows_scanned)
+    return {
+        'columns_total': columns_total,
+        'columns_read': columns_read,
+        'rows_scanned': rows_scanned,
+        'rows_kept': rows_kept,
+        'bytes_full_estimate': full_bytes,
+        'bytes_loaded': bytes_loaded,
+        'bytes_saved': max(0, full_bytes - bytes_loaded),
+    }
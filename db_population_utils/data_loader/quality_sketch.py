@@ -0,0 +1,404 @@
+"""
+Sketch-Based Quality Analysis
+=====================================
+
+Quality metrics for frames too large for exact nunique()/duplicated() on
+every column, computed chunk by chunk in bounded memory. Each value is
+hashed once with pd.util.hash_pandas_object, whose fixed key makes hashes
+comparable across chunks and processes:
+
+- Distinct values per column: exact while a column has at most
+  EXACT_DISTINCT distinct values, then estimated by a HyperLogLog sketch of
+  2**precision one-byte registers. Its relative standard error is
+  1.04 / sqrt(2**precision) (1.6% at the default precision 12);
+  distinct_relative_error reports two standard errors, which about 95% of
+  the estimates stay within.
+- Duplicate rows: one 64-bit hash per row (the column hashes combined),
+  counted exactly up to max_exact_rows rows (8 bytes each), beyond that
+  estimated from a HyperLogLog of the row hashes (the error bound then
+  applies to the number of distinct rows). Exact counts can only be off by
+  a 64-bit hash collision, about n**2 / 2**65 (3e-8 for a million rows).
+- Nulls per column, min and max of number, date and boolean columns:
+  plain counters.
+
+Sketches of chunks, byte ranges or files with the same columns and dtypes
+merge, so streamed loads and load_many() workers build one each and
+combine them; quality_score is computed from the merged sketch.
+
+Used by SmartAutoDataLoader.build_report and load_many(quality=True).
+"""
+
+import math
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from .data_loader import DataQualityReport
+from .datetime_parsing import CARDINALITY_SAMPLE, MAX_UNIQUE_RATIO
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Registers 2**precision; 12 gives 4 KB per column and 1.6% standard error
+DEFAULT_PRECISION = 12
+
+# Distinct values per column kept as exact hashes before switching to the sketch
+EXACT_DISTINCT = 4096
+
+# Row hashes kept for an exact duplicate count (8 bytes each)
+MAX_EXACT_ROWS = 5_000_000
+
+# Rows hashed at a time by sketch_frame(), bounding the temporary hash arrays
+SKETCH_CHUNK_ROWS = 250_000
+
+# Share of missing values from which a column is flagged
+SPARSE_COLUMN_RATIO = 0.5
+
+_FNV_PRIME = 0x100000001b3
+_NULL_HASH = 0xFFFFFFFFFFFFFFFF  # Every kind of missing value hashes alike
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count sketch over 64-bit hashes
+
+    The first precision bits of a hash pick a register, which keeps the
+    longest run of leading zeros (plus one) seen in the next 32 bits.
+    Small cardinalities are corrected by linear counting.
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        import numpy as np
+
+        if not 4 <= precision <= 16:
+            raise ValueError(f"precision must be between 4 and 16, got {precision}")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of estimate()"""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add_hashes(self, hashes: 'np.ndarray') -> None:
+        """Add uint64 hashes (duplicates are fine)"""
+        import numpy as np
+
+        if not len(hashes):
+            return
+        index = hashes >> np.uint64(64 - self.precision)
+        rest = (hashes >> np.uint64(32 - self.precision)) & np.uint64(0xFFFFFFFF)
+        # frexp's exponent is the bit length, exact for 32-bit values in float64
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (33 - bit_length).astype(np.uint8)
+        np.maximum.at(self.registers, index.astype(np.intp), rank)
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """Fold in a sketch of the same precision"""
+        import numpy as np
+
+        if other.precision != self.precision:
+            raise ValueError("Only sketches of the same precision can be merged")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        """Estimated number of distinct hashes added"""
+        import numpy as np
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.ldexp(1.0, -self.registers.astype(np.int64)).sum())
+        zeros = int((self.registers == 0).sum())
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return raw
+
+
+class ColumnSketch:
+    """Nulls, min/max and distinct values of one column"""
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        import numpy as np
+
+        self.rows = 0
+        self.nulls = 0
+        self.minimum: Any = None
+        self.maximum: Any = None
+        self.orderable: Optional[bool] = None  # Whether min/max are tracked, decided on the first chunk
+        self.categorize: Optional[bool] = None  # Hash text via its distinct values (low cardinality)
+        self.hll = HyperLogLog(precision)
+        self.exact: Optional['np.ndarray'] = np.empty(0, dtype=np.uint64)  # None past EXACT_DISTINCT
+
+    @property
+    def distinct(self) -> int:
+        """Distinct non-null values, exact while few"""
+        if self.exact is not None:
+            return len(self.exact)
+        return int(round(self.hll.estimate()))
+
+    def update(self, series: 'pd.Series', hashes: 'np.ndarray', nulls: 'np.ndarray') -> None:
+        """Add a chunk of the column with its value hashes and null mask"""
+        import pandas as pd
+
+        self.rows += len(series)
+        null_count = int(nulls.sum())
+        self.nulls += null_count
+        values = hashes[~nulls] if null_count else hashes
+        self.hll.add_hashes(values)
+        if self.exact is not None:
+            self.exact = pd.unique(_concat([self.exact, pd.unique(values)]))
+            if len(self.exact) > EXACT_DISTINCT:
+                self.exact = None
+        if self.orderable is None:
+            self.orderable = _is_orderable(series.dtype)
+        elif self.orderable and not _is_orderable(series.dtype):
+            # Widened to object by a later chunk (see load_csv streaming): no range any more
+            self.orderable, self.minimum, self.maximum = False, None, None
+        if self.orderable and null_count < len(series):
+            self._extend(series.min(), series.max())
+
+    def merge(self, other: 'ColumnSketch') -> None:
+        """Fold in the sketch of the same column over other rows"""
+        import pandas as pd
+
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.hll.merge(other.hll)
+        if self.exact is not None and other.exact is not None:
+            self.exact = pd.unique(_concat([self.exact, other.exact]))
+            if len(self.exact) > EXACT_DISTINCT:
+                self.exact = None
+        else:
+            self.exact = None
+        if self.orderable is None or other.orderable is False:
+            self.orderable = other.orderable
+        if not self.orderable:
+            self.minimum = self.maximum = None
+        elif other.minimum is not None:
+            self._extend(other.minimum, other.maximum)
+
+    def _extend(self, minimum: Any, maximum: Any) -> None:
+        if self.minimum is None or minimum < self.minimum:
+            self.minimum = minimum
+        if self.maximum is None or maximum > self.maximum:
+            self.maximum = maximum
+
+
+class QualitySketch:
+    """
+    Mergeable quality analysis of a frame read in chunks
+
+    Args:
+        precision: HyperLogLog precision, 2**precision registers per column
+        max_exact_rows: Row hashes kept for an exact duplicate count
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION, max_exact_rows: int = MAX_EXACT_ROWS):
+        self.precision = precision
+        self.max_exact_rows = max_exact_rows
+        self.rows = 0
+        self.columns: Dict[str, ColumnSketch] = {}
+        self.dtypes: Dict[str, str] = {}
+        self.row_hll = HyperLogLog(precision)
+        self._row_hashes: Optional[List['np.ndarray']] = []  # None once past max_exact_rows
+        self._stored_hashes = 0
+        self._compacted = True  # _row_hashes is one array of unique hashes (or empty)
+
+    def update(self, df: 'pd.DataFrame') -> 'QualitySketch':
+        """Add a chunk; every chunk must have the same columns in the same order"""
+        import numpy as np
+
+        names = [str(col) for col in df.columns]
+        if not self.columns:
+            self.columns = {name: ColumnSketch(self.precision) for name in names}
+            self.dtypes = {name: str(dtype) for name, dtype in zip(names, df.dtypes)}
+        elif names != list(self.columns):
+            raise ValueError("All chunks of a QualitySketch need the same columns")
+
+        row_hashes = np.zeros(len(df), dtype=np.uint64)
+        for name, (_, series) in zip(names, df.items()):
+            column = self.columns[name]
+            if column.categorize is None:
+                head = series.iloc[:CARDINALITY_SAMPLE]
+                column.categorize = head.nunique() <= MAX_UNIQUE_RATIO * len(head)
+            nulls = series.isna().to_numpy(dtype=bool)
+            hashes = _hash_values(series, column.categorize)
+            hashes[nulls] = _NULL_HASH
+            column.update(series, hashes, nulls)
+            row_hashes ^= hashes
+            row_hashes *= np.uint64(_FNV_PRIME)  # Order-dependent combination, wraps mod 2**64
+
+        self.rows += len(df)
+        self.row_hll.add_hashes(row_hashes)
+        self._keep_row_hashes([row_hashes])
+        return self
+
+    def merge(self, other: 'QualitySketch') -> 'QualitySketch':
+        """Fold in the sketch of other rows with the same columns (e.g. from another worker)"""
+        if not other.columns:
+            return self
+        if not self.columns:
+            self.columns = {name: ColumnSketch(self.precision) for name in other.columns}
+            self.dtypes = dict(other.dtypes)
+        elif list(other.columns) != list(self.columns):
+            raise ValueError("Only sketches with the same columns can be merged")
+
+        for name, column in other.columns.items():
+            self.columns[name].merge(column)
+        self.rows += other.rows
+        self.row_hll.merge(other.row_hll)
+        if other._row_hashes is None:
+            self._row_hashes = None
+        else:
+            self._keep_row_hashes(other._row_hashes)
+        return self
+
+    @property
+    def duplicates_exact(self) -> bool:
+        return self._row_hashes is not None
+
+    @property
+    def duplicate_rows(self) -> int:
+        """Rows equal to an earlier row, as DataFrame.duplicated().sum()"""
+        if self._row_hashes is not None:
+            if not self._compacted:
+                self._row_hashes = [_sorted_unique(_concat(self._row_hashes))]
+                self._stored_hashes, self._compacted = len(self._row_hashes[0]), True
+            return self.rows - self._stored_hashes
+        return max(0, self.rows - int(round(self.row_hll.estimate())))
+
+    @property
+    def missing_data_ratio(self) -> float:
+        cells = self.rows * len(self.columns)
+        return sum(column.nulls for column in self.columns.values()) / cells if cells else 0.0
+
+    @property
+    def distinct_relative_error(self) -> float:
+        """Relative error about 95% of the sketched distinct counts stay within (two standard errors)"""
+        return 2 * self.row_hll.relative_error
+
+    @property
+    def quality_score(self) -> float:
+        """
+        0-100: 70 points for completeness (share of non-null cells) and 30
+        for uniqueness (share of rows that are not duplicates)
+        """
+        if not self.rows or not self.columns:
+            return 0.0
+        duplicate_ratio = self.duplicate_rows / self.rows
+        return round(70 * (1 - self.missing_data_ratio) + 30 * (1 - duplicate_ratio), 1)
+
+    def column_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per column: dtype, nulls, null_ratio, distinct, distinct_exact, min, max"""
+        return {
+            name: {
+                'dtype': self.dtypes[name],
+                'nulls': column.nulls,
+                'null_ratio': column.nulls / column.rows if column.rows else 0.0,
+                'distinct': column.distinct,
+                'distinct_exact': column.exact is not None,
+                'min': _plain(column.minimum),
+                'max': _plain(column.maximum),
+            }
+            for name, column in self.columns.items()
+        }
+
+    def to_report(self) -> DataQualityReport:
+        """The sketch as a DataQualityReport, with recommendations"""
+        duplicate_rows = self.duplicate_rows
+        stats = self.column_stats()
+        recommendations = []
+        if duplicate_rows:
+            approx = '' if self.duplicates_exact else '~'
+            recommendations.append(f"{approx}{duplicate_rows} duplicate rows "
+                                   f"({duplicate_rows / self.rows:.1%}), consider deduplicating")
+        for name, column in stats.items():
+            if column['null_ratio'] >= SPARSE_COLUMN_RATIO:
+                recommendations.append(f"Column '{name}' is {column['null_ratio']:.0%} empty")
+            elif column['distinct'] == 1 and self.rows > 1:
+                recommendations.append(f"Column '{name}' holds a single value")
+
+        return DataQualityReport(
+            missing_data_ratio=self.missing_data_ratio,
+            duplicate_rows=duplicate_rows,
+            unique_values_per_column={name: column['distinct'] for name, column in stats.items()},
+            data_types_detected=dict(self.dtypes),
+            quality_score=self.quality_score,
+            recommendations=recommendations,
+            rows_analyzed=self.rows,
+            duplicates_exact=self.duplicates_exact,
+            distinct_relative_error=self.distinct_relative_error,
+            column_stats=stats,
+        )
+
+    def _keep_row_hashes(self, parts: List['np.ndarray']) -> None:
+        """Store row hashes for the exact duplicate count while they fit max_exact_rows"""
+        if self._row_hashes is None:
+            return
+        self._row_hashes.extend(parts)
+        self._stored_hashes += sum(len(hashes) for hashes in parts)
+        self._compacted = False
+        if self._stored_hashes > self.max_exact_rows:
+            unique = _sorted_unique(_concat(self._row_hashes))
+            if len(unique) > self.max_exact_rows:
+                self._row_hashes, self._stored_hashes = None, 0
+            else:
+                self._row_hashes, self._stored_hashes, self._compacted = [unique], len(unique), True
+
+
+def sketch_frame(df: 'pd.DataFrame', chunk_rows: int = SKETCH_CHUNK_ROWS, **kwargs: Any) -> QualitySketch:
+    """QualitySketch of a whole frame, hashed chunk_rows rows at a time"""
+    sketch = QualitySketch(**kwargs)
+    if len(df) == 0:
+        return sketch.update(df)
+    for start in range(0, len(df), chunk_rows):
+        sketch.update(df.iloc[start:start + chunk_rows])
+    return sketch
+
+
+def _hash_values(series: 'pd.Series', categorize: bool = True) -> 'np.ndarray':
+    """
+    Internal: uint64 hash per value; columns of unhashable objects (lists,
+    dicts) are hashed as text. categorize hashes the distinct values only,
+    faster for repetitive text and slower for mostly unique text.
+    """
+    import pandas as pd
+
+    if getattr(series.dtype, 'kind', None) == 'f':
+        series = series + 0.0  # -0.0 → 0.0: equal for nunique()/duplicated(), not for the hash
+    try:
+        hashes = pd.util.hash_pandas_object(series, index=False, categorize=categorize)
+    except (TypeError, ValueError):
+        hashes = pd.util.hash_pandas_object(series.astype(str), index=False, categorize=categorize)
+    return hashes.to_numpy(copy=True)
+
+
+def _is_orderable(dtype: Any) -> bool:
+    """Internal: Number, date and boolean columns get min/max"""
+    import pandas as pd
+
+    return ((pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype))
+            and not isinstance(dtype, pd.CategoricalDtype))
+
+
+def _sorted_unique(hashes: 'np.ndarray') -> 'np.ndarray':
+    """Internal: np.unique by sorting (NumPy 2's hash-based unique is slow on uint64)"""
+    import numpy as np
+
+    hashes = np.sort(hashes)
+    if len(hashes) < 2:
+        return hashes
+    keep = np.empty(len(hashes), dtype=bool)
+    keep[0] = True
+    np.not_equal(hashes[1:], hashes[:-1], out=keep[1:])
+    return hashes[keep]
+
+
+def _concat(arrays: List['np.ndarray']) -> 'np.ndarray':
+    import numpy as np
+
+    return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+
+def _plain(value: Any) -> Any:
+    """NumPy scalars as Python values, for printing and JSON"""
+    return value.item() if hasattr(value, 'item') and not hasattr(value, 'tzinfo') else value
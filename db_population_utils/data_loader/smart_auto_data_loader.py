@@ -17,15 +17,243 @@ Features:
 Author: Generated from user requirements
 """
 
-import re
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing, nullcontext
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, TYPE_CHECKING
-from dataclasses import dataclass
+from typing import (BinaryIO, Callable, ContextManager, Dict, Iterator, List, Tuple, Optional, Any, TypeVar, Union,
+                    TYPE_CHECKING)
+from dataclasses import asdict, dataclass, field, replace
+from functools import lru_cache, wraps
+
+from .source_probe import SourceProbe, probe_source
+from .compressed_source import gdal_path, open_source, split_member
+from .datetime_parsing import to_datetime_memoized
+from .data_loader import (DataQualityReport, ExcelParams, GeoParams, JsonParams, LoadOptions,
+                          LoadStrategy, LoadingMemoryError)
+from .bad_lines import BadLineQuarantine, iter_record_blocks
+from .batch_loading import (TRANSFERS, BatchLoadReport, expand_sources, frame_from_ipc, frame_to_ipc,
+                            largest_first, require_pyarrow)
+from .byte_sampling import (MIN_RANGE_BYTES, SAMPLE_CHUNKSIZE, SAMPLE_METHODS, SAMPLE_RANGES,
+                            header_end, random_offsets, read_aligned_ranges, read_record_ranges,
+                            record_boundaries, stratified_offsets)
+from .dtype_optimizer import column_bytes, downcast_floats, plan_dtypes, safe_plan
+from .number_parsing import NumberFormat, sniff_number_format, to_numeric_localized
+from .excel_workbook import inspect_workbook
+from .geospatial import GEO_FORMATS, inspect_layer, read_layer
+from .json_stream import (ELEMENT_COLUMNS, OVERPASS_RECORD_KEY, RECORD_BATCH, estimate_records,
+                          is_overpass, iter_overpass_batches)
+from .pushdown import (PUSHDOWN_CHUNKSIZE, PUSHDOWN_SAMPLE_ROWS, Filter, apply_pushdown,
+                       bbox_filters, coordinate_columns, pushdown_stats, read_columns, to_ogr_where,
+                       validate_filters)
+from .load_phases import PhaseCallback, PhaseRecorder
+from .quality_sketch import QualitySketch, sketch_frame
+from .load_profile import LoadProfile, family_name, parse_header_line, read_profile, write_profile
 
 if TYPE_CHECKING:
     import pandas as pd
 
+T = TypeVar('T')
+
+
+def _is_text_dtype(dtype: Any) -> bool:
+    """Internal: object, pandas string or Arrow string column"""
+    import pandas as pd
+    
+    return (dtype == 'object' or isinstance(dtype, pd.StringDtype)
+            or (isinstance(dtype, pd.ArrowDtype) and dtype.kind == 'U'))
+
+
+def _is_datetime_dtype(dtype: Any) -> bool:
+    """Internal: numpy/tz-aware datetime or Arrow timestamp/date column"""
+    return getattr(dtype, 'kind', None) == 'M'
+
+
+def _instrumented(method):
+    """
+    Internal: Public entry point that starts a new phase recording unless called within another
+    
+    A returned chunk iterator keeps the recording: it runs under it chunk by
+    chunk and closes it again when exhausted or closed (_bound_chunks).
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._phase_depth == 0:
+            source = args[0] if args and isinstance(args[0], (str, Path)) else kwargs.get('source')
+            self._phases = PhaseRecorder(self.on_phase, self.track_allocations,
+                                         str(source) if source is not None else None)
+        recorder = self._phases
+        self._phase_depth += 1
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            self._phase_depth -= 1
+            if self._phase_depth == 0:
+                recorder.close()
+        if self._phase_depth == 0 and isinstance(result, Iterator):
+            return _bound_chunks(self, result, close=recorder.close, _phases=recorder)
+        return result
+    return wrapper
+
+
+def _bound_chunks(loader: 'SmartAutoDataLoader', chunks: Iterator[T],
+                  close: Optional[Callable[[], None]] = None, **state: Any) -> Iterator[T]:
+    """
+    Internal: Produce each chunk with the loader attributes in state (phase
+    recorder, load strategy) set as for the load that returned the iterator,
+    not a later one; close() runs at the end, e.g. so tracemalloc stops
+    """
+    try:
+        while True:
+            outer = {name: getattr(loader, name) for name in state}
+            for name, value in state.items():
+                setattr(loader, name, value)
+            loader._phase_depth += 1
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+            finally:
+                loader._phase_depth -= 1
+                for name, value in outer.items():
+                    setattr(loader, name, value)
+            yield chunk
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+        if close is not None:
+            close()
+
+
+def _timed(phase: str):
+    """Internal: Record every call of a method under a load phase (see load_phases.py)"""
+    def decorate(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self._phases.phase(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _read_excel_sheet(source: str, sheet: str, read_kwargs: Dict[str, Any],
+                      compression: Optional[str] = 'infer') -> 'pd.DataFrame':
+    """Internal: load_excel_many worker, reads one sheet and parses its datetimes"""
+    import pandas as pd
+
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+    loader._set_compression(source, compression)
+    with loader._open(source, seekable=True) as src:
+        df = pd.read_excel(src, sheet_name=sheet, **read_kwargs)
+    if df.empty:
+        return df
+    return loader.parse_datetimes(df)
+
+
+def _read_csv_range(source: str, start: int, end: int, names: List[str], filters: List[Filter],
+                    numbers: NumberFormat, read_kwargs: Dict[str, Any]
+                    ) -> Tuple['pd.DataFrame', int, Dict[str, Dict[str, Any]]]:
+    """Internal: load_csv(parallel=N) worker, parses one byte range of whole records"""
+    import io
+    import pandas as pd
+
+    with open(source, 'rb') as f:
+        f.seek(start)
+        block = f.read(end - start)
+    df = pd.read_csv(io.BytesIO(block), header=None, names=names, **read_kwargs)
+    matched, stats = _filter_numbers(df, filters, numbers)
+    return matched, len(df), stats
+
+
+def _filter_numbers(df: 'pd.DataFrame', filters: List[Filter],
+                    numbers: Optional[NumberFormat]) -> Tuple['pd.DataFrame', Dict[str, Dict[str, Any]]]:
+    """
+    Internal: apply_pushdown rows for a parsed chunk, numbers compared as numbers
+
+    Number columns the parser left as text (read as text on purpose, or a
+    "-" further down than the sniffed head) are converted in place before
+    their filters run; returns the matching rows and the to_numeric_localized
+    stats per converted column.
+    """
+    import pandas as pd
+
+    stats = {}
+    styles = {**numbers.styles, **numbers.convert} if numbers is not None else {}
+    for col in dict.fromkeys(column for column, _, _ in filters):
+        if col in styles and col in df.columns and not pd.api.types.is_numeric_dtype(df[col].dtype):
+            df[col], stats[col] = to_numeric_localized(df[col], *styles[col])
+    return apply_pushdown(df, None, filters), stats
+
+
+def _concat_chunks(parts: List['pd.DataFrame']) -> 'pd.DataFrame':
+    """Internal: Concatenate parsed chunks, keeping categoricals categorical"""
+    import pandas as pd
+
+    df = pd.concat(parts, ignore_index=True)
+    # Chunks with different category sets concatenate to object
+    for col, dtype in parts[0].dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype) and df[col].dtype != 'category':
+            df[col] = df[col].astype('category')
+    return df
+
+
+def _narrow_nullable(df: 'pd.DataFrame', widened: Dict[str, str]) -> None:
+    """Internal: Back to int64/bool for columns made Int64/boolean only to fit every chunk"""
+    for col, dtype in widened.items():
+        if col in df.columns and not df[col].hasnans:
+            df[col] = df[col].astype('int64' if dtype == 'Int64' else 'bool')
+
+
+@lru_cache(maxsize=32)
+def _head_number_format(probe: SourceProbe) -> NumberFormat:
+    """Internal: Decimal/thousands separators of a CSV, sniffed from its probe head read as text"""
+    import io
+    import pandas as pd
+
+    if probe.detected_format != 'csv' or probe.encoding.startswith('utf-16'):
+        return NumberFormat()
+    head = probe.head[:probe.head.rfind(b'\n') + 1] if probe.truncated else probe.head
+    try:
+        sample = pd.read_csv(io.BytesIO(head), dtype=str, encoding=probe.encoding, sep=probe.delimiter,
+                             quotechar=probe.quote_char, on_bad_lines='skip')
+    except (ValueError, UnicodeDecodeError):
+        return NumberFormat()  # Empty head, or a quoted field cut off at the end of it
+    return sniff_number_format(sample, probe.delimiter)
+
+
+def _load_file(source: str, config: Dict[str, Any], load_kwargs: Dict[str, Any],
+               transfer: Optional[str], quality: bool = False) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Internal: load_many worker, loads one file and returns (payload, per-file
+    stats); with quality, stats['quality'] holds the frame's QualitySketch
+    """
+    start = time.perf_counter()
+    loader = SmartAutoDataLoader(verbose=False, on_memory_limit='raise', **config)
+    stats = {'format': None, 'rows': 0, 'columns': 0, 'memory_mb': 0.0, 'seconds': 0.0,
+             'transfer': None, 'error': None, 'phases': {}}
+    try:
+        stats['format'] = loader.probe(source).detected_format
+        df = loader.load(source, **load_kwargs)
+    except Exception as e:
+        stats['error'] = f"{type(e).__name__}: {e}"
+        stats['seconds'] = time.perf_counter() - start
+        stats['phases'] = loader._phases.timings()
+        return None, stats
+    
+    stats.update(rows=len(df), columns=len(df.columns),
+                 memory_mb=float(df.memory_usage(deep=True).sum()) / (1024 * 1024))
+    if quality:
+        with loader._phases.phase('quality_analysis'):
+            stats['quality'] = sketch_frame(df)
+    payload = frame_to_ipc(df) if transfer == 'arrow' else ('pickle', df, {})
+    stats['transfer'] = payload[0] if transfer else None
+    stats['seconds'] = time.perf_counter() - start
+    stats['phases'] = loader._phases.timings()
+    return payload, stats
+
+
 @dataclass 
 class LoadReport:
     """Comprehensive loading report as per README requirements"""
@@ -45,6 +273,35 @@ class LoadReport:
     warnings: List[str]
     errors: List[str]
     success: bool
+    # Per date column: rows, unique_parsed, memoized, seconds, parse_reduction
+    datetime_conversion: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    load_engine: str = 'N/A'  # CSV engine chosen by the load strategy
+    processing_speed_rows_per_sec: float = 0.0
+    # MEMORY_EFFICIENT loads, per column: dtype_before, dtype_after,
+    # bytes_before (default dtypes, extrapolated from the sample), bytes_after
+    memory_optimization: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Loads with columns/filters: columns_total/read, rows_scanned/kept,
+    # bytes_full_estimate, bytes_loaded, bytes_saved
+    pushdown: Dict[str, Any] = field(default_factory=dict)
+    compression: Optional[str] = None  # gzip/bz2/xz/zstd/zip, file_size_mb is the compressed size
+    # Sampled reports (build_report(sample_rows=...)): method, rows, bytes_read,
+    # estimated_total_rows, seconds; total_rows is then the estimate
+    sample: Dict[str, Any] = field(default_factory=dict)
+    # Loads with on_bad_lines/error_tolerance: mode, rows_scanned, bad_rows,
+    # recovery_percentage, error_tolerance, quarantine_path
+    bad_lines: Dict[str, Any] = field(default_factory=dict)
+    # CSVs: decimal, thousands (None unless read_csv applied it), grouped (columns
+    # read with thousands), convert ({column: [decimal, thousands]} converted after
+    # parsing) and converted (per column: rows, unparsed, and for full loads
+    # unique_parsed, memoized, seconds)
+    number_format: Dict[str, Any] = field(default_factory=dict)
+    # Per phase (probe, decode, parse, number_parsing, dtype_optimization,
+    # datetime_parsing, quality_analysis) that ran: seconds, calls and
+    # peak_alloc_mb (with track_allocations), see load_phases.py
+    phase_timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Null, distinct, duplicate and min/max counts of the loaded rows (all chunks
+    # of a streamed load, only the sample of a sampled one), see quality_sketch.py
+    data_quality: Optional[DataQualityReport] = None
 
 class SmartAutoDataLoader:
     """
@@ -62,14 +319,52 @@ class SmartAutoDataLoader:
     - JSON: 70% priority (MEDIUM)
     """
     
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, use_profiles: bool = True,
+                 load_strategy: Optional[LoadStrategy] = None,
+                 max_memory_usage_gb: Optional[float] = None,
+                 on_memory_limit: str = 'chunk',
+                 on_phase: Optional[PhaseCallback] = None,
+                 track_allocations: bool = False):
         """
         Initialize Smart Auto DataLoader
         
         Args:
             verbose: Enable detailed logging (manager requirement)
+            use_profiles: Reuse/write sidecar load profiles so repeat loads skip detection
+            load_strategy: CSV engine selection
+                - None: pandas C engine with NumPy dtypes (default)
+                - PERFORMANCE: multi-threaded Arrow reader with Arrow-backed dtypes
+                - MEMORY_EFFICIENT: C engine with compact dtypes (category/Int32/boolean)
+                  planned from a sample and applied while parsing, float32 where
+                  the whole column fits exactly (not when streaming)
+                - ROBUST: Python engine, malformed lines reported and skipped
+            max_memory_usage_gb: Memory budget checked by load() via estimate_memory_usage()
+            on_memory_limit: Over budget, 'chunk' streams CSVs and Overpass JSON in
+                recommended chunks (other formats raise), 'raise' always raises LoadingMemoryError
+            on_phase: Called as on_phase(phase, stats) whenever a load phase (probe,
+                decode, parse, number_parsing, dtype_optimization, datetime_parsing,
+                quality_analysis) finishes a step; stats holds seconds, peak_alloc_mb
+                and source. Totals go to build_report().phase_timings
+            track_allocations: Also record the peak allocation per phase with
+                tracemalloc (slows loads down, meant for diagnosing regressions)
         """
         self.verbose = verbose
+        self.use_profiles = use_profiles
+        self.load_strategy = load_strategy
+        self.max_memory_usage_gb = max_memory_usage_gb
+        self.on_memory_limit = on_memory_limit
+        self.on_phase = on_phase
+        self.track_allocations = track_allocations
+        
+        # Per-phase timings of the current load (reset by each public load call)
+        self._phases = PhaseRecorder(on_phase, track_allocations)
+        self._phase_depth = 0
+        
+        # Detection results of the last load (encoding, delimiter, sheet, date formats)
+        self._last_load: Dict[str, Any] = {}
+        
+        # Compression given explicitly per source (load(compression=...) / LoadOptions)
+        self._compression: Dict[str, Optional[str]] = {}
         
         # Date patterns for automatic detection (manager priority)
         self.date_patterns = [
@@ -87,7 +382,9 @@ class SmartAutoDataLoader:
     # LOADING FUNCTIONS (5 methods - Manager Requirements)
     # =================================================================
     
-    def load(self, source: str, **kwargs) -> 'pd.DataFrame':
+    @_instrumented
+    def load(self, source: str, *, kind: str = 'auto', options: Optional[LoadOptions] = None,
+             **kwargs) -> 'pd.DataFrame':
         """
         1/5 Universal loading with auto-delegation (README: main method)
         
@@ -95,6 +392,36 @@ class SmartAutoDataLoader:
         - CSV/TSV → load_csv() (95% priority - CRITICAL)
         - Excel → load_excel() (80% priority - HIGH)
         - JSON → load_json() (70% priority - MEDIUM)
+        - GeoJSON/GeoPackage/Shapefile → load_geospatial()
+        
+        kind overrides detection ('csv', 'excel', 'json', 'geojson', 'gpkg',
+        'shapefile'). Keyword arguments are forwarded, e.g. load(source, chunksize=50000)
+        streams a CSV as an iterator of DataFrames, and columns=[...] /
+        filters=[(col, op, value), ...] are pushed down into the parser and
+        parallel=N parses a large CSV in N processes. LoadOptions supplies kind,
+        chunksize, parallel, columns, filters and the geospatial layer, bbox
+        and geometry the same way. Geospatial layers are read in one piece:
+        chunksize/parallel raise ValueError for them, as do layer/geometry for
+        other formats; a bbox on a CSV/JSON source filters its lon/lat columns.
+        
+        Plain loads (no keyword arguments, no kind) of CSV/Excel files use load profiles:
+        the first successful load writes a sidecar profile and later loads of
+        the same file family go straight to a typed read, unless the header drifted.
+        
+        With max_memory_usage_gb set, a file estimated above the budget is
+        streamed in chunks (CSV, Overpass JSON) or rejected with LoadingMemoryError.
+        
+        gzip/bz2/xz/zstd files and zip members ('archive.zip::member.csv') are
+        decompressed on the fly; compression= (or LoadOptions.compression)
+        overrides the detection from the magic bytes, None reads the file as is.
+        
+        on_bad_lines='warn'/'skip'/'quarantine' with error_tolerance (percent of
+        bad rows, also from LoadOptions) drops malformed CSV rows in the same
+        pass, see load_csv(). LoadOptions' default error_tolerance of 0.0 only
+        applies to 'quarantine'; 'warn'/'skip' are limited when it is set.
+        
+        LoadOptions.load_strategy overrides the loader's load_strategy for
+        this load (and the chunks it streams).
         """
         import pandas as pd
         
@@ -104,19 +431,79 @@ class SmartAutoDataLoader:
         if self.verbose:
             print(f"🎯 Loading file: {Path(source).name}")
         
+        self._last_load = {}
+        
+        if options is not None and options.load_strategy not in (None, self.load_strategy):
+            outer, self.load_strategy = self.load_strategy, options.load_strategy
+            try:
+                df = self.load(source, kind=kind, options=replace(options, load_strategy=None), **kwargs)
+            finally:
+                self.load_strategy = outer
+            if isinstance(df, Iterator):
+                return _bound_chunks(self, df, load_strategy=options.load_strategy)
+            return df
+        
+        if options is not None:
+            kind = options.kind if kind == 'auto' else kind
+            for name in ('chunksize', 'parallel', 'columns', 'filters', 'layer', 'bbox'):
+                if getattr(options, name) is not None:
+                    kwargs.setdefault(name, getattr(options, name))
+            if not options.geometry:
+                kwargs.setdefault('geometry', False)
+            if options.compression != 'infer':
+                kwargs.setdefault('compression', options.compression)
+            if options.on_bad_lines != 'error':
+                kwargs.setdefault('on_bad_lines', options.on_bad_lines)
+                # The 0.0 default limits only quarantine, 'warn'/'skip' drop rows unless a limit is set
+                if options.on_bad_lines == 'quarantine' or options.error_tolerance:
+                    kwargs.setdefault('error_tolerance', options.error_tolerance)
+                kwargs.setdefault('quarantine_path', options.quarantine_path)
+        
+        if 'compression' in kwargs:
+            self._set_compression(source, kwargs.pop('compression'))
+        self._resolve_geo_kwargs(source, kind, kwargs)
+        
+        if self.max_memory_usage_gb and 'chunksize' not in kwargs:
+            chunksize = self._check_memory_budget(source)
+            if chunksize and self.probe(source).detected_format == 'json':
+                return self.load_json(source, chunksize=chunksize, **kwargs)
+            if chunksize:
+                return self.load_csv(source, chunksize=chunksize, **kwargs)
+        
+        use_profile = self.use_profiles and not kwargs and kind == 'auto'
+        if use_profile:
+            df = self._load_with_profile(source)
+            if df is not None:
+                return df
+        
         # Auto-detect format and delegate (README requirement)
-        detected_format = self.detect_format(source)
+        detected_format = self.detect_format(source) if kind == 'auto' else kind
         
         if detected_format in ['csv', 'tsv']:
-            return self.load_csv(source, **kwargs)
+            df = self.load_csv(source, **kwargs)
         elif detected_format == 'excel':
-            return self.load_excel(source, **kwargs)
+            df = self.load_excel(source, **kwargs)
         elif detected_format == 'json':
             return self.load_json(source, **kwargs)
+        elif detected_format in GEO_FORMATS:
+            return self.load_geospatial(source, **kwargs)
         else:
             raise ValueError(f"Unsupported format: {detected_format}")
+        
+        if use_profile:
+            self._save_profile(source, detected_format, df)
+        
+        return df
     
-    def load_csv(self, source: str, **kwargs) -> 'pd.DataFrame':
+    @_instrumented
+    def load_csv(self, source: str, chunksize: Optional[int] = None,
+                 columns: Optional[List[str]] = None,
+                 filters: Optional[List[Filter]] = None,
+                 parallel: Optional[int] = None,
+                 on_bad_lines: Optional[str] = None,
+                 error_tolerance: Optional[float] = None,
+                 quarantine_path: Optional[str] = None,
+                 **kwargs) -> Union['pd.DataFrame', Iterator['pd.DataFrame']]:
         """
         2/5 CSV loading with smart detection (README: 95% priority - CRITICAL)
         
@@ -124,38 +511,141 @@ class SmartAutoDataLoader:
         - Automatic encoding detection (manager priority)
         - Automatic delimiter detection (manager priority)
         - Parameter sniffing (README requirement)
+        - Streaming mode: with chunksize set, returns an iterator of DataFrames
+          whose dtypes and date columns are decided once on the first chunk;
+          a number/boolean column a later chunk does not fit is read as object
+          from that chunk on (listed in build_report() warnings)
+        - Pushdown: only `columns` (plus the filter columns) are parsed and the
+          `filters` (see pushdown.py) are evaluated chunk by chunk during parsing
+        - Parallel mode: with parallel=N, the file is split into up to N byte
+          ranges of whole records (quoted newlines respected) that are parsed
+          in worker processes with one schema and concatenated in order
+        - Bad lines: on_bad_lines='warn'/'skip'/'quarantine' (or error_tolerance
+          alone, which quarantines) reads the file once in blocks of whole
+          records; rows the C parser rejects are dropped, 'quarantine' writes
+          them with line number and raw text to quarantine_path (default
+          <file>.quarantine.jsonl), and the load raises BadLinesError as soon as
+          more than error_tolerance percent of the rows are bad. The counts and
+          recovery_percentage go to build_report().bad_lines.
+        - Localized numbers: decimal/thousands separators sniffed from the head
+          ("1.234,56" in ';' files, "4,169" cases) are passed to read_csv, so
+          the parser produces floats itself; thousands only when no other
+          column (e.g. "24.09.2025" dates) would be misread, and not to the
+          Arrow engine, which has no thousands option. Columns in another
+          style are read as text and converted with to_numeric_localized;
+          filters on number columns compare the converted numbers.
         """
         import pandas as pd
         
         if self.verbose:
             print(f"📊 Loading CSV file...")
         
-        path = Path(source)
+        # Auto-detect encoding and CSV parameters from one probe (README: sniff_csv_params)
+        params = self.sniff_csv_params(source)
+        read_kwargs = {
+            'encoding': params['encoding'],
+            'sep': params['delimiter'],
+            'quotechar': params['quote_char'],
+        }
+        number_format = params['number_format']
+        read_kwargs.update(number_format.read_kwargs())
+        self._last_load = dict(params)
+        self._last_load['number_format'] = {**asdict(number_format), 'converted': {}}
         
-        # Auto-detect encoding (README: CRITICAL for CSV)
-        encoding = self.detect_encoding(source)
+        filters = validate_filters(filters)
+        pushdown = columns is not None or bool(filters)
+        full_sample = None
+        if pushdown:
+            with self._phases.phase('parse'), self._open(source) as src:
+                full_sample = pd.read_csv(src, nrows=PUSHDOWN_SAMPLE_ROWS, **read_kwargs)
+        usecols = read_columns(columns, filters)
+        if usecols is not None:
+            read_kwargs['usecols'] = usecols
+        
+        # Bad lines: one pass in blocks of whole records, rejected rows set aside
+        if error_tolerance is not None and on_bad_lines is None:
+            on_bad_lines = 'quarantine'
+        if on_bad_lines not in (None, 'error'):
+            if params['encoding'].startswith('utf-16'):
+                raise ValueError("on_bad_lines needs an 8-bit or UTF-8 encoded file")
+            if parallel and self.verbose:
+                print("   ⚠️ Bad-line handling reads in one pass, parallel is ignored")
+            quarantine = BadLineQuarantine(source, on_bad_lines, error_tolerance, quarantine_path,
+                                           params['quote_char'], params['encoding'])
+            self._last_load['engine'] = 'c'
+            chunks = self._iter_csv_chunks(source, chunksize or PUSHDOWN_CHUNKSIZE, columns=columns,
+                                           filters=filters, full_sample=full_sample,
+                                           quarantine=quarantine, numbers=number_format, **read_kwargs)
+            if chunksize:
+                return chunks
+            parts = list(chunks)
+            with self._phases.phase('parse'):
+                df = _concat_chunks(parts) if parts else pd.DataFrame(columns=columns)
+            with self._phases.phase('dtype_optimization'):
+                _narrow_nullable(df, self._last_load.pop('widened', {}))
+            if self.verbose:
+                stats = self._last_load['bad_lines']
+                print(f"✅ CSV loaded: {len(df)} rows, {len(df.columns)} columns, "
+                      f"{stats['bad_rows']} bad rows ({stats['recovery_percentage']:.2f}% recovered)")
+            return df
+        
+        # Streaming mode: bounded memory for multi-GB exports
+        if chunksize:
+            engine_kwargs = self._csv_engine_kwargs(streaming=True)
+            self._last_load['engine'] = engine_kwargs.get('engine', 'c')
+            number_format = self._engine_number_format(number_format, engine_kwargs, read_kwargs)
+            return self._iter_csv_chunks(source, chunksize, columns=columns, filters=filters,
+                                         full_sample=full_sample, numbers=number_format,
+                                         **read_kwargs, **engine_kwargs)
+        
+        # Load with detected parameters and the strategy's engine
+        engine_kwargs = self._csv_engine_kwargs()
+        self._last_load['engine'] = engine_kwargs.get('engine', 'c')
+        number_format = self._engine_number_format(number_format, engine_kwargs, read_kwargs)
+        parsed = None
+        if parallel and parallel > 1:
+            parsed = self._read_csv_parallel(source, parallel, filters, numbers=number_format,
+                                             **read_kwargs, **engine_kwargs)
+        if parsed is not None:
+            df, sample = parsed
+        elif self.load_strategy is LoadStrategy.MEMORY_EFFICIENT:
+            df, sample = self._read_csv_optimized(source, filters=filters, numbers=number_format,
+                                                  **read_kwargs, **engine_kwargs)
+        else:
+            df, sample = self._read_csv(source, filters, numbers=number_format,
+                                        **read_kwargs, **engine_kwargs), None
         
-        # Auto-detect CSV parameters (README: sniff_csv_params)
-        delimiter = self._sniff_delimiter(path, encoding)
+        # Drop the columns only the filters needed
+        df = apply_pushdown(df, columns, [])
         
-        # Load with detected parameters
-        df = pd.read_csv(source, encoding=encoding, sep=delimiter)
+        self._last_load['number_format']['converted'].update(self._convert_numbers(df, number_format))
         
         # Auto-detect and parse datetimes (manager requirement)
         df = self.parse_datetimes(df)
         
+        if sample is not None:
+            self._last_load['memory_optimization'] = self._memory_optimization_report(sample, df)
+        if pushdown:
+            self._record_pushdown(full_sample, len(usecols or full_sample.columns),
+                                  self._last_load.pop('rows_scanned', len(df)), len(df),
+                                  int(df.memory_usage(deep=True).sum()))
+        
         if self.verbose:
             print(f"✅ CSV loaded: {len(df)} rows, {len(df.columns)} columns")
         
         return df
     
-    def load_excel(self, source: str, **kwargs) -> 'pd.DataFrame':
+    @_instrumented
+    def load_excel(self, source: str, columns: Optional[List[str]] = None,
+                   filters: Optional[List[Filter]] = None, **kwargs) -> 'pd.DataFrame':
         """
         3/5 Excel loading with smart detection (README: 80% priority - HIGH)
         
         Implements ExcelLoader functionality with:
         - Sheet selection and detection (README requirement)
         - Auto-delegation from unified interface
+        - Pushdown: only `columns` (plus the filter columns) are kept by the
+          parser (usecols); `filters` are applied before date parsing
         """
         import pandas as pd
         
@@ -164,7 +654,7 @@ class SmartAutoDataLoader:
         
         try:
             # Check if file exists
-            path = Path(source)
+            path = Path(split_member(source)[0])
             if not path.exists():
                 raise FileNotFoundError(f"Excel file not found: {source}")
             
@@ -172,37 +662,36 @@ class SmartAutoDataLoader:
             sheet_name = kwargs.get('sheet_name', None)
             
             if sheet_name is None:
-                # Auto-detect best sheet (README: sheet selection)
-                xl_file = pd.ExcelFile(source)
-                sheet_names = xl_file.sheet_names
-                
-                if self.verbose:
-                    print(f"   📋 Available sheets: {sheet_names}")
-                
-                # Use first sheet or find the largest one
-                if len(sheet_names) == 1:
-                    sheet_name = sheet_names[0]
-                else:
-                    # Find sheet with most data
-                    max_rows = 0
-                    best_sheet = sheet_names[0]
-                    
-                    for sheet in sheet_names:
-                        try:
-                            temp_df = pd.read_excel(source, sheet_name=sheet, nrows=1)
-                            if len(temp_df.columns) > max_rows:
-                                max_rows = len(temp_df.columns)
-                                best_sheet = sheet
-                        except:
-                            continue
-                    
-                    sheet_name = best_sheet
-                
+                # Auto-detect best sheet (README: sheet selection) from the
+                # sheet dimensions of a single read-only open
+                params = self.inspect_excel(source)
+                sheet_name = params.recommended_sheet
+
                 if self.verbose:
                     print(f"   ✅ Selected sheet: '{sheet_name}'")
             
+            self._last_load = {'sheet_name': sheet_name}
+            
+            read_kwargs = {k: v for k, v in kwargs.items() if k != 'sheet_name'}
+            filters = validate_filters(filters)
+            pushdown = columns is not None or bool(filters)
+            if pushdown:
+                with self._phases.phase('parse'), self._open(source, seekable=True) as src:
+                    full_sample = pd.read_excel(src, sheet_name=sheet_name,
+                                                nrows=PUSHDOWN_SAMPLE_ROWS, **read_kwargs)
+                usecols = read_columns(columns, filters)
+                if usecols is not None:
+                    read_kwargs['usecols'] = usecols
+            
             # Load Excel with selected sheet
-            df = pd.read_excel(source, sheet_name=sheet_name, **{k: v for k, v in kwargs.items() if k != 'sheet_name'})
+            with self._phases.phase('parse'), self._open(source, seekable=True) as src:
+                df = pd.read_excel(src, sheet_name=sheet_name, **read_kwargs)
+            
+            if pushdown:
+                rows_scanned, columns_read = len(df), len(df.columns)
+                df = apply_pushdown(df, columns, filters).reset_index(drop=True)
+                self._record_pushdown(full_sample, columns_read, rows_scanned, len(df),
+                                      int(df.memory_usage(deep=True).sum()))
             
             # Check if DataFrame is empty
             if df.empty:
@@ -224,22 +713,209 @@ class SmartAutoDataLoader:
             if self.verbose:
                 print(f"❌ {error_msg}")
             raise ValueError(error_msg)
+
+    def load_excel_many(self, source: str, sheets: Optional[List[str]] = None,
+                        max_workers: Optional[int] = None,
+                        **kwargs) -> Dict[str, 'pd.DataFrame']:
+        """
+        Load several sheets of one workbook, parsed concurrently
+
+        Each sheet is read (and its datetimes parsed) in a separate worker
+        process; sheets are independent, so parsing scales with the cores.
+
+        Args:
+            source: Excel file path
+            sheets: Sheet names to load (default: all sheets)
+            max_workers: Process pool size (default: one per sheet, capped at CPU count);
+                1 loads the sheets sequentially in this process
+            **kwargs: Passed to pd.read_excel for every sheet
+
+        Returns:
+            Dict of sheet name → DataFrame, in the requested order
+        """
+        params = self.inspect_excel(source)
+        if sheets is None:
+            sheets = params.available_sheets
+
+        missing = [sheet for sheet in sheets if sheet not in params.sheet_shapes]
+        if missing:
+            raise ValueError(f"Sheets not found in {source}: {missing}")
+
+        workers = min(max_workers or os.cpu_count() or 1, len(sheets))
+
+        if self.verbose:
+            print(f"📈 Loading {len(sheets)} Excel sheets with {workers} worker(s)...")
+
+        compression = self._compression.get(str(source), 'infer')
+        if workers <= 1:
+            frames = [_read_excel_sheet(source, sheet, kwargs, compression) for sheet in sheets]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                frames = list(pool.map(_read_excel_sheet, repeat(source), sheets, repeat(kwargs),
+                                       repeat(compression)))
+
+        if self.verbose:
+            for sheet, df in zip(sheets, frames):
+                print(f"   ✅ '{sheet}': {len(df)} rows, {len(df.columns)} columns")
+
+        return dict(zip(sheets, frames))
+
+    def load_many(self, sources: Union[str, List[str]], max_workers: Optional[int] = None,
+                  transfer: str = 'pickle', quality: bool = False,
+                  **kwargs) -> Tuple[Dict[str, 'pd.DataFrame'], BatchLoadReport]:
+        """
+        Load many files concurrently, each with full auto-detection
+        
+        Every file is loaded by load() in a worker process (largest files
+        first); a file that fails is recorded in the report instead of
+        aborting the batch. Over max_memory_usage_gb a file fails with
+        LoadingMemoryError, since a chunk stream cannot leave its worker.
+        Each file's phase timings land in the report (files[source]['phases']);
+        on_phase is not called from the workers.
+        
+        Args:
+            sources: Paths and/or glob patterns, e.g. '*/sources/*.csv'
+            max_workers: Process pool size (default: one per file, capped at CPU count);
+                1 loads the files sequentially in this process
+            transfer: How frames reach this process - 'pickle', or 'arrow' to
+                send each as one Arrow IPC buffer (needs pyarrow; GeoDataFrames
+                are still pickled)
+            quality: Sketch each file's quality in its worker (files[source]['quality']);
+                files with the same columns and dtypes are merged into report.quality
+            **kwargs: Passed to load() for every file (not chunksize)
+        
+        Returns:
+            (dict of source → DataFrame for the files that loaded, BatchLoadReport)
+        """
+        if transfer not in TRANSFERS:
+            raise ValueError(f"transfer must be one of {TRANSFERS}, got {transfer!r}")
+        if 'chunksize' in kwargs:
+            raise ValueError("load_many() returns whole frames, stream large files with load(chunksize=...)")
+        if transfer == 'arrow':
+            require_pyarrow()
+        
+        start = time.perf_counter()
+        sources = expand_sources(sources)
+        workers = min(max_workers or os.cpu_count() or 1, len(sources)) or 1
+        config = {'use_profiles': self.use_profiles, 'load_strategy': self.load_strategy,
+                  'max_memory_usage_gb': self.max_memory_usage_gb,
+                  'track_allocations': self.track_allocations}
+        
+        def file_kwargs(source):
+            if str(source) in self._compression:
+                return {**kwargs, 'compression': self._compression[str(source)]}
+            return kwargs
+        
+        if self.verbose:
+            print(f"📦 Loading {len(sources)} files with {workers} worker(s)...")
+        
+        results = {}
+        if workers <= 1:
+            for source in sources:
+                results[source] = _load_file(source, config, file_kwargs(source), None, quality)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(_load_file, source, config, file_kwargs(source), transfer,
+                                       quality): source
+                           for source in largest_first(sources)}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        
+        frames, files = {}, {}
+        merged: Optional[QualitySketch] = None
+        mergeable = quality
+        for source in sources:
+            payload, stats = results[source]
+            files[source] = stats
+            sketch = stats.pop('quality', None)
+            if sketch is not None:
+                stats['quality'] = sketch.to_report()
+                if merged is None:
+                    merged = QualitySketch(sketch.precision).merge(sketch)
+                elif mergeable and list(sketch.dtypes.items()) == list(merged.dtypes.items()):
+                    merged.merge(sketch)
+                else:
+                    mergeable = False
+            if payload is not None:
+                frames[source] = frame_from_ipc(payload)
+            if self.verbose:
+                if stats['error']:
+                    print(f"   ❌ {source}: {stats['error']}")
+                else:
+                    print(f"   ✅ {source}: {stats['rows']} rows, {stats['columns']} columns "
+                          f"({stats['seconds']:.2f}s)")
+        
+        report = BatchLoadReport(
+            files=files,
+            total_rows=sum(stats['rows'] for stats in files.values()),
+            total_seconds=time.perf_counter() - start,
+            workers=workers,
+            failed=[source for source, stats in files.items() if stats['error']],
+            quality=merged.to_report() if merged is not None and mergeable else None,
+        )
+        
+        if self.verbose:
+            print(f"✅ Loaded {len(frames)}/{len(sources)} files, {report.total_rows} rows "
+                  f"in {report.total_seconds:.2f}s")
+        
+        return frames, report
     
-    def load_json(self, source: str, **kwargs) -> 'pd.DataFrame':
+    @_instrumented
+    def load_json(self, source: str, chunksize: Optional[int] = None,
+                  tags: Optional[List[str]] = None,
+                  columns: Optional[List[str]] = None,
+                  filters: Optional[List[Filter]] = None,
+                  **kwargs) -> Union['pd.DataFrame', Iterator['pd.DataFrame']]:
         """
         4/5 JSON loading with smart detection (README: 70% priority - MEDIUM)
         
         Implements JsonLoader functionality with:
         - Structure flattening (README requirement)
         - Auto-delegation from unified interface
+        
+        Overpass API documents are streamed element by element instead of
+        being parsed whole: each element becomes one row (osm_type, osm_id,
+        lat/lon resolved from "center" for ways/relations, one column per tag),
+        so memory stays flat regardless of document size.
+        
+        Args:
+            source: JSON file path
+            chunksize: Overpass only - return an iterator of DataFrames with
+                this many elements each
+            tags: Overpass only - whitelist of tags to turn into columns
+                (default: all tags, or the tags among `columns`)
+            columns: Columns to keep; Overpass tags outside them are never flattened
+            filters: Row predicates (see pushdown.py), applied per element batch
+                for Overpass documents and after parsing for other JSON
+            **kwargs: Passed to pd.read_json for other documents
         """
         import pandas as pd
         
         if self.verbose:
             print(f"🗂️ Loading JSON file...")
         
-        # Load JSON with structure flattening (README requirement)
-        df = pd.read_json(source)
+        params = self.inspect_json(source)
+        self._last_load = {'json_params': params}
+        filters = validate_filters(filters)
+        
+        if params.structure_type == 'overpass':
+            frames = self._phases.iterate('parse', self._iter_overpass_frames(
+                source, chunksize or RECORD_BATCH, tags, columns=columns, filters=filters))
+            if chunksize:
+                return self._iter_json_chunks(frames)
+            frames = list(frames)
+            with self._phases.phase('parse'):
+                df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+        else:
+            # Load JSON with structure flattening (README requirement)
+            with self._phases.phase('parse'), self._open(source) as src:
+                df = pd.read_json(src, **kwargs)
+            if columns is not None or filters:
+                # No streaming parser for arbitrary JSON: filter the parsed frame
+                full_sample, rows_scanned = df.head(PUSHDOWN_SAMPLE_ROWS), len(df)
+                df = apply_pushdown(df, columns, filters).reset_index(drop=True)
+                self._record_pushdown(full_sample, len(df.columns), rows_scanned, len(df),
+                                      int(df.memory_usage(deep=True).sum()))
         
         # Auto-detect and parse datetimes
         df = self.parse_datetimes(df)
@@ -249,147 +925,412 @@ class SmartAutoDataLoader:
         
         return df
     
-    def parse_datetimes(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
+    @_instrumented
+    def load_geospatial(self, source: str, *, layer: Optional[Union[str, int]] = None,
+                        bbox: Optional[Tuple[float, float, float, float]] = None,
+                        columns: Optional[List[str]] = None,
+                        filters: Optional[List[Filter]] = None,
+                        geometry: bool = True) -> 'pd.DataFrame':
         """
-        5/5 DateTime parsing across all formats (README: manager priority)
+        GeoJSON/GeoPackage/Shapefile loading through pyogrio's Arrow reader
+        
+        Filters are applied inside GDAL, so skipped features and fields are
+        never materialized.
         
-        Automatic datetime detection and parsing for all supported formats
+        Args:
+            source: Geospatial file path
+            layer: Layer name or index (default: first layer)
+            bbox: (xmin, ymin, xmax, ymax) in the layer CRS, only intersecting features are read
+            columns: Attribute fields to read (default: all)
+            filters: Row predicates (see pushdown.py), evaluated by GDAL as an OGR SQL WHERE
+            geometry: False reads the attribute table only
+        
+        Returns:
+            GeoDataFrame with its spatial index built (DataFrame if geometry=False)
         """
+        if self.verbose:
+            print(f"🗺️ Loading geospatial file...")
+        
+        params = self.inspect_geospatial(source, layer=layer)
+        params.bbox, params.columns, params.geometry = bbox, columns, geometry
+        self._last_load = {'geo_params': params}
+        
+        with self._phases.phase('parse'):
+            df = read_layer(self._gdal_source(source), layer=params.layer, bbox=bbox, columns=columns,
+                            geometry=geometry, where=to_ogr_where(validate_filters(filters)))
+        
+        # Auto-detect and parse datetimes in the attributes
+        df = self.parse_datetimes(df)
+        
+        if self.verbose:
+            print(f"✅ Layer loaded: {len(df)} of {params.feature_count} features, "
+                  f"{len(df.columns)} columns")
+
+        return df
+
+    @_instrumented
+    def load_sample(self, source: str, n: int = 10000, method: str = 'random_offsets', *,
+                    seed: Optional[int] = None, columns: Optional[List[str]] = None,
+                    filters: Optional[List[Filter]] = None) -> 'pd.DataFrame':
+        """
+        Representative sample of n rows for profiling, without loading the file
+    
+        Methods:
+        - 'random_offsets': byte ranges at random offsets spread over a CSV,
+          each resynced to the next record boundary (quoted newlines respected)
+          and parsed on its own; reads about n rows' worth of bytes
+        - 'reservoir': uniform sample over a full streaming pass in chunks,
+          memory bounded by the chunk size
+        - 'head': the first n rows
+    
+        Compressed and UTF-16 CSVs cannot be read at offsets and use
+        'reservoir', as do CSVs smaller than the ranges would be. Formats
+        that cannot be streamed (Excel, geospatial) are loaded and sampled.
+        Datetimes are parsed as by load(); the stats (method used, rows,
+        bytes_read, estimated_total_rows) are kept for build_report().
+        """
+        import numpy as np
         import pandas as pd
+    
+        if method not in SAMPLE_METHODS:
+            raise ValueError(f"method must be one of {SAMPLE_METHODS}, got {method!r}")
+    
+        start_time = time.time()
+        probe = self.probe(source)
+        filters = validate_filters(filters)
+        seekable = (probe.detected_format == 'csv' and probe.compression is None
+                    and not probe.encoding.startswith('utf-16'))
+    
+        df = None
+        if method == 'random_offsets' and seekable:
+            df, stats = self._sample_csv_ranges(source, n, seed, columns, filters)
+        if df is None:
+            method = 'reservoir' if method == 'random_offsets' else method
+            load_kwargs = {key: value for key, value in (('columns', columns), ('filters', filters))
+                           if value}
+            streamed = self._can_stream(source)
+            if streamed:
+                chunks = self.load(source, chunksize=n if method == 'head' else max(n, SAMPLE_CHUNKSIZE),
+                                   **load_kwargs)
+            else:
+                chunks = iter([self.load(source, **load_kwargs)])
+    
+            if method == 'head':
+                df = next(chunks, pd.DataFrame())
+                if not streamed:
+                    total_rows = len(df)
+                elif probe.detected_format == 'csv':
+                    total_rows = self.estimate_memory_usage(source)['estimated_rows']
+                else:
+                    total_rows = None
+                df = df.head(n)
+            else:
+                # Keep the n rows with the smallest random keys seen so far
+                rng = np.random.default_rng(seed)
+                df, keys, total_rows = None, None, 0
+                for chunk in chunks:
+                    total_rows += len(chunk)
+                    chunk_keys = rng.random(len(chunk))
+                    if df is not None:
+                        chunk = pd.concat([df, chunk])
+                        chunk_keys = np.concatenate([keys, chunk_keys])
+                    if len(chunk) > n:
+                        keep = np.sort(np.argpartition(chunk_keys, n)[:n])
+                        chunk, chunk_keys = chunk.iloc[keep], chunk_keys[keep]
+                    df, keys = chunk, chunk_keys
+                df = pd.DataFrame() if df is None else df
+            # Chunked reads make integer/boolean columns nullable; load() would not
+            for col, dtype in df.dtypes.items():
+                if dtype in ('Int64', 'boolean') and not df[col].hasnans:
+                    df[col] = df[col].astype('int64' if dtype == 'Int64' else 'bool')
+            stats = {'bytes_read': probe.data_size_bytes if method == 'reservoir' else None,
+                     'estimated_total_rows': total_rows}
+    
+        df = df.reset_index(drop=True)
+        self._last_load['sample'] = {'method': method, 'rows': len(df), **stats,
+                                     'seconds': time.time() - start_time}
+    
+        if self.verbose:
+            print(f"🎲 Sample loaded ({method}): {len(df)} rows, {len(df.columns)} columns")
+    
+        return df
+    
+    @_instrumented
+    def parse_datetimes(self, df: 'pd.DataFrame', *, sample_size: int = 100,
+                        min_parse_rate: float = 0.5) -> 'pd.DataFrame':
+        """
+        5/5 DateTime parsing across all formats (README: manager priority)
         
-        df_result = df.copy()
-        date_columns_found = []
+        Automatic datetime detection and parsing for all supported formats.
+        Detection runs vectorized on a sample of each text column; detected
+        columns are converted in place (no copy of the frame is made).
         
+        Args:
+            df: DataFrame to convert (modified in place and returned)
+            sample_size: Non-null values per column checked against the date patterns
+            min_parse_rate: Share of sampled values that must match a pattern
+        """
         if self.verbose:
             print("🗓️ Searching for date columns...")
         
-        for col in df.columns:
-            if df[col].dtype == 'object':  # Text columns only
-                sample = df[col].dropna().astype(str).head(10)
-                
-                # Check each date pattern
-                for pattern, date_format in self.date_patterns:
-                    matches = sum(1 for val in sample if re.search(pattern, val))
-                    
-                    # If >50% values match date pattern
-                    if matches >= len(sample) * 0.5:
-                        try:
-                            df_result[col] = pd.to_datetime(df[col], format=date_format, errors='coerce')
-                            date_columns_found.append(col)
-                            if self.verbose:
-                                print(f"   ✅ Found date column: '{col}' ({date_format})")
-                            break
-                        except:
-                            continue
-        
-        if not date_columns_found and self.verbose:
+        date_formats = self._detect_date_formats(df, sample_size=sample_size,
+                                                 min_parse_rate=min_parse_rate)
+        if self.verbose:
+            for col, date_format in date_formats.items():
+                print(f"   ✅ Found date column: '{col}' ({date_format})")
+        
+        self._last_load['datetime_stats'] = self._apply_date_formats(df, date_formats)
+        self._last_load['date_formats'] = date_formats
+        
+        if not date_formats and self.verbose:
             print("   📅 No date columns detected")
-        elif date_columns_found and self.verbose:
-            print(f"   📅 Total date columns found: {len(date_columns_found)}")
+        elif date_formats and self.verbose:
+            print(f"   📅 Total date columns found: {len(date_formats)}")
         
-        return df_result
+        return df
     
     # =================================================================
     # DETECTION FUNCTIONS (3 methods - Manager Requirements)
     # =================================================================
     
+    @_timed('probe')
     def detect_format(self, source: str) -> str:
         """
         1/3 Format detection with manager priorities (README requirement)
         
         Returns: 'csv' (95%), 'excel' (80%), 'json' (70%)
         """
-        path = Path(source)
-        suffix = path.suffix.lower()
-        
-        # Manager priority mapping
-        format_map = {
-            '.csv': 'csv',    # 95% priority - CRITICAL
-            '.tsv': 'csv',    # 95% priority - CRITICAL  
-            '.txt': 'csv',    # 95% priority - CRITICAL
-            '.xlsx': 'excel', # 80% priority - HIGH
-            '.xls': 'excel',  # 80% priority - HIGH
-            '.json': 'json'   # 70% priority - MEDIUM
-        }
-        
-        detected = format_map.get(suffix, 'csv')  # Default to CSV (95% priority)
+        detected = self.probe(source).detected_format
         
         if self.verbose:
             print(f"🔍 Format detected: {detected}")
         
         return detected
     
+    @_timed('probe')
     def detect_encoding(self, source: str) -> str:
         """
         2/3 Encoding detection (README: CRITICAL for CSV)
         
         Manager priority: Essential for 95% critical CSV format
         """
-        encodings_to_try = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+        encoding = self.probe(source).encoding
         
-        for encoding in encodings_to_try:
-            try:
-                with open(source, 'r', encoding=encoding) as f:
-                    f.read(1024)  # Test read
-                
-                if self.verbose:
-                    print(f"🔤 Encoding detected: {encoding}")
-                
-                return encoding
-            except UnicodeDecodeError:
-                continue
+        if self.verbose:
+            print(f"🔤 Encoding detected: {encoding}")
         
-        return 'utf-8'  # Fallback
+        return encoding
     
+    @_timed('probe')
     def sniff_csv_params(self, source: str) -> Dict[str, Any]:
         """
         3/3 CSV parameter sniffing (README requirement)
         
-        Returns detected CSV parameters for 95% critical format
+        Returns detected CSV parameters for 95% critical format, including
+        the decimal/thousands separators sniffed from the head (number_format
+        holds the per-column decisions, see number_parsing.py)
         """
-        encoding = self.detect_encoding(source)
-        delimiter = self._sniff_delimiter(Path(source), encoding)
+        probe = self.probe(source)
+        number_format = _head_number_format(probe)
         
         params = {
-            'delimiter': delimiter,
-            'encoding': encoding,
-            'has_header': True  # Simplified for demo
+            'delimiter': probe.delimiter,
+            'encoding': probe.encoding,
+            'quote_char': probe.quote_char,
+            'has_header': probe.has_header,
+            'decimal': number_format.decimal,
+            'thousands': number_format.thousands,
+            'number_format': number_format
         }
         
         if self.verbose:
-            print(f"📋 CSV parameters: delimiter='{delimiter}', encoding={encoding}")
+            print(f"📋 CSV parameters: delimiter='{probe.delimiter}', encoding={probe.encoding}")
+            if number_format.read_kwargs() or number_format.convert:
+                print(f"   🔢 Numbers: decimal='{number_format.decimal}', "
+                      f"thousands={number_format.thousands!r}, {len(number_format.convert)} columns converted")
         
         return params
     
+    def probe(self, source: str) -> SourceProbe:
+        """
+        Single-pass source probe shared by all detectors
+        
+        Reads the head bytes once and caches format, encoding, delimiter,
+        quote char and header per (path, size, mtime). Compressed sources are
+        probed on their decompressed head.
+        """
+        return probe_source(source, compression=self._compression.get(str(source), 'infer'))
+
+    @_timed('probe')
+    def inspect_excel(self, source: str) -> ExcelParams:
+        """
+        Sheet names and dimensions of a workbook from a single read-only open
+
+        Returns ExcelParams with available_sheets, sheet_shapes (rows, columns)
+        and recommended_sheet (the sheet with the most columns)
+        """
+        with self._open(source, seekable=True) as src:
+            params = inspect_workbook(src)
+
+        if self.verbose:
+            print(f"   📋 Available sheets: {params.sheet_shapes}")
+
+        return params
+
+    @_timed('probe')
+    def inspect_json(self, source: str) -> JsonParams:
+        """
+        JSON structure from the probe head, without parsing the document
+
+        Overpass API responses get structure_type 'overpass', record_path
+        'elements' and an estimated_records extrapolated from the complete
+        elements in the head sample.
+        """
+        probe = self.probe(source)
+        text = probe.text.lstrip()
+
+        if is_overpass(text):
+            params = JsonParams(record_path=OVERPASS_RECORD_KEY, structure_type='overpass')
+            params.estimated_records = estimate_records(probe.head, probe.data_size_bytes,
+                                                        probe.encoding, OVERPASS_RECORD_KEY)
+        elif text.startswith('['):
+            params = JsonParams(structure_type='array_of_objects')
+            params.estimated_records = estimate_records(probe.head, probe.data_size_bytes, probe.encoding)
+        else:
+            params = JsonParams(structure_type='nested' if text.startswith('{') else 'unknown')
+
+        if self.verbose:
+            print(f"   🗂️ JSON structure: {params.structure_type}, "
+                  f"~{params.estimated_records or '?'} records")
+
+        return params
+
+    @_timed('probe')
+    def inspect_geospatial(self, source: str,
+                           layer: Optional[Union[str, int]] = None) -> GeoParams:
+        """
+        Layer metadata of a geospatial file without reading any features
+
+        Returns GeoParams with available_layers, crs, geometry_type,
+        feature_count and total_bounds
+        """
+        params = inspect_layer(self._gdal_source(source), layer=layer)
+
+        if self.verbose:
+            print(f"   🗺️ Layer '{params.layer}': {params.feature_count} {params.geometry_type} "
+                  f"features, CRS {params.crs}")
+
+        return params
+
     # =================================================================
     # PERFORMANCE & REPORTING (3 methods - Manager Requirements)
     # =================================================================
     
-    def estimate_memory_usage(self, source: str) -> Dict[str, float]:
+    @_timed('probe')
+    def estimate_memory_usage(self, source: str, *, sample_bytes: int = 1024 * 1024,
+                              n_ranges: int = 8) -> Dict[str, Any]:
         """
         Performance method (README requirement)
         
-        Memory estimation before loading
+        Memory estimation before loading. For CSV files, n_ranges byte ranges
+        spread over the file (sample_bytes in total) are parsed and their deep
+        bytes per row measured; the row count is extrapolated from the average
+        line length. Files smaller than the sample are parsed exactly. Other
+        formats fall back to a file-size heuristic.
+        
+        Compressed CSVs cannot be read at offsets, so the decompressed probe
+        head is parsed instead ('head') and extrapolated to the uncompressed
+        size recorded by zip/gzip, or estimated from the head's compression
+        ratio for bz2/xz/zstd.
+        
+        Returns dict with file_size_mb, estimated_memory_mb, estimated_rows,
+        bytes_per_row, method ('exact'/'sampled'/'head'/'heuristic'),
+        can_load_in_memory and recommended_chunksize (None if not needed)
         """
-        file_size = Path(source).stat().st_size / (1024 * 1024)  # MB
-        estimated_memory = file_size * 2.5  # Rough estimation
+        import io
+        import pandas as pd
+        
+        probe = self.probe(source)
+        file_size = probe.size_bytes
+        data_size = probe.data_size_bytes  # decompressed, equal to file_size for plain files
+        estimated_rows, bytes_per_row, method = None, None, 'heuristic'
+        
+        if probe.detected_format == 'csv' and not probe.encoding.startswith('utf-16'):
+            read_kwargs = {'encoding': probe.encoding, 'sep': probe.delimiter,
+                           'quotechar': probe.quote_char, **_head_number_format(probe).read_kwargs()}
+            if data_size <= sample_bytes:
+                with self._open(source) as src:
+                    sample = pd.read_csv(src, **read_kwargs)
+                data_bytes, method = data_size, 'exact'
+            elif probe.compression is not None:
+                columns = pd.read_csv(io.BytesIO(probe.head), nrows=0, **read_kwargs).columns
+                block = probe.head[header_end(probe.head):probe.head.rfind(b'\n') + 1]
+                data_bytes = len(block)
+                sample = pd.read_csv(io.BytesIO(block), header=None, names=columns,
+                                     index_col=False, on_bad_lines='skip', **read_kwargs)
+                method = 'head'
+            else:
+                columns = pd.read_csv(source, nrows=0, **read_kwargs).columns
+                data_start = header_end(probe.head)
+                offsets = stratified_offsets(data_start, file_size, n_ranges)
+                blocks = read_aligned_ranges(source, offsets, sample_bytes // n_ranges)
+                data_bytes = sum(len(block) for block in blocks)
+                sample = pd.read_csv(io.BytesIO(b''.join(blocks)), header=None, names=columns,
+                                     index_col=False, on_bad_lines='skip', **read_kwargs)
+                method = 'sampled'
+            
+            if len(sample):
+                bytes_per_row = float(sample.memory_usage(deep=True).sum()) / len(sample)
+                if method == 'exact':
+                    estimated_rows = len(sample)
+                else:
+                    avg_line_bytes = data_bytes / len(sample)
+                    estimated_rows = int((data_size - header_end(probe.head)) / avg_line_bytes)
+        
+        if estimated_rows is not None:
+            estimated_memory = estimated_rows * bytes_per_row / (1024 * 1024)
+        else:
+            estimated_memory = data_size / (1024 * 1024) * 2.5  # Rough estimation
+        
+        # Chunks take a tenth of the budget (64MB without one)
+        budget_mb = self.max_memory_usage_gb * 1024 if self.max_memory_usage_gb else None
+        limit_mb = budget_mb if budget_mb else 100
+        recommended_chunksize = None
+        if estimated_memory > limit_mb:
+            if bytes_per_row:
+                chunk_mb = budget_mb / 10 if budget_mb else 64
+                recommended_chunksize = max(1000, int(chunk_mb * 1024 * 1024 / bytes_per_row))
+            else:
+                recommended_chunksize = 10000
         
         estimate = {
-            'file_size_mb': file_size,
+            'file_size_mb': file_size / (1024 * 1024),
             'estimated_memory_mb': estimated_memory,
-            'recommended_chunksize': 10000 if estimated_memory > 100 else None
+            'estimated_rows': estimated_rows,
+            'bytes_per_row': bytes_per_row,
+            'method': method,
+            'can_load_in_memory': budget_mb is None or estimated_memory <= budget_mb,
+            'recommended_chunksize': recommended_chunksize
         }
         
         if self.verbose:
-            print(f"💾 File size: {file_size:.1f}MB, estimated memory: {estimated_memory:.1f}MB")
+            print(f"💾 File size: {estimate['file_size_mb']:.1f}MB, "
+                  f"estimated memory: {estimated_memory:.1f}MB ({method})")
         
         return estimate
     
-    def build_report(self, source: str, df: Optional['pd.DataFrame'] = None) -> LoadReport:
+    @_instrumented
+    def build_report(self, source: str, df: Optional['pd.DataFrame'] = None, *,
+                     sample_rows: Optional[int] = None, sample_method: str = 'random_offsets',
+                     **load_kwargs) -> LoadReport:
         """
         Comprehensive reporting (README requirement)
         
-        Returns detailed load report as specified in README
+        Returns detailed load report as specified in README. Without df the
+        source is loaded with load_kwargs (e.g. columns/filters). With
+        sample_rows, only a load_sample() of that many rows is loaded and
+        profiled, so reports on multi-GB CSVs take well under a second;
+        total_rows is then estimated from the bytes per sampled row.
         """
         import pandas as pd
         
@@ -397,57 +1338,96 @@ class SmartAutoDataLoader:
         start_time = time.time()
         
         # Load data if not provided
+        total_rows = None
+        datetime_conversion = {}
+        load_engine = 'N/A'
+        memory_optimization = {}
+        pushdown = {}
+        sample = {}
+        bad_lines = {}
+        number_format = {}
+        sketch = None
         if df is None:
             try:
-                df = self.load(source)
+                if sample_rows:
+                    df = self.load_sample(source, sample_rows, sample_method, **load_kwargs)
+                    sample = self._last_load['sample']
+                    total_rows = sample['estimated_total_rows']
+                else:
+                    df = self.load(source, **load_kwargs)
+                if not isinstance(df, pd.DataFrame):
+                    # Streamed over the memory budget: keep the first chunk for the schema
+                    # and sketch the quality of every chunk on the way
+                    sketch = QualitySketch()
+                    df, total_rows = self._consume_chunks(df, sketch)
                 loading_time = time.time() - start_time
                 success = True
                 errors = []
                 warnings = []
+                datetime_conversion = self._last_load.get('datetime_stats', {})
+                load_engine = self._last_load.get('engine', 'N/A')
+                memory_optimization = self._last_load.get('memory_optimization', {})
+                pushdown = self._last_load.get('pushdown', {})
+                bad_lines = self._last_load.get('bad_lines', {})
+                number_format = self._last_load.get('number_format', {})
+                if bad_lines.get('bad_rows'):
+                    warnings.append(f"{bad_lines['bad_rows']} malformed rows dropped "
+                                    f"({bad_lines['recovery_percentage']:.2f}% recovered)")
+                for col, dtype in self._last_load.get('widened_to_object', {}).items():
+                    warnings.append(f"'{col}' read as object: a later chunk does not fit {dtype}")
             except Exception as e:
                 loading_time = time.time() - start_time
                 success = False
                 errors = [str(e)]
                 warnings = []
+                bad_lines = self._last_load.get('bad_lines', {})
                 df = pd.DataFrame()  # Empty DataFrame for failed loads
+                sketch = None
         else:
             loading_time = 0
             success = True
             errors = []
             warnings = []
         
-        # Detect date columns and formats
-        date_columns_found = self.detect_time_columns(df)
-        date_formats_detected = {}
-        
-        for col in date_columns_found:
-            if 'datetime' in str(df[col].dtype).lower():
-                date_formats_detected[col] = str(df[col].dtype)
-        
-        # Build column info
-        column_info = {}
-        for col in df.columns:
-            column_info[col] = str(df[col].dtype)
-        
-        # Calculate quality score
-        quality_score = 100
-        if errors:
-            quality_score -= 50
-        if warnings:
-            quality_score -= len(warnings) * 10
-        if df.empty:
-            quality_score = 0
+        with self._phases.phase('quality_analysis'):
+            # Detect date columns and formats
+            date_columns_found = self.detect_time_columns(df)
+            date_formats_detected = {}
+            
+            for col in date_columns_found:
+                if _is_datetime_dtype(df[col].dtype):
+                    date_formats_detected[col] = str(df[col].dtype)
+            
+            # Build column info
+            column_info = {}
+            for col in df.columns:
+                column_info[col] = str(df[col].dtype)
+            
+            # Quality score from the sketch (completeness and uniqueness), minus load issues
+            if sketch is None:
+                sketch = sketch_frame(df)
+            data_quality = sketch.to_report()
+            quality_score = round(data_quality.quality_score)
+            if errors:
+                quality_score -= 50
+            if warnings:
+                quality_score -= len(warnings) * 10
+            if df.empty:
+                quality_score = 0
+            
+            quality_score = max(0, min(100, quality_score))
         
-        quality_score = max(0, min(100, quality_score))
+        probe = self.probe(source) if Path(split_member(source)[0]).exists() else None
+        is_csv = probe is not None and probe.detected_format == 'csv'
         
         report = LoadReport(
             file_path=str(source),
-            file_size_mb=path.stat().st_size / (1024 * 1024) if path.exists() else 0,
-            detected_format=self.detect_format(source),
-            detected_encoding=self.detect_encoding(source) if self.detect_format(source) == 'csv' else 'N/A',
-            detected_delimiter=self._sniff_delimiter(path, self.detect_encoding(source)) if self.detect_format(source) == 'csv' else 'N/A',
+            file_size_mb=probe.size_bytes / (1024 * 1024) if probe else 0,
+            detected_format=probe.detected_format if probe else 'N/A',
+            detected_encoding=probe.encoding if is_csv else 'N/A',
+            detected_delimiter=probe.delimiter if is_csv else 'N/A',
             has_header=len(df.columns) > 0 and not df.columns[0].startswith('Unnamed'),
-            total_rows=len(df),
+            total_rows=total_rows if total_rows is not None else len(df),
             total_columns=len(df.columns),
             column_info=column_info,
             date_columns_found=date_columns_found,
@@ -456,7 +1436,19 @@ class SmartAutoDataLoader:
             quality_score=quality_score,
             warnings=warnings,
             errors=errors,
-            success=success
+            success=success,
+            datetime_conversion=datetime_conversion,
+            load_engine=load_engine,
+            processing_speed_rows_per_sec=(len(df) if sample else total_rows or len(df)) / loading_time
+                                          if loading_time > 0 else 0.0,
+            memory_optimization=memory_optimization,
+            pushdown=pushdown,
+            compression=probe.compression if probe else None,
+            sample=sample,
+            bad_lines=bad_lines,
+            number_format=number_format,
+            phase_timings=self._phases.timings(),
+            data_quality=data_quality
         )
         
         if self.verbose:
@@ -464,17 +1456,18 @@ class SmartAutoDataLoader:
         
         return report
     
-    def detect_time_columns(self, df: 'pd.DataFrame') -> List[str]:
+    def detect_time_columns(self, df: 'pd.DataFrame', *, sample_size: int = 100,
+                            min_parse_rate: float = 0.5) -> List[str]:
         """
         Time column detection (README requirement)
         
-        Returns list of columns containing datetime data
+        Returns list of columns containing datetime data: columns that are
+        already datetime typed plus text columns whose sampled values match
+        a date pattern at min_parse_rate or better
         """
-        time_columns = []
-        
-        for col in df.columns:
-            if 'datetime' in str(df[col].dtype).lower():
-                time_columns.append(col)
+        time_columns = [col for col in df.columns if _is_datetime_dtype(df[col].dtype)]
+        time_columns += list(self._detect_date_formats(df, sample_size=sample_size,
+                                                       min_parse_rate=min_parse_rate))
         
         if self.verbose:
             if time_columns:
@@ -488,19 +1481,872 @@ class SmartAutoDataLoader:
     # HELPER METHODS (Internal)
     # =================================================================
     
-    def _sniff_delimiter(self, path: Path, encoding: str) -> str:
-        """Internal: Sniff CSV delimiter"""
-        try:
-            with open(path, 'r', encoding=encoding) as f:
-                first_line = f.readline()
+    @_timed('datetime_parsing')
+    def _detect_date_formats(self, df: 'pd.DataFrame', sample_size: int = 100,
+                             min_parse_rate: float = 0.5) -> Dict[str, str]:
+        """
+        Internal: Map text columns that look like dates to their format
+        
+        The non-null samples of all text columns are stacked into one Series,
+        so each date pattern costs a single vectorized Series.str.match call
+        regardless of how wide the frame is.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        samples = self._sample_text_columns(df, sample_size)
+        if not samples:
+            return {}
+        
+        positions = list(samples)
+        lengths = np.array([len(samples[pos]) for pos in positions])
+        codes = np.repeat(np.arange(len(positions)), lengths)
+        stacked = pd.Series(np.concatenate([samples[pos] for pos in positions])).astype(str)
+        
+        date_formats = {}
+        undecided = np.ones(len(positions), dtype=bool)
+        
+        # Check each date pattern; the first one reaching min_parse_rate wins
+        for pattern, date_format in self.date_patterns:
+            hits = stacked.str.match(pattern).to_numpy(dtype=float)
+            rates = np.bincount(codes, weights=hits, minlength=len(positions)) / lengths
+            for i in np.flatnonzero(undecided & (rates >= min_parse_rate)):
+                col = df.columns[positions[i]]
+                date_formats[col] = date_format
+                undecided[i] = False
+        
+        return date_formats
+    
+    def _sample_text_columns(self, df: 'pd.DataFrame', sample_size: int) -> Dict[int, Any]:
+        """
+        Internal: Up to sample_size non-null values per text column
+        
+        Returns {column position: object ndarray}. Each column is scanned in
+        growing windows from the top, so dense columns only touch their head
+        and only sparse columns are scanned further.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        samples = {}
+        for pos, (_, series) in enumerate(df.items()):
+            if not _is_text_dtype(series.dtype):
+                continue  # Text columns only
             
-            delimiters = [',', ';', '\t', '|']
-            counts = {d: first_line.count(d) for d in delimiters}
-            return max(counts, key=counts.get) if max(counts.values()) > 0 else ','
-        except:
-            return ','
-
-
+            values = series.to_numpy()
+            window = sample_size
+            while True:
+                found = np.flatnonzero(pd.notna(values[:window]))
+                if len(found) >= sample_size or window >= len(values):
+                    break
+                window *= 4
+            
+            if len(found):
+                samples[pos] = values[found[:sample_size]]
+        
+        return samples
+    
+    @_timed('datetime_parsing')
+    def _apply_date_formats(self, df: 'pd.DataFrame',
+                            date_formats: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Internal: Convert detected date columns in place
+        
+        Low-cardinality columns are parsed once per distinct value
+        (to_datetime_memoized); returns the conversion stats per column.
+        """
+        stats = {}
+        for col, date_format in date_formats.items():
+            if col in df.columns:
+                df[col], stats[col] = to_datetime_memoized(df[col], format=date_format, errors='coerce')
+                if self.verbose and stats[col]['memoized']:
+                    print(f"   ⚡ '{col}': parsed {stats[col]['unique_parsed']} unique values "
+                          f"for {stats[col]['rows']} rows")
+        return stats
+    
+    @_timed('number_parsing')
+    def _convert_numbers(self, df: 'pd.DataFrame',
+                         number_format: NumberFormat) -> Dict[str, Dict[str, Any]]:
+        """
+        Internal: Convert the number columns read_csv left as text, in place
+        
+        Covers the columns the format reads as text on purpose and number
+        columns whose later rows did not parse (a "-" for no value); returns
+        the to_numeric_localized stats per converted column.
+        """
+        import pandas as pd
+        
+        stats = {}
+        for col, (decimal, thousands) in {**number_format.styles, **number_format.convert}.items():
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col].dtype):
+                df[col], stats[col] = to_numeric_localized(df[col], decimal, thousands)
+                if self.verbose and stats[col]['unparsed']:
+                    print(f"   ⚠️ '{col}': {stats[col]['unparsed']} values are not numbers, set to NaN")
+        return stats
+    
+    def _add_converted(self, stats: Dict[str, Dict[str, Any]]) -> None:
+        """Internal: Add per-chunk _convert_numbers stats to the load's row/unparsed totals"""
+        converted = self._last_load.setdefault('number_format', {}).setdefault('converted', {})
+        for col, col_stats in stats.items():
+            totals = converted.setdefault(col, {'rows': 0, 'unparsed': 0})
+            totals['rows'] += col_stats['rows']
+            totals['unparsed'] += col_stats['unparsed']
+    
+    def _engine_number_format(self, number_format: NumberFormat, engine_kwargs: Dict[str, Any],
+                              read_kwargs: Dict[str, Any]) -> NumberFormat:
+        """
+        Internal: Fit a sniffed number format to the read_csv engine, in place on read_kwargs
+        
+        Arrow has no thousands option, so the grouped columns are left to
+        _convert_numbers. The Python engine converts value by value, leaving
+        a mix of floats and text when a "-" turns up below the head, so every
+        number column is read as text and converted; filters compare them
+        after that conversion (_filter_numbers).
+        """
+        engine = engine_kwargs.get('engine')
+        if engine == 'pyarrow' and 'thousands' in read_kwargs:
+            number_format = number_format.without_thousands()
+            del read_kwargs['thousands']
+            self._last_load['number_format'] = {**asdict(number_format), 'converted': {}}
+        if engine == 'python' and number_format.styles:
+            read_kwargs['dtype'] = dict.fromkeys(number_format.styles, 'object')
+        return number_format
+    
+    def _load_with_profile(self, source: str) -> Optional['pd.DataFrame']:
+        """
+        Internal: Typed load from a stored load profile
+        
+        Returns None when there is no profile or the file drifted (format,
+        encoding, delimiter or header changed, or the stored dtypes no longer
+        fit), so the caller falls back to full detection.
+        """
+        import pandas as pd
+        
+        profile = read_profile(source, self._profile_strategy())
+        if profile is None:
+            return None
+        
+        with self._phases.phase('probe'):
+            probe = self.probe(source)
+        number_format = NumberFormat(**profile.number_format)
+        # float32 fit the stored file exactly, not necessarily this one: checked again after the read
+        dtypes = {col: dtype for col, dtype in profile.dtypes.items()
+                  if col not in profile.date_formats and not dtype.startswith('datetime')
+                  and col not in number_format.convert and dtype != 'float32'}
+        
+        try:
+            if profile.detected_format == 'csv':
+                header = parse_header_line(probe.first_line, profile.delimiter, profile.quote_char)
+                drifted = (probe.detected_format != 'csv' or probe.encoding != profile.encoding
+                           or header != profile.header)
+                if drifted:
+                    df = None
+                else:
+                    engine_kwargs = self._csv_engine_kwargs()
+                    read_kwargs = number_format.read_kwargs()
+                    number_format = self._engine_number_format(number_format, engine_kwargs, read_kwargs)
+                    dtypes = {col: dtype for col, dtype in dtypes.items() if col not in number_format.convert}
+                    dtypes.update(read_kwargs.pop('dtype', {}))
+                    with self._phases.phase('parse'), self._open(source) as src:
+                        df = pd.read_csv(src, encoding=profile.encoding, sep=profile.delimiter,
+                                         quotechar=profile.quote_char, dtype=dtypes,
+                                         usecols=list(range(len(profile.header))),
+                                         **read_kwargs, **engine_kwargs)
+            elif profile.detected_format == 'excel' and probe.detected_format == 'excel':
+                with self._phases.phase('parse'), self._open(source, seekable=True) as src:
+                    df = pd.read_excel(src, sheet_name=profile.sheet_name, dtype=dtypes)
+                if [str(col) for col in df.columns] != profile.header:
+                    df = None
+            else:
+                df = None
+        except (ValueError, TypeError, KeyError):
+            df = None
+        
+        if df is None:
+            if self.verbose:
+                print("   ⚠️ Load profile does not match the file anymore, running full detection")
+            return None
+        
+        converted = self._convert_numbers(df, number_format)
+        datetime_stats = self._apply_date_formats(df, profile.date_formats)
+        if self.load_strategy is LoadStrategy.MEMORY_EFFICIENT:
+            downcast_floats(df)
+        self._last_load = {'encoding': profile.encoding, 'delimiter': profile.delimiter,
+                           'quote_char': profile.quote_char, 'sheet_name': profile.sheet_name,
+                           'date_formats': profile.date_formats, 'datetime_stats': datetime_stats,
+                           'number_format': {**asdict(number_format), 'converted': converted}}
+        if profile.detected_format == 'csv':
+            self._last_load['engine'] = engine_kwargs.get('engine', 'c')
+        
+        if self.verbose:
+            print(f"♻️ Reused load profile '{profile.family}': {len(df)} rows, {len(df.columns)} columns")
+        
+        return df
+    
+    def _profile_strategy(self) -> Optional[str]:
+        """Internal: Load strategy a profile is stored under (stored dtypes differ per strategy)"""
+        return self.load_strategy.value if self.load_strategy is not None else None
+    
+    def _save_profile(self, source: str, detected_format: str, df: 'pd.DataFrame') -> None:
+        """Internal: Persist the detection results of a successful load"""
+        if df.empty:
+            return
+        
+        if detected_format == 'csv':
+            header = parse_header_line(self.probe(source).first_line,
+                                       self._last_load['delimiter'], self._last_load['quote_char'])
+            if len(header) != len(df.columns):
+                return
+        else:
+            header = [str(col) for col in df.columns]
+        
+        profile = LoadProfile(
+            family=family_name(source),
+            detected_format=detected_format,
+            header=header,
+            dtypes={str(col): str(dtype) for col, dtype in df.dtypes.items()},
+            date_formats=self._last_load.get('date_formats', {}),
+            encoding=self._last_load.get('encoding'),
+            delimiter=self._last_load.get('delimiter'),
+            quote_char=self._last_load.get('quote_char'),
+            sheet_name=self._last_load.get('sheet_name'),
+            number_format={key: value for key, value in self._last_load.get('number_format', {}).items()
+                           if key != 'converted'},
+            load_strategy=self._profile_strategy(),
+        )
+        
+        try:
+            sidecar = write_profile(source, profile)
+            if self.verbose:
+                print(f"   💾 Load profile saved: {sidecar.name}")
+        except OSError as e:
+            if self.verbose:
+                print(f"   ⚠️ Could not save load profile: {e}")
+    
+    def _resolve_geo_kwargs(self, source: str, kind: str, kwargs: Dict[str, Any]) -> None:
+        """
+        Internal: Fit the geospatial load() arguments to the source format, in place
+        
+        A bbox on a tabular source becomes bbox_filters on its coordinate
+        columns (coordinate_columns of the CSV header, else lon/lat);
+        arguments the format has no use for raise ValueError.
+        """
+        if 'bbox' in kwargs and kind not in GEO_FORMATS:
+            probe = self.probe(source)
+            detected_format = probe.detected_format if kind == 'auto' else kind
+            if detected_format not in GEO_FORMATS:
+                header = (parse_header_line(probe.first_line, probe.delimiter, probe.quote_char)
+                          if detected_format in ('csv', 'tsv') else [])
+                x, y = coordinate_columns(header)
+                kwargs['filters'] = [*(kwargs.get('filters') or []),
+                                     *bbox_filters(kwargs.pop('bbox'), x=x, y=y)]
+        
+        geo_only = [name for name in ('layer', 'bbox', 'geometry') if name in kwargs]
+        split = [name for name in ('chunksize', 'parallel') if kwargs.get(name)]
+        if not geo_only and not (split and kind in ('auto', *GEO_FORMATS)):
+            return
+        
+        detected_format = self.probe(source).detected_format if kind == 'auto' else kind
+        if detected_format in GEO_FORMATS and split:
+            raise ValueError(f"{'/'.join(split)} is not supported for geospatial layers ({detected_format}), "
+                             f"narrow the read with bbox, columns or filters instead")
+        if detected_format not in GEO_FORMATS and geo_only:
+            raise ValueError(f"{'/'.join(geo_only)} only apply to geospatial layers, not {detected_format}")
+    
+    def _check_memory_budget(self, source: str) -> Optional[int]:
+        """
+        Internal: Enforce max_memory_usage_gb before a load
+        
+        Returns a chunksize when the CSV should be streamed instead, None when
+        it fits; raises LoadingMemoryError when streaming is not an option.
+        """
+        estimate = self.estimate_memory_usage(source)
+        if estimate['can_load_in_memory']:
+            return None
+        
+        message = (f"Estimated memory {estimate['estimated_memory_mb']:.0f}MB exceeds "
+                   f"max_memory_usage_gb={self.max_memory_usage_gb}")
+        if self.on_memory_limit != 'chunk' or not self._can_stream(source):
+            raise LoadingMemoryError(message)
+        
+        if self.verbose:
+            print(f"   ⚠️ {message}, streaming in chunks of {estimate['recommended_chunksize']} rows")
+        return estimate['recommended_chunksize']
+    
+    def _can_stream(self, source: str) -> bool:
+        """Internal: CSVs and Overpass JSON documents can be loaded in chunks"""
+        probe = self.probe(source)
+        if probe.detected_format == 'json':
+            return is_overpass(probe.text)
+        return probe.detected_format == 'csv'
+    
+    def _set_compression(self, source: str, compression: Optional[str]) -> None:
+        """Internal: Remember an explicit compression for a source ('infer' forgets it)"""
+        if compression == 'infer':
+            self._compression.pop(str(source), None)
+        else:
+            self._compression[str(source)] = compression
+    
+    def _open(self, source: str, seekable: bool = False) -> ContextManager[Union[str, BinaryIO]]:
+        """
+        Internal: What to pass to a pandas reader for a source
+        
+        The path itself for plain files, a decompressing stream for compressed
+        files and zip members (opened afresh on every call, so each read
+        starts at the beginning of the data). seekable=True buffers it in memory.
+        """
+        probe = self.probe(source)
+        if probe.compression is None:
+            return open_source(source)
+        return self._phases.decoding(open_source(probe.path, probe.member, probe.compression,
+                                                 seekable=seekable))
+    
+    def _gdal_source(self, source: str) -> str:
+        """Internal: Path for GDAL, /vsizip/ and /vsigzip/ for archived layers"""
+        probe = self.probe(source)
+        if probe.compression is None:
+            return source
+        vsi_path = gdal_path(probe.path, probe.member, probe.compression)
+        if vsi_path is None:
+            raise ValueError(f"GDAL cannot stream {probe.compression} files, "
+                             f"decompress {source} first or use gzip/zip")
+        return vsi_path
+    
+    def _csv_engine_kwargs(self, streaming: bool = False) -> Dict[str, Any]:
+        """
+        Internal: read_csv engine options for the configured load strategy
+        
+        The Arrow reader cannot stream in chunks and needs pyarrow installed;
+        otherwise the C engine is used.
+        """
+        strategy = self.load_strategy
+        
+        if strategy is LoadStrategy.ROBUST:
+            return {'engine': 'python', 'on_bad_lines': 'warn'}
+        
+        if strategy is LoadStrategy.PERFORMANCE and not streaming:
+            try:
+                import pyarrow  # noqa: F401
+                return {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}
+            except ImportError:
+                if self.verbose:
+                    print("   ⚠️ pyarrow not installed, using the C engine")
+        
+        return {}
+    
+    def _read_csv_optimized(self, source: str, sample_rows: int = 10000,
+                            filters: Optional[List[Filter]] = None,
+                            numbers: Optional[NumberFormat] = None,
+                            **read_kwargs) -> Tuple['pd.DataFrame', 'pd.DataFrame']:
+        """
+        Internal: Read a CSV with compact dtypes planned from its head (MEMORY_EFFICIENT)
+        
+        The plan (category/Int32/boolean, see plan_dtypes) is passed to
+        read_csv, so wide object/int64 columns are never built. If the rest
+        of the file does not fit the plan, it is read again with only the
+        categorical part of the plan. Float columns become float32 after the
+        parse, where every row fits exactly (downcast_floats). Returns
+        (frame, sample).
+        """
+        import pandas as pd
+        
+        with self._phases.phase('parse'), self._open(source) as src:
+            sample = pd.read_csv(src, nrows=sample_rows, **read_kwargs)
+        with self._phases.phase('dtype_optimization'):
+            plan = plan_dtypes(sample, exclude=list(self._detect_date_formats(sample)))
+        
+        try:
+            df = self._read_csv(source, filters, numbers, dtype=plan, **read_kwargs)
+        except (ValueError, TypeError, OverflowError) as e:
+            if self.verbose:
+                print(f"   ⚠️ Planned dtypes do not fit the whole file ({e}), keeping categories only")
+            plan = safe_plan(plan)
+            df = self._read_csv(source, filters, numbers, dtype=plan, **read_kwargs)
+        with self._phases.phase('dtype_optimization'):
+            downcast = downcast_floats(df)
+        
+        if self.verbose and (plan or downcast):
+            print(f"   🗜️ Compact dtypes applied to {len(plan) + len(downcast)} columns")
+        
+        return df, sample
+    
+    @_timed('parse')
+    def _read_csv(self, source: str, filters: Optional[List[Filter]],
+                  numbers: Optional[NumberFormat] = None, **read_kwargs) -> 'pd.DataFrame':
+        """
+        Internal: pd.read_csv that applies row filters while parsing
+        
+        The C/Python engines parse in PUSHDOWN_CHUNKSIZE-row chunks and keep
+        only the matching rows of each; the Arrow reader cannot stream, so its
+        frame is filtered once. Text number columns of `numbers` that a filter
+        compares are converted first (_filter_numbers). Rows scanned go to
+        _last_load['rows_scanned'].
+        """
+        import pandas as pd
+        
+        if not filters:
+            with self._open(source) as src:
+                return pd.read_csv(src, **read_kwargs)
+        
+        if read_kwargs.get('engine') == 'pyarrow':
+            with self._open(source) as src:
+                df = pd.read_csv(src, **read_kwargs)
+            self._last_load['rows_scanned'] = len(df)
+            df, stats = _filter_numbers(df, filters, numbers)
+            self._add_converted(stats)
+            return df.reset_index(drop=True)
+        
+        parts, scanned = [], 0
+        with self._open(source) as src, \
+                pd.read_csv(src, chunksize=PUSHDOWN_CHUNKSIZE, **read_kwargs) as reader:
+            for chunk in reader:
+                scanned += len(chunk)
+                chunk, stats = _filter_numbers(chunk, filters, numbers)
+                self._add_converted(stats)
+                parts.append(chunk)
+        
+        self._last_load['rows_scanned'] = scanned
+        return _concat_chunks(parts)
+    
+    @_timed('parse')
+    def _read_csv_parallel(self, source: str, parallel: int, filters: List[Filter],
+                           sample_rows: int = 10000, numbers: Optional[NumberFormat] = None,
+                           **read_kwargs) -> Optional[Tuple['pd.DataFrame', Optional['pd.DataFrame']]]:
+        """
+        Internal: Parse byte ranges of a CSV concurrently (load_csv(parallel=N))
+        
+        The ranges end at record boundaries outside quotes (record_boundaries).
+        One schema is fixed from the first sample_rows rows, as for streamed
+        chunks, so every range parses to the same dtypes; nullable integer and
+        boolean columns without missing values are narrowed back afterwards.
+        Returns (frame, sample) like _read_csv_optimized, or None when the
+        source cannot be split (compressed, UTF-16, Arrow engine, one range,
+        or a range that does not fit the schema) so the caller reads it serially.
+        """
+        import pandas as pd
+        
+        probe = self.probe(source)
+        if (probe.compression is not None or probe.encoding.startswith('utf-16')
+                or read_kwargs.get('engine') == 'pyarrow'):
+            if self.verbose:
+                print("   ⚠️ Parallel parsing needs an uncompressed 8-bit file and the C/Python engine, "
+                      "reading serially")
+            return None
+        
+        n_parts = min(parallel, max(1, probe.size_bytes // MIN_RANGE_BYTES))
+        data_start, boundaries = record_boundaries(source, n_parts, probe.quote_char)
+        if len(boundaries) < 3:
+            return None
+        
+        names = list(pd.read_csv(source, nrows=0, encoding=read_kwargs['encoding'],
+                                 sep=read_kwargs['sep'], quotechar=read_kwargs['quotechar']).columns)
+        head = pd.read_csv(source, nrows=sample_rows, **read_kwargs)
+        date_formats = self._detect_date_formats(head)
+        dtypes = self._infer_chunk_dtypes(head)
+        # Made nullable only so every range fits; the planner's choices are kept
+        widened = {col: dtype for col, dtype in dtypes.items() if dtype in ('Int64', 'boolean')}
+        if self.load_strategy is LoadStrategy.MEMORY_EFFICIENT:
+            with self._phases.phase('dtype_optimization'):
+                plan = plan_dtypes(head, exclude=list(date_formats))
+            dtypes.update(plan)
+            widened = {col: dtype for col, dtype in widened.items() if col not in plan}
+        for col in date_formats:
+            dtypes[col] = 'object'  # parse_datetimes() converts them after the concat
+        
+        starts, ends = boundaries[:-1], boundaries[1:]
+        workers = min(parallel, len(starts))
+        if self.verbose:
+            print(f"   🧵 Parsing {len(starts)} byte ranges with {workers} worker(s)")
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_read_csv_range, repeat(source), starts, ends, repeat(names),
+                                        repeat(filters), repeat(numbers),
+                                        repeat({**read_kwargs, 'dtype': dtypes})))
+        except (ValueError, TypeError, OverflowError) as e:
+            if self.verbose:
+                print(f"   ⚠️ A byte range does not fit the sampled schema ({e}), reading serially")
+            return None
+        
+        df = _concat_chunks([part for part, _, _ in results])
+        with self._phases.phase('dtype_optimization'):
+            _narrow_nullable(df, widened)
+            if self.load_strategy is LoadStrategy.MEMORY_EFFICIENT:
+                downcast_floats(df)
+        
+        for _, _, stats in results:
+            self._add_converted(stats)
+        if filters:
+            self._last_load['rows_scanned'] = sum(scanned for _, scanned, _ in results)
+        
+        sample = head if self.load_strategy is LoadStrategy.MEMORY_EFFICIENT else None
+        return df, sample
+    
+    @_timed('parse')
+    def _sample_csv_ranges(self, source: str, n: int, seed: Optional[int],
+                           columns: Optional[List[str]], filters: List[Filter],
+                           n_ranges: int = SAMPLE_RANGES) -> Tuple[Optional['pd.DataFrame'], Dict[str, Any]]:
+        """
+        Internal: load_sample(method='random_offsets') for a plain CSV
+    
+        Each range is sized from the average record length of the probe head
+        to hold n / n_ranges rows with some margin, and is parsed on its own,
+        so a range whose quote state was guessed wrong cannot spill into the
+        next. Surplus rows are dropped at random. Returns (None, {}) when the
+        ranges would cover a large part of the file anyway.
+        """
+        import io
+        import numpy as np
+        import pandas as pd
+    
+        params = self.sniff_csv_params(source)
+        self._last_load = dict(params)
+        read_kwargs = {'encoding': params['encoding'], 'sep': params['delimiter'],
+                       'quotechar': params['quote_char'], **params['number_format'].read_kwargs()}
+        names = list(pd.read_csv(source, nrows=0, **read_kwargs).columns)
+        usecols = read_columns(columns, filters)
+    
+        probe = self.probe(source)
+        data_start, _ = record_boundaries(source, 1, probe.quote_char)
+        head = probe.head[data_start:probe.head.rfind(b'\n') + 1]
+        head_rows = len(pd.read_csv(io.BytesIO(head), header=None, names=names, index_col=False,
+                                    on_bad_lines='skip', **read_kwargs)) if head else 0
+        avg_record_bytes = len(head) / head_rows if head_rows else len(probe.head)
+    
+        n_ranges = max(1, min(n_ranges, n))
+        range_bytes = int(n / n_ranges * avg_record_bytes * 1.25) + 1
+        if n_ranges * range_bytes * 2 > probe.size_bytes - data_start:
+            return None, {}
+    
+        offsets = random_offsets(data_start, probe.size_bytes, n_ranges, range_bytes, seed)
+        blocks = read_record_ranges(source, offsets, range_bytes, probe.quote_char, probe.delimiter)
+        parts = [pd.read_csv(io.BytesIO(block), header=None, names=names, index_col=False,
+                             usecols=usecols, on_bad_lines='skip', **read_kwargs) for block in blocks]
+        df = pd.concat(parts, ignore_index=True)
+    
+        bytes_read = sum(len(block) for block in blocks)
+        rows_read = len(df)
+        number_format = params['number_format']
+        df, converted = _filter_numbers(df, filters, number_format)
+        df = apply_pushdown(df, columns, [])
+        if len(df) > n:
+            keep = np.sort(np.random.default_rng(seed).choice(len(df), n, replace=False))
+            df = df.iloc[keep]
+        converted.update(self._convert_numbers(df, number_format))
+        self._last_load['number_format'] = {**asdict(number_format), 'converted': converted}
+        df = self.parse_datetimes(df)
+    
+        estimated_total_rows = (int((probe.size_bytes - data_start) * rows_read / bytes_read)
+                                if bytes_read else 0)
+        return df, {'bytes_read': bytes_read, 'estimated_total_rows': estimated_total_rows}
+    
+    def _record_pushdown(self, full_sample: 'pd.DataFrame', columns_read: int,
+                         rows_scanned: int, rows_kept: int, bytes_loaded: int) -> None:
+        """Internal: Store what column projection and row filters saved (see pushdown_stats)"""
+        full_bytes_per_row = (float(full_sample.memory_usage(deep=True).sum()) / len(full_sample)
+                              if len(full_sample) else 0.0)
+        stats = pushdown_stats(full_bytes_per_row, len(full_sample.columns), columns_read,
+                               rows_scanned, rows_kept, bytes_loaded)
+        self._last_load['pushdown'] = stats
+        
+        if self.verbose:
+            print(f"   ✂️ Pushdown: {stats['rows_kept']}/{stats['rows_scanned']} rows, "
+                  f"{stats['columns_read']}/{stats['columns_total']} columns, "
+                  f"~{stats['bytes_saved'] / (1024 * 1024):.1f}MB not loaded")
+    
+    @_timed('dtype_optimization')
+    def _memory_optimization_report(self, sample: 'pd.DataFrame',
+                                    df: 'pd.DataFrame') -> Dict[str, Dict[str, Any]]:
+        """Internal: Per-column bytes with default dtypes (extrapolated) vs. loaded dtypes"""
+        scale = len(df) / len(sample) if len(sample) else 0
+        before = column_bytes(sample)
+        after = column_bytes(df)
+        
+        return {
+            str(col): {
+                'dtype_before': str(sample[col].dtype),
+                'dtype_after': str(df[col].dtype),
+                'bytes_before': int(before[col] * scale),
+                'bytes_after': after[col],
+            }
+            for col in df.columns if col in before
+        }
+    
+    def _consume_chunks(self, chunks: Iterator['pd.DataFrame'],
+                        sketch: Optional[QualitySketch] = None) -> Tuple['pd.DataFrame', int]:
+        """Internal: Drain a chunk stream into sketch, returning (first chunk, total rows)"""
+        import pandas as pd
+        
+        first, total_rows = None, 0
+        for chunk in chunks:
+            if first is None:
+                first = chunk
+            total_rows += len(chunk)
+            if sketch is not None:
+                with self._phases.phase('quality_analysis'):
+                    sketch.update(chunk)
+        return (first if first is not None else pd.DataFrame()), total_rows
+    
+    @_timed('dtype_optimization')
+    def _infer_chunk_dtypes(self, head: 'pd.DataFrame') -> Dict[str, Any]:
+        """
+        Internal: Freeze the dtypes of a first chunk for the remaining stream
+        
+        Integer and boolean columns become nullable so later chunks with gaps
+        still fit, and columns that are empty in the first chunk stay text.
+        """
+        import pandas as pd
+        
+        dtypes = {}
+        for col in head.columns:
+            series = head[col]
+            if series.isna().all():
+                dtypes[col] = 'object'
+            elif pd.api.types.is_bool_dtype(series):
+                dtypes[col] = 'boolean'
+            elif pd.api.types.is_integer_dtype(series):
+                dtypes[col] = 'Int64'
+            else:
+                dtypes[col] = series.dtype
+        
+        return dtypes
+    
+    def _cast_chunk(self, chunk: 'pd.DataFrame', casts: Dict[str, Any], first_row: int) -> None:
+        """
+        Internal: Give a parsed chunk the number/boolean dtypes of the first chunk, in place
+        
+        A column whose values do not fit ("maybe" in a boolean column, text in
+        a number column) is dropped from casts and read as object from this
+        chunk on; it is listed in _last_load['widened_to_object'] with the
+        dtype it lost, and is no longer narrowed after a concat.
+        """
+        widened = self._last_load['widened_to_object']
+        for col, dtype in list(casts.items()):
+            if col not in chunk.columns:
+                continue
+            try:
+                chunk[col] = chunk[col].astype(dtype)
+            except (ValueError, TypeError, OverflowError):
+                del casts[col]
+                widened[col] = str(dtype)
+                self._last_load['widened'].pop(col, None)
+                if self.verbose:
+                    print(f"   ⚠️ '{col}' does not fit {dtype} from row {first_row + 1} on, "
+                          f"reading it as object")
+        for col in widened:
+            if col in chunk.columns:
+                chunk[col] = chunk[col].astype(object)
+    
+    def _iter_overpass_frames(self, source: str, batch_size: int,
+                              tags: Optional[List[str]],
+                              columns: Optional[List[str]] = None,
+                              filters: Optional[List[Filter]] = None) -> Iterator['pd.DataFrame']:
+        """
+        Internal: Overpass elements as DataFrames of at most batch_size rows
+        
+        With columns, only the tags among them (and the filter columns) are
+        flattened; filters drop rows batch by batch. If no row matches, one
+        empty frame with the columns is yielded.
+        """
+        import pandas as pd
+        
+        filters = filters or []
+        encoding = self.probe(source).encoding
+        pushdown = columns is not None or bool(filters)
+        if pushdown:
+            with self._open(source) as src:
+                full_sample = pd.DataFrame.from_records(
+                    next(iter_overpass_batches(src, encoding, batch_size=PUSHDOWN_SAMPLE_ROWS), []))
+            if tags is None and columns is not None:
+                tags = [col for col in read_columns(columns, filters) if col not in ELEMENT_COLUMNS]
+        
+        scanned = kept = loaded_bytes = 0
+        columns_read = 0
+        empty = None
+        with self._open(source) as src:
+            for batch in iter_overpass_batches(src, encoding, batch_size=batch_size, tags=tags):
+                frame = pd.DataFrame.from_records(batch)
+                if pushdown:
+                    scanned += len(frame)
+                    columns_read = max(columns_read, len(frame.columns))
+                    frame = apply_pushdown(frame, columns, filters).reset_index(drop=True)
+                    if frame.empty:
+                        empty = frame
+                        continue
+                    kept += len(frame)
+                    loaded_bytes += int(frame.memory_usage(deep=True).sum())
+                yield frame
+        
+        if not kept and empty is not None:
+            yield empty  # Nothing matched: still one frame with the columns
+        
+        if pushdown:
+            self._record_pushdown(full_sample, columns_read, scanned, kept, loaded_bytes)
+    
+    def _iter_json_chunks(self, frames: Iterator['pd.DataFrame']) -> Iterator['pd.DataFrame']:
+        """
+        Internal: Streamed JSON chunks with the date formats of the first chunk
+        
+        Columns of tags that first appear in a later chunk are kept as they are.
+        """
+        date_formats = None
+        total_rows = 0
+        for chunk in frames:
+            if date_formats is None:
+                date_formats = self._detect_date_formats(chunk)
+                self._last_load['date_formats'] = date_formats
+            self._apply_date_formats(chunk, date_formats)
+            total_rows += len(chunk)
+            yield chunk
+        
+        if self.verbose:
+            print(f"✅ JSON streamed: {total_rows} rows")
+    
+    def _iter_quarantined_chunks(self, src: Union[str, BinaryIO], quarantine: BadLineQuarantine,
+                                 chunksize: int, **read_kwargs) -> Iterator['pd.DataFrame']:
+        """
+        Internal: chunksize-row DataFrames of the good rows, bad rows quarantined
+        
+        The stream is parsed in blocks of whole records (iter_record_blocks) by
+        the C engine; the rows are regrouped into chunks numbered on as the
+        chunked reader numbers them. The quarantine stats land in
+        _last_load['bad_lines'], also when the load aborts.
+        """
+        import pandas as pd
+        
+        # Nullable columns are parsed as int/float/bool and cast per block,
+        # several times faster than parsing straight into Int64/boolean
+        dtypes = read_kwargs.pop('dtype', {})
+        nullable = {col: dtype for col, dtype in dtypes.items() if dtype in ('Int64', 'boolean')}
+        dtypes = {col: dtype for col, dtype in dtypes.items() if col not in nullable}
+        
+        pending, pending_rows, emitted = [], 0, 0
+        try:
+            with (open(src, 'rb') if isinstance(src, str) else nullcontext(src)) as stream:
+                blocks = iter_record_blocks(stream, quote=quarantine.quote)
+                for i, block in enumerate(blocks):
+                    frame = quarantine.parse(block, first=i == 0, dtype=dtypes, **read_kwargs)
+                    for col, dtype in nullable.items():
+                        if col in frame.columns:
+                            frame[col] = frame[col].astype(dtype)
+                    pending.append(frame)
+                    pending_rows += len(frame)
+                    while pending_rows >= chunksize:
+                        merged = pd.concat(pending) if len(pending) > 1 else pending[0]
+                        chunk, rest = merged.iloc[:chunksize].copy(), merged.iloc[chunksize:]
+                        chunk.index = pd.RangeIndex(emitted, emitted + len(chunk))
+                        emitted += len(chunk)
+                        pending, pending_rows = [rest], len(rest)
+                        yield chunk
+            if pending_rows:
+                chunk = pd.concat(pending) if len(pending) > 1 else pending[0].copy()
+                chunk.index = pd.RangeIndex(emitted, emitted + len(chunk))
+                yield chunk
+        finally:
+            quarantine.close()
+            self._last_load['bad_lines'] = quarantine.stats()
+    
+    def _iter_csv_chunks(self, source: str, chunksize: int,
+                         columns: Optional[List[str]] = None,
+                         filters: Optional[List[Filter]] = None,
+                         full_sample: Optional['pd.DataFrame'] = None,
+                         quarantine: Optional[BadLineQuarantine] = None,
+                         numbers: Optional[NumberFormat] = None,
+                         **read_kwargs) -> Iterator['pd.DataFrame']:
+        """
+        Internal: Stream a CSV as DataFrames with one schema for every chunk
+        
+        The first chunk decides dtypes and date formats; the remaining chunks
+        are parsed with that explicit dtype map and converted in place, so
+        memory stays bounded by the chunk size. Number and boolean dtypes are
+        applied to each parsed chunk instead (_cast_chunk), so a later chunk
+        that does not fit them widens the column to object rather than
+        failing the stream. With filters, each chunk keeps
+        only its matching rows (chunks that match nothing are skipped, but an
+        empty frame is yielded if no row matches at all), number columns
+        compared as numbers (_filter_numbers). With a
+        quarantine, the rows come from _iter_quarantined_chunks instead. The
+        columns numbers.convert lists stay text in the dtype map and are
+        converted chunk by chunk, like the date columns.
+        """
+        import pandas as pd
+        
+        filters = filters or []
+        numbers = numbers or NumberFormat()
+        head_kwargs = {}
+        if quarantine is not None:
+            head_kwargs['on_bad_lines'] = 'skip'
+            with self._open(source) as src:
+                names = list(pd.read_csv(src, nrows=0, encoding=read_kwargs['encoding'],
+                                         sep=read_kwargs['sep'], quotechar=read_kwargs['quotechar']).columns)
+        try:
+            with self._phases.phase('parse'), self._open(source) as src:
+                head = pd.read_csv(src, nrows=chunksize, **read_kwargs, **head_kwargs)
+        except pd.errors.ParserError:
+            if quarantine is None:
+                raise
+            # A quote left open within the first chunk: take the good rows of the first block
+            with self._open(source) as src, \
+                    (open(src, 'rb') if isinstance(src, str) else nullcontext(src)) as stream:
+                block = next(iter_record_blocks(stream, quote=quarantine.quote), b'')
+            scout = BadLineQuarantine(source, 'skip', quote_char=read_kwargs['quotechar'])
+            head = scout.parse(block, first=True, names=names, **read_kwargs).head(chunksize)
+        date_formats = self._detect_date_formats(head)
+        dtypes = self._infer_chunk_dtypes(head)
+        widened = {col: dtype for col, dtype in dtypes.items() if dtype in ('Int64', 'boolean')}
+        if self.load_strategy is LoadStrategy.MEMORY_EFFICIENT:
+            with self._phases.phase('dtype_optimization'):
+                plan = plan_dtypes(head, exclude=list(date_formats) + list(numbers.convert))
+            dtypes.update(plan)
+            widened = {col: dtype for col, dtype in widened.items() if col not in plan}
+        for col in [*date_formats, *numbers.convert]:
+            if col in dtypes:
+                dtypes[col] = 'object'
+        read_kwargs.pop('dtype', None)  # The Python engine's text columns, part of the map now
+        # Casts a later chunk can fail run on the parsed chunk (_cast_chunk), text goes to the parser
+        casts = {col: dtype for col, dtype in dtypes.items() if pd.api.types.is_numeric_dtype(dtype)}
+        dtypes = {col: dtype for col, dtype in dtypes.items() if col not in casts}
+        self._last_load['widened'] = widened
+        self._last_load['widened_to_object'] = {}
+        
+        if self.verbose:
+            print(f"   🧩 Streaming in chunks of {chunksize} rows "
+                  f"({len(date_formats)} date columns)")
+        
+        total_rows = scanned = loaded_bytes = 0
+        empty = None
+        with self._open(source) as src, \
+                (pd.read_csv(src, dtype=dtypes, chunksize=chunksize, **read_kwargs) if quarantine is None
+                 else closing(self._iter_quarantined_chunks(src, quarantine, chunksize, names=names,
+                                                            dtype=dtypes, **read_kwargs))) as reader:
+            for chunk in self._phases.iterate('parse', reader):
+                self._cast_chunk(chunk, casts, scanned)
+                scanned += len(chunk)
+                if full_sample is not None:
+                    chunk, stats = _filter_numbers(chunk, filters, numbers)
+                    self._add_converted(stats)
+                    chunk = apply_pushdown(chunk, columns, [])
+                    if chunk.empty:
+                        empty = chunk
+                        continue
+                    loaded_bytes += int(chunk.memory_usage(deep=True).sum())
+                self._add_converted(self._convert_numbers(chunk, numbers))
+                self._apply_date_formats(chunk, date_formats)
+                total_rows += len(chunk)
+                yield chunk
+        
+        if not total_rows and empty is not None:
+            # Nothing matched: still one frame with the columns and dtypes of a chunk
+            self._convert_numbers(empty, numbers)
+            self._apply_date_formats(empty, date_formats)
+            yield empty
+        
+        if full_sample is not None:
+            self._record_pushdown(full_sample, len(head.columns), scanned, total_rows, loaded_bytes)
+        
+        if self.verbose:
+            print(f"✅ CSV streamed: {total_rows} rows, {len(head.columns)} columns")
+    
 # Example usage
 if __name__ == "__main__":
     # Quick test
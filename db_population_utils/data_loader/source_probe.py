@@ -0,0 +1,217 @@
+"""
+Source Probe
+=====================================
+
+Single-pass inspection of a source file shared by all SmartAutoDataLoader
+detectors. The head bytes are read once and format, BOM/encoding, delimiter,
+quote char and header are derived from them together.
+
+Probes are cached per (path, size, mtime), so repeated detector calls on the
+same file - and repeated loads within one run - never reopen it for detection.
+
+Compressed files and zip members ('archive.zip::member.csv') are probed on
+their decompressed head (see compressed_source.py).
+"""
+
+import csv
+import codecs
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .compressed_source import (data_name, detect_compression, estimate_data_size, open_decompressed,
+                                resolve_member, split_member, uncompressed_size)
+
+# Bytes read from the head of the file for all detection work
+DEFAULT_SAMPLE_SIZE = 64 * 1024
+
+# Suffix mapping with manager priorities (unknown suffixes fall back to CSV)
+FORMAT_MAP = {
+    '.csv': 'csv',    # 95% priority - CRITICAL
+    '.tsv': 'csv',    # 95% priority - CRITICAL
+    '.txt': 'csv',    # 95% priority - CRITICAL
+    '.xlsx': 'excel', # 80% priority - HIGH
+    '.xls': 'excel',  # 80% priority - HIGH
+    '.json': 'json',  # 70% priority - MEDIUM
+    '.geojson': 'geojson',
+    '.gpkg': 'gpkg',
+    '.shp': 'shapefile',
+}
+
+ENCODINGS_TO_TRY = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+DELIMITERS = [',', ';', '\t', '|']
+
+# GeoPackages are SQLite databases
+SQLITE_MAGIC = b'SQLite format 3\x00'
+
+# GeoJSON served with a plain .json suffix (e.g. WFS downloads)
+_FEATURE_COLLECTION = re.compile(rb'"type"\s*:\s*"FeatureCollection"')
+
+
+@dataclass(frozen=True)
+class SourceProbe:
+    """Everything the loader needs to know about a file, from one head read"""
+    path: str  # the file on disk (the archive for zip members)
+    size_bytes: int  # on disk, i.e. compressed
+    mtime_ns: int
+    head: bytes  # decompressed
+    truncated: bool  # True if the data is larger than the head sample
+    detected_format: str
+    encoding: str
+    has_bom: bool
+    delimiter: str
+    quote_char: str
+    has_header: bool
+    compression: Optional[str] = None  # 'gzip', 'bz2', 'xz', 'zstd', 'zip' or None
+    member: Optional[str] = None  # zip member holding the data
+    data_size_bytes: Optional[int] = None  # decompressed size
+    data_size_exact: bool = True  # False: estimated from the head's compression ratio (bz2/xz/zstd)
+
+    @property
+    def text(self) -> str:
+        """Decoded head sample (an incomplete last character is dropped)"""
+        return _decode(self.head, self.encoding) or ''
+
+    @property
+    def first_line(self) -> str:
+        return self.text.split('\n', 1)[0]
+
+
+def probe_source(source: str, sample_size: int = DEFAULT_SAMPLE_SIZE,
+                 compression: Optional[str] = 'infer') -> SourceProbe:
+    """
+    Probe a file, reusing the cached result while its size and mtime are unchanged
+
+    compression: 'infer' (from the magic bytes), an explicit compression, or
+    None to read the file as it is
+    """
+    path, member = split_member(source)
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _probe_cached(str(path), member, compression, stat.st_size, stat.st_mtime_ns, sample_size)
+
+
+def clear_probe_cache() -> None:
+    """Drop all cached probes"""
+    _probe_cached.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _probe_cached(path: str, member: Optional[str], compression: Optional[str],
+                  size_bytes: int, mtime_ns: int, sample_size: int) -> SourceProbe:
+    if compression == 'infer':
+        compression = detect_compression(path, member)
+    if compression == 'zip':
+        member = resolve_member(path, member, FORMAT_MAP)
+    elif member is not None:
+        raise ValueError(f"{path} is not a zip archive, cannot read member '{member}'")
+
+    # One extra byte tells whether the (decompressed) data goes on
+    with open_decompressed(path, member, compression) as f:
+        head = f.read(sample_size + 1)
+    truncated = len(head) > sample_size
+    head = head[:sample_size]
+
+    detected_format = _detect_format(Path(data_name(path, member, compression)).suffix.lower(), head)
+    encoding, has_bom = _detect_encoding(head)
+
+    delimiter, quote_char, has_header = ',', '"', True
+    if detected_format == 'csv':
+        text = _decode(head, encoding) or ''
+        delimiter = _sniff_delimiter(text)
+        quote_char, has_header = _sniff_dialect(text, delimiter)
+
+    data_size = uncompressed_size(path, member, compression) if truncated else len(head)
+    data_size_exact = data_size is not None
+    if not data_size_exact:
+        data_size = estimate_data_size(size_bytes, head, compression)
+
+    return SourceProbe(
+        path=path,
+        size_bytes=size_bytes,
+        mtime_ns=mtime_ns,
+        head=head,
+        truncated=truncated,
+        detected_format=detected_format,
+        encoding=encoding,
+        has_bom=has_bom,
+        delimiter=delimiter,
+        quote_char=quote_char,
+        has_header=has_header,
+        compression=compression,
+        member=member,
+        data_size_bytes=data_size,
+        data_size_exact=data_size_exact,
+    )
+
+
+def _detect_format(suffix: str, head: bytes) -> str:
+    detected = FORMAT_MAP.get(suffix)
+
+    # Unknown suffix: look at the content before defaulting to CSV
+    if detected is None:
+        if head.startswith(b'PK\x03\x04') or head.startswith(b'\xd0\xcf\x11\xe0'):
+            return 'excel'
+        if head.startswith(SQLITE_MAGIC):
+            return 'gpkg'
+        stripped = head.lstrip(codecs.BOM_UTF8).lstrip()
+        detected = 'json' if stripped[:1] in (b'{', b'[') else 'csv'
+
+    if detected == 'json' and _FEATURE_COLLECTION.search(head):
+        return 'geojson'
+    return detected
+
+
+def _detect_encoding(head: bytes) -> Tuple[str, bool]:
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding, True
+
+    for encoding in ENCODINGS_TO_TRY:
+        if _decode(head, encoding) is not None:
+            return encoding, False
+
+    return 'utf-8', False  # Fallback
+
+
+def _decode(head: bytes, encoding: str) -> Optional[str]:
+    """Decode a head sample, tolerating a multi-byte character cut at the end"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        return decoder.decode(head, final=False)
+    except UnicodeDecodeError:
+        return None
+
+
+def _sniff_delimiter(text: str) -> str:
+    first_line = text.split('\n', 1)[0]
+    counts = {d: first_line.count(d) for d in DELIMITERS}
+    return max(counts, key=counts.get) if max(counts.values()) > 0 else ','
+
+
+def _sniff_dialect(text: str, delimiter: str) -> Tuple[str, bool]:
+    # Only complete lines are handed to the sniffer
+    sample = text[:text.rfind('\n')] if '\n' in text else text
+    if not sample:
+        return '"', True
+
+    # A quote char opens a field, so count it right after a delimiter or newline
+    openers = {q: sum(sample.count(sep + q) for sep in (delimiter, '\n')) + sample.startswith(q)
+               for q in ('"', "'")}
+    quote_char = "'" if openers["'"] > openers['"'] else '"'
+
+    try:
+        has_header = csv.Sniffer().has_header(sample)
+    except csv.Error:
+        has_header = True
+
+    return quote_char, has_header
@@ -1,8 +1,18 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Callable, Mapping, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Callable, Mapping, Tuple, Union
 import logging
 from dataclasses import dataclass
 
+from ..data_loader.datetime_parsing import to_datetime_memoized
+from ..data_loader.number_parsing import PLACEHOLDERS, is_number_text, to_numeric_localized
+from ..data_loader.load_phases import PhaseCallback
+from .lazy_pipeline import LazyPipeline
+from .partitioned import apply_steps, run_partitioned
+from .validation_rules import MAX_SAMPLES, compile_checks, evaluate_rules
+from .data_profile import DataProfile, profile_chunks, profile_frame
+from . import poi_dedup
+from .poi_dedup import DedupResult
+
 # Optional: keep pandas as a type-only import to avoid heavy deps at design time
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -36,6 +46,9 @@ class DataProcessor:
         """
         self.strict_mode = strict_mode
         self._validation_results = {}
+        self._datetime_stats: Dict[str, Dict[str, Any]] = {}  # Last coerce_types datetime conversions
+        self._number_stats: Dict[str, Dict[str, Any]] = {}  # Last parse_numbers conversions
+        self._pipeline_stats: Dict[str, Any] = {}  # Last parallel run_pipeline: partitions, stages
 
     def standardize_columns(
         self,
@@ -51,10 +64,51 @@ class DataProcessor:
         Return a copy with standardized column names.
         
         Changes:  # NEW
-        - Added rename_map for explicit column renaming
-        - Improved duplicate handling for production
+        - Added rename_map for explicit column renaming (applied after standardizing)
+        - Improved duplicate handling for production: repeats get _2, _3, ...
         """
-        raise NotImplementedError
+        return self._standardize_columns_into(df.copy(), to_case=to_case, strip=strip,
+                                              snake_case=snake_case, dedupe=dedupe,
+                                              rename_map=rename_map)
+
+    def _standardize_columns_into(
+        self,
+        df: "pd.DataFrame",
+        *,
+        to_case: str = "lower",
+        strip: bool = True,
+        snake_case: bool = True,
+        dedupe: bool = True,
+        rename_map: Optional[Dict[str, str]] = None
+    ) -> "pd.DataFrame":
+        """Internal: standardize_columns on df itself (only the column index is replaced)"""
+        import re
+
+        names = []
+        for col in map(str, df.columns):
+            if strip:
+                col = col.strip()
+            if snake_case:
+                col = re.sub(r"[^0-9a-zA-Z\u00C0-\u024F]+", "_", col)
+                col = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", col).strip("_")
+            if to_case == "lower":
+                col = col.lower()
+            elif to_case == "upper":
+                col = col.upper()
+            names.append(col)
+
+        if rename_map:
+            names = [rename_map.get(col, col) for col in names]
+
+        if dedupe:
+            seen: Dict[str, int] = {}
+            for i, col in enumerate(names):
+                seen[col] = seen.get(col, 0) + 1
+                if seen[col] > 1:
+                    names[i] = f"{col}_{seen[col]}"
+
+        df.columns = names
+        return df
 
     def coerce_types(
         self,
@@ -70,8 +124,126 @@ class DataProcessor:
         Changes:  # NEW
         - override_loader_types: If False, respects DataLoader's type parsing
         - Added timezone awareness for datetime columns
+        - Datetime targets parse each distinct value once when cardinality is low
+          (stats per column in self._datetime_stats)
         """
-        raise NotImplementedError
+        return self._coerce_types_into(df.copy(), type_map, errors=errors,
+                                       override_loader_types=override_loader_types)
+
+    def _coerce_types_into(
+        self,
+        df: "pd.DataFrame",
+        type_map: Mapping[str, str],
+        *,
+        errors: str = "coerce",
+        override_loader_types: bool = False
+    ) -> "pd.DataFrame":
+        """Internal: coerce_types on df itself (columns are replaced, not copied first)"""
+        import pandas as pd
+
+        result = df
+        self._datetime_stats = {}
+
+        for col, target in type_map.items():
+            if col not in result.columns:
+                logger.warning("coerce_types: column '%s' not found", col)
+                continue
+
+            series = result[col]
+            is_text = series.dtype == object or isinstance(series.dtype, pd.StringDtype)
+            if not override_loader_types and not is_text:
+                continue  # Already typed by DataLoader
+
+            try:
+                dtype = pd.api.types.pandas_dtype(target)
+                if pd.api.types.is_datetime64_any_dtype(dtype):
+                    converted, stats = to_datetime_memoized(
+                        series, errors="raise" if errors == "raise" else "coerce"
+                    )
+                    self._datetime_stats[col] = stats
+                    tz = getattr(dtype, "tz", None)
+                    if tz is not None:
+                        converted = (converted.dt.tz_convert(tz) if converted.dt.tz is not None
+                                     else converted.dt.tz_localize(tz))
+                    result[col] = converted
+                elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                    numeric = pd.to_numeric(series, errors="raise" if errors == "raise" else "coerce")
+                    result[col] = numeric.astype(dtype)
+                else:
+                    result[col] = series.astype(dtype)
+            except (ValueError, TypeError) as e:
+                if errors == "raise" or self.strict_mode:
+                    raise
+                logger.warning("coerce_types: could not cast '%s' to %s: %s", col, target, e)
+
+        return result
+
+    def parse_numbers(
+        self,
+        df: "pd.DataFrame",
+        columns: Optional[List[str]] = None,
+        *,
+        decimal: str = ",",
+        thousands: Optional[str] = ".",
+        errors: str = "coerce"
+    ) -> "pd.DataFrame":
+        """
+        Return a copy with localized number text converted to float64.
+
+        - "1.234,56 €", "12,5 %", "3 500 €", "1.200,-": units, currency and
+          spaces are dropped; trailing minus, parentheses and U+2212 negate
+        - columns=None converts every text column whose values are all
+          numbers (placeholders such as "-" become NaN)
+        - Whole-column string operations, no per-value Python
+          (to_numeric_localized); stats per column in self._number_stats
+        - errors="raise" raises ValueError if a non-null value does not parse
+        """
+        return self._parse_numbers_into(df.copy(), columns, decimal=decimal,
+                                        thousands=thousands, errors=errors)
+
+    def _parse_numbers_into(
+        self,
+        df: "pd.DataFrame",
+        columns: Optional[List[str]] = None,
+        *,
+        decimal: str = ",",
+        thousands: Optional[str] = ".",
+        errors: str = "coerce"
+    ) -> "pd.DataFrame":
+        """Internal: parse_numbers on df itself (columns are replaced, not copied first)"""
+        result = df
+        self._number_stats = {}
+
+        if columns is None:
+            columns = self._number_columns(result)
+
+        for col in columns:
+            if col not in result.columns:
+                logger.warning("parse_numbers: column '%s' not found", col)
+                continue
+
+            converted, stats = to_numeric_localized(result[col], decimal, thousands)
+            placeholders = int(result[col].astype("string").str.strip().isin(PLACEHOLDERS).sum())
+            if stats["unparsed"] > placeholders and (errors == "raise" or self.strict_mode):
+                raise ValueError(f"parse_numbers: {stats['unparsed'] - placeholders} values in '{col}' "
+                                 f"are not numbers")
+            result[col] = converted
+            self._number_stats[col] = stats
+
+        return result
+
+    def _number_columns(self, df: "pd.DataFrame") -> List[str]:
+        """Internal: text columns whose non-null values are all numbers (parse_numbers(columns=None))"""
+        import pandas as pd
+
+        columns = []
+        for col in df.columns:
+            series = df[col]
+            if series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+                values = series.dropna()
+                if len(values) and is_number_text(values).all():
+                    columns.append(col)
+        return columns
 
     def handle_nulls(
         self,
@@ -84,11 +256,69 @@ class DataProcessor:
         """
         Handle nulls per-column using a strategy dict.
         
+        Strategies: "mean", "median", "mode", "ffill", "bfill", "drop" (drop
+        rows where the column is null) or a constant fill value.
+        
         Changes:  # NEW
-        - Added time-series interpolation support
+        - Added time-series interpolation support: interpolate_time_series names a
+          datetime column, numeric gaps are interpolated by time along it
         - Improved statistical filling (median/mean) for sparse data
         """
-        raise NotImplementedError
+        return self._handle_nulls_into(df.copy(), strategy,
+                                       drop_rows_if_any_null_in=drop_rows_if_any_null_in,
+                                       interpolate_time_series=interpolate_time_series)
+
+    def _handle_nulls_into(
+        self,
+        df: "pd.DataFrame",
+        strategy: Mapping[str, Any],
+        *,
+        drop_rows_if_any_null_in: Optional[List[str]] = None,
+        interpolate_time_series: Optional[str] = None
+    ) -> "pd.DataFrame":
+        """Internal: handle_nulls on df itself; returns a new frame only if rows are dropped"""
+        import pandas as pd
+
+        result = df
+        drop_in = list(drop_rows_if_any_null_in or [])
+
+        if interpolate_time_series is not None:
+            times = pd.DatetimeIndex(result[interpolate_time_series])
+            for col in result.columns:
+                series = result[col]
+                if (col != interpolate_time_series and pd.api.types.is_numeric_dtype(series)
+                        and not pd.api.types.is_bool_dtype(series) and series.isna().any()):
+                    filled = pd.Series(series.to_numpy(dtype="float64", na_value=float("nan")), index=times)
+                    result[col] = filled.interpolate(method="time").to_numpy()
+
+        for col, how in strategy.items():
+            if col not in result.columns:
+                logger.warning("handle_nulls: column '%s' not found", col)
+                continue
+            series = result[col]
+            if how == "drop":
+                drop_in.append(col)
+            elif how in ("mean", "median"):
+                if not pd.api.types.is_numeric_dtype(series):
+                    if self.strict_mode:
+                        raise TypeError(f"handle_nulls: '{how}' needs a numeric column, '{col}' is {series.dtype}")
+                    logger.warning("handle_nulls: '%s' is not numeric, '%s' skipped", col, how)
+                    continue
+                result[col] = series.fillna(series.mean() if how == "mean" else series.median())
+            elif how == "mode":
+                modes = series.mode(dropna=True)
+                if len(modes):
+                    result[col] = series.fillna(modes.iloc[0])
+            elif how == "ffill":
+                result[col] = series.ffill()
+            elif how == "bfill":
+                result[col] = series.bfill()
+            else:
+                result[col] = series.fillna(how)
+
+        if drop_in:
+            result = result.dropna(subset=[col for col in drop_in if col in result.columns])
+        return result
 
     def preprocess_loaded_data(  # NEW METHOD
         self,
@@ -113,33 +343,163 @@ class DataProcessor:
         df: "pd.DataFrame",
         checks: Dict[str, Any],
         *,
-        schema: Optional[Dict[str, str]] = None  # NEW
+        schema: Optional[Dict[str, str]] = None,  # NEW
+        max_samples: int = MAX_SAMPLES
     ) -> ValidationResult:  # CHANGED return type
         """
         Run validation with enhanced reporting.
         
+        checks are declarative (required_columns, non_null, ranges, regex,
+        allowed_values, unique, within_bbox, foreign_keys; see
+        validation_rules.py) and compiled into vectorized boolean masks, one
+        pass per column. "custom" takes callables df -> bool or (bool, reason)
+        as in the populator's business rules.
+        
         Changes:  # NEW
         - Added schema validation against expected dtypes
         - Returns ValidationResult dataclass instead of dict
-        - Samples failing records for debugging
+        - Samples failing records for debugging (up to max_samples per rule)
         """
-        raise NotImplementedError
+        import time
+
+        import pandas as pd
+
+        start = time.perf_counter()
+        issues: List[str] = []
+        rule_stats: Dict[str, Dict[str, Any]] = {}
+        sample_failures: Dict[str, List[Any]] = {}
+
+        for col, expected in (schema or {}).items():
+            if col not in df.columns:
+                issues.append(f"schema: column '{col}' missing")
+            elif df[col].dtype != pd.api.types.pandas_dtype(expected):
+                issues.append(f"schema: '{col}' is {df[col].dtype}, expected {expected}")
+
+        for outcome in evaluate_rules(df, compile_checks(checks), max_samples=max_samples):
+            name = outcome.rule.name
+            rule_stats[name] = {"failed": outcome.failed, "checked": outcome.checked,
+                                "seconds": outcome.seconds}
+            if outcome.missing_columns:
+                issues.append(f"{name}: column(s) {outcome.missing_columns} missing")
+            elif outcome.failed:
+                issues.append(f"{name}: {outcome.failed} of {outcome.checked} rows fail")
+                sample_failures[name] = outcome.samples
+
+        for rule in checks.get("custom", []):
+            name = f"custom:{getattr(rule, '__name__', repr(rule))}"
+            rule_start = time.perf_counter()
+            try:
+                outcome = rule(df)
+            except Exception as e:
+                outcome = (False, f"raised {type(e).__name__}: {e}")
+            passed, reason = outcome if isinstance(outcome, tuple) else (bool(outcome), "returned False")
+            rule_stats[name] = {"failed": int(not passed), "checked": len(df),
+                                "seconds": time.perf_counter() - rule_start}
+            if not passed:
+                issues.append(f"{name}: {reason}")
+
+        result = ValidationResult(
+            passed=not issues,
+            issues=issues,
+            stats={"rows": len(df), "columns": len(df.columns), "rules": rule_stats,
+                   "seconds": time.perf_counter() - start},
+            sample_failures=sample_failures,
+        )
+        self._validation_results = result
+        if issues and self.strict_mode:
+            raise ValueError("validate: " + "; ".join(issues))
+        return result
+
+    def deduplicate(
+        self,
+        df: "pd.DataFrame",
+        *,
+        columns: Optional[Dict[str, str]] = None,
+        cell_meters: float = poi_dedup.CELL_METERS,
+        threshold: float = poi_dedup.MATCH_THRESHOLD,
+        weights: Optional[Dict[str, float]] = None,
+        source_priority: Optional[List[Any]] = None,
+        coalesce: bool = True,
+        max_block_size: int = poi_dedup.MAX_BLOCK_SIZE,
+        name_stopwords: Iterable[str] = poi_dedup.NAME_STOPWORDS
+    ) -> DedupResult:
+        """
+        Merge records of the same place across sources (see poi_dedup.py).
+        
+        Candidate pairs come only from shared blocks (grid cells of about
+        cell_meters plus their neighbours, normalized postcodes), so runtime
+        grows with the block sizes rather than n². Pairs are scored on trigram
+        name/street similarity, house number and distance; pairs scoring at
+        least threshold are clustered and each cluster keeps one survivor
+        (first in source_priority, then most complete), its gaps filled from
+        the other members when coalesce is set.
+        
+        columns maps roles (name, street, housenumber, postcode, lat, lon,
+        source) to column names where the defaults in COLUMN_ALIASES miss.
+        Returns DedupResult: frame (survivors), clusters (per input row),
+        pairs (scored candidates) and stats.
+        """
+        result = poi_dedup.deduplicate(
+            df, columns=columns, cell_meters=cell_meters, threshold=threshold, weights=weights,
+            source_priority=source_priority, coalesce=coalesce, max_block_size=max_block_size,
+            name_stopwords=name_stopwords
+        )
+        logger.info("deduplicate: %d rows -> %d (%d candidate pairs of %d, %.2fs)",
+                    result.stats["rows"], result.stats["clusters"], result.stats["candidate_pairs"],
+                    result.stats["naive_pairs"], sum(result.stats["seconds"].values()))
+        return result
 
     def run_pipeline(
         self,
         df: "pd.DataFrame",
         steps: List[Callable[["pd.DataFrame"], "pd.DataFrame"]],
         *,
-        stop_on_error: bool = True  # NEW
+        stop_on_error: bool = True,  # NEW
+        parallel: Optional[int] = None,
+        partition_by: Optional[str] = None,
+        transfer: Optional[str] = None
     ) -> "pd.DataFrame":
         """
         Execute transformation pipeline.
         
+        Every step runs eagerly on the whole frame (the DataProcessor methods
+        copy it each time); lazy() records the same steps and runs them with
+        one copy, chunk by chunk over a loader stream.
+        
+        With parallel=N the frame is split into up to N partitions (contiguous,
+        or by the hash of partition_by) and runs of steps marked
+        @partition_safe execute in a process pool; other steps run as barriers
+        on the reassembled frame (see partitioned.py). transfer: 'arrow'
+        (default with pyarrow) or 'pickle' for the partitions. Stages are
+        recorded in self._pipeline_stats.
+        
         Changes:  # NEW
-        - Added stop_on_error flag
+        - Added stop_on_error flag: if False, a failing step is logged and skipped
         - Improved error context in logging
         """
-        raise NotImplementedError
+        if parallel is None or parallel <= 1:
+            return apply_steps(df, steps, stop_on_error=stop_on_error, strict_mode=self.strict_mode)
+
+        result, self._pipeline_stats = run_partitioned(
+            df, steps, parallel, partition_by=partition_by, stop_on_error=stop_on_error,
+            strict_mode=self.strict_mode, transfer=transfer
+        )
+        return result
+
+    def lazy(
+        self,
+        *,
+        on_step: Optional[PhaseCallback] = None,
+        track_allocations: bool = False
+    ) -> LazyPipeline:
+        """
+        Start a lazy pipeline of this processor's steps (see lazy_pipeline.py).
+        
+        Steps are recorded, fused where possible and run with at most one copy
+        per frame; iter_chunks()/to_sql() process a load(chunksize=...) stream
+        one chunk at a time, and PipelineResult.step_timings has per-step times.
+        """
+        return LazyPipeline(self, on_step=on_step, track_allocations=track_allocations)
 
     def get_data_summary(self, df: "pd.DataFrame") -> Dict[str, Any]:  # NEW METHOD
         """
@@ -147,7 +507,31 @@ class DataProcessor:
         Includes:
         - Memory usage
         - Null distribution
-        - Basic statistics
+        - Basic statistics (mean/std, min/max, p1-p99 quantiles, top values)
         - Schema snapshot
+        
+        Built from a mergeable DataProfile (data_profile.py) chunk by chunk;
+        profile() does the same for a chunk stream without loading it whole.
         """
-        raise NotImplementedError
\ No newline at end of file
+        return profile_frame(df).summary()
+
+    def profile(
+        self,
+        chunks: Union["pd.DataFrame", Iterable["pd.DataFrame"]],
+        *,
+        source: Optional[str] = None
+    ) -> DataProfile:
+        """
+        Mergeable DataProfile of a frame or a chunk stream, e.g.
+        loader.load(path, chunksize=100_000), in memory bounded by one chunk.
+        
+        Profiles merge() across files or workers, save()/load() as JSON and
+        diff() against an earlier run; profile.summary() matches get_data_summary().
+        """
+        import pandas as pd
+
+        if isinstance(chunks, pd.DataFrame):
+            profile = profile_frame(chunks)
+            profile.source = source
+            return profile
+        return profile_chunks(chunks, source=source)
\ No newline at end of file
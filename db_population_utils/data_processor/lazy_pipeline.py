@@ -0,0 +1,294 @@
+"""
+Lazy DataProcessor Pipelines
+=====================================
+
+DataProcessor's steps (standardize_columns, coerce_types, parse_numbers,
+handle_nulls) each return a copy, so an eager run_pipeline copies the
+frame once per step and needs the whole frame in memory. A LazyPipeline
+only records the steps; when it runs it:
+
+- plans them: adjacent coerce_types / parse_numbers steps with the same
+  options and different columns are fused into one step
+- copies each input frame at most once and runs every step in place on
+  that copy; chunks of a stream (load(chunksize=...)) belong to the
+  pipeline and are not copied at all
+- runs chunk by chunk over an iterator of frames, so iter_chunks() and
+  to_sql() hold one chunk at a time (collect() concatenates the results)
+- freezes decisions taken from the data on the first chunk (columns=None
+  for parse_numbers), so every chunk is converted alike, and carries the
+  last value of "ffill" columns over into the next chunk
+
+Steps that need a whole column (handle_nulls with "mean"/"median"/"mode",
+"bfill" or time-series interpolation) only run on a DataFrame source.
+
+Per-step timings are recorded with the loader's PhaseRecorder (see
+data_loader/load_phases.py): one entry per step, plus "read" for
+producing the chunks and "to_sql" for writing them.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from ..data_loader.load_phases import PhaseCallback, PhaseRecorder
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from .data_processor import DataProcessor
+
+# handle_nulls strategies that need the whole column, not one chunk
+WHOLE_COLUMN_STRATEGIES = frozenset({'mean', 'median', 'mode', 'bfill'})
+
+# Steps whose adjacent calls with the same options are merged by plan()
+_FUSABLE = ('coerce_types', 'parse_numbers')
+
+Source = Union['pd.DataFrame', Iterable['pd.DataFrame']]
+
+
+@dataclass
+class PipelineStep:
+    """One recorded step: a DataProcessor method (or a callable for apply) and its arguments"""
+    name: str
+    method: str  # standardize_columns/coerce_types/parse_numbers/handle_nulls/apply
+    args: Dict[str, Any] = field(default_factory=dict)
+    func: Optional[Callable[['pd.DataFrame'], 'pd.DataFrame']] = None  # apply steps only
+
+
+@dataclass
+class PipelineResult:
+    """What a LazyPipeline run did"""
+    rows_in: int = 0
+    rows_out: int = 0
+    chunks: int = 0
+    copies: int = 0  # Frame copies made (eager run_pipeline: one per step and frame)
+    seconds: float = 0.0
+    plan: List[str] = field(default_factory=list)  # Step names after fusion, in run order
+    # Per step (and read/to_sql): seconds, calls, peak_alloc_mb
+    step_timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+class LazyPipeline:
+    """
+    Recorded DataProcessor steps, run lazily over a frame or a chunk stream
+
+    Build it with DataProcessor.lazy() and chain the steps, which take the
+    same arguments as the DataProcessor methods:
+
+        pipeline = (processor.lazy()
+                    .standardize_columns()
+                    .parse_numbers(["kaltmiete"])
+                    .coerce_types({"baujahr": "Int64"}))
+        report = pipeline.to_sql(loader.load("listings.csv", chunksize=100_000),
+                                 connector, "listings", schema="staging")
+
+    Args:
+        processor: DataProcessor whose methods run the steps
+        on_step: Called as on_step(step, stats) after every timed step, see PhaseRecorder
+        track_allocations: Also record the peak allocation per step (tracemalloc, slower)
+    """
+
+    def __init__(self, processor: 'DataProcessor', *, on_step: Optional[PhaseCallback] = None,
+                 track_allocations: bool = False):
+        self.processor = processor
+        self.on_step = on_step
+        self.track_allocations = track_allocations
+        self.steps: List[PipelineStep] = []
+        self.result: Optional[PipelineResult] = None  # Set when a run finishes
+
+    # -----------------------
+    # Recording
+    # -----------------------
+
+    def standardize_columns(self, **kwargs: Any) -> 'LazyPipeline':
+        return self._add('standardize_columns', kwargs)
+
+    def coerce_types(self, type_map: Dict[str, str], **kwargs: Any) -> 'LazyPipeline':
+        return self._add('coerce_types', {'type_map': dict(type_map), **kwargs})
+
+    def parse_numbers(self, columns: Optional[List[str]] = None, **kwargs: Any) -> 'LazyPipeline':
+        return self._add('parse_numbers', {'columns': list(columns) if columns is not None else None,
+                                           **kwargs})
+
+    def handle_nulls(self, strategy: Dict[str, Any], **kwargs: Any) -> 'LazyPipeline':
+        return self._add('handle_nulls', {'strategy': dict(strategy), **kwargs})
+
+    def apply(self, func: Callable[['pd.DataFrame'], 'pd.DataFrame'],
+              name: Optional[str] = None) -> 'LazyPipeline':
+        """Any frame → frame callable; it gets the pipeline's own frame and may modify it"""
+        self.steps.append(PipelineStep(self._step_name(name or getattr(func, '__name__', 'apply')),
+                                       'apply', func=func))
+        return self
+
+    def plan(self) -> List[PipelineStep]:
+        """The steps as they will run, adjacent fusable steps with the same options merged"""
+        planned: List[PipelineStep] = []
+        for step in self.steps:
+            previous = planned[-1] if planned else None
+            if (previous is not None and step.method in _FUSABLE and previous.method == step.method
+                    and _options(previous) == _options(step) and _fusable_columns(previous, step)):
+                planned[-1] = _fuse(previous, step)
+            else:
+                planned.append(step)
+        return planned
+
+    # -----------------------
+    # Execution
+    # -----------------------
+
+    def iter_chunks(self, source: Source, *, copy: Optional[bool] = None) -> Iterator['pd.DataFrame']:
+        """
+        Run the pipeline, yielding one processed frame per input frame
+
+        Args:
+            source: A DataFrame, or an iterator of frames such as load(path, chunksize=...)
+            copy: Copy each input frame once before the steps run in place. Default:
+                True for a DataFrame (the caller's frame stays untouched), False for a
+                stream, whose chunks nobody else holds; pass True for streams that
+                yield frames referenced elsewhere
+
+        self.result is filled in once the iterator is exhausted.
+        """
+        yield from self._execute(source, copy, PhaseRecorder(self.on_step, self.track_allocations))
+
+    def collect(self, source: Source, *, copy: Optional[bool] = None) -> Tuple['pd.DataFrame', PipelineResult]:
+        """Run the pipeline and return (all processed rows as one frame, PipelineResult)"""
+        import pandas as pd
+
+        frames = list(self.iter_chunks(source, copy=copy))
+        if len(frames) == 1:
+            return frames[0], self.result
+        if not frames:
+            return pd.DataFrame(), self.result
+        return pd.concat(frames, ignore_index=True), self.result
+
+    def to_sql(self, source: Source, connector: Any, table: str, *, schema: Optional[str] = None,
+               if_exists: str = 'append', chunksize: int = 5000, target: str = 'ingestion',
+               method: Optional[str] = None, copy: Optional[bool] = None) -> PipelineResult:
+        """
+        Run the pipeline and write each processed chunk with DBConnector.to_sql
+
+        Only one chunk is held at a time. if_exists applies to the first chunk,
+        the rest are appended; chunksize is the rows per INSERT batch.
+        """
+        recorder = PhaseRecorder(self.on_step, self.track_allocations)
+        for i, chunk in enumerate(self._execute(source, copy, recorder)):
+            with recorder.phase('to_sql'):
+                connector.to_sql(chunk, table, schema=schema, if_exists=if_exists if i == 0 else 'append',
+                                 chunksize=chunksize, target=target, method=method)
+        return self.result
+
+    def _execute(self, source: Source, copy: Optional[bool],
+                 recorder: PhaseRecorder) -> Iterator['pd.DataFrame']:
+        """Internal: iter_chunks, timing into recorder (shared with to_sql)"""
+        import pandas as pd
+
+        streaming = not isinstance(source, pd.DataFrame)
+        if copy is None:
+            copy = not streaming
+        planned = self.plan()
+        if streaming:
+            self._check_streamable(planned)
+
+        result = PipelineResult(plan=[step.name for step in planned])
+        frozen: Dict[str, Any] = {}  # Per step name, decisions taken on the first chunk
+        start = time.perf_counter()
+        chunks = recorder.iterate('read', [source] if not streaming else source)
+        try:
+            for chunk in chunks:
+                result.chunks += 1
+                result.rows_in += len(chunk)
+                if copy:
+                    chunk = chunk.copy()
+                    result.copies += 1
+                for step in planned:
+                    with recorder.phase(step.name):
+                        chunk = self._run_step(step, chunk, frozen)
+                result.rows_out += len(chunk)
+                result.seconds = time.perf_counter() - start
+                result.step_timings = recorder.timings()
+                self.result = result
+                yield chunk
+        finally:
+            result.seconds = time.perf_counter() - start
+            result.step_timings = recorder.timings()
+            self.result = result
+            recorder.close()
+
+    def _run_step(self, step: PipelineStep, df: 'pd.DataFrame', frozen: Dict[str, Any]) -> 'pd.DataFrame':
+        """Internal: one step on the pipeline's own frame"""
+        processor = self.processor
+        args = step.args
+        if step.method == 'standardize_columns':
+            return processor._standardize_columns_into(df, **args)
+        if step.method == 'coerce_types':
+            return processor._coerce_types_into(df, args['type_map'], **_options(step))
+        if step.method == 'parse_numbers':
+            if step.name not in frozen:
+                frozen[step.name] = (args['columns'] if args['columns'] is not None
+                                     else processor._number_columns(df))
+            return processor._parse_numbers_into(df, frozen[step.name], **_options(step))
+        if step.method == 'handle_nulls':
+            # Leading gaps of an ffill column take the last value of the previous chunk
+            last = frozen.setdefault(step.name, {})
+            ffill = [col for col, how in args['strategy'].items() if how == 'ffill' and col in df.columns]
+            for col in ffill:
+                if col in last:
+                    df[col] = df[col].mask(df[col].notna().cumsum() == 0, last[col])
+            df = processor._handle_nulls_into(df, args['strategy'], **_options(step))
+            for col in ffill:
+                valid = df[col].dropna()
+                if len(valid):
+                    last[col] = valid.iloc[-1]
+            return df
+        return step.func(df)
+
+    def _check_streamable(self, planned: List[PipelineStep]) -> None:
+        """Internal: Reject steps whose result would depend on where the chunks are cut"""
+        for step in planned:
+            if step.method != 'handle_nulls':
+                continue
+            whole = sorted({how for how in step.args['strategy'].values()
+                            if isinstance(how, str) and how in WHOLE_COLUMN_STRATEGIES})
+            if whole or step.args.get('interpolate_time_series'):
+                needs = ', '.join(whole) or 'interpolate_time_series'
+                raise ValueError(f"Step '{step.name}' ({needs}) needs whole columns and cannot run "
+                                 f"chunk by chunk; fill with constants or ffill, or run on a DataFrame")
+
+    def _add(self, method: str, args: Dict[str, Any]) -> 'LazyPipeline':
+        self.steps.append(PipelineStep(self._step_name(method), method, args))
+        return self
+
+    def _step_name(self, base: str) -> str:
+        """Internal: Unique step name, repeats numbered coerce_types_2, coerce_types_3, ..."""
+        names = {step.name for step in self.steps}
+        name, n = base, 1
+        while name in names:
+            n += 1
+            name = f"{base}_{n}"
+        return name
+
+
+def _options(step: PipelineStep) -> Dict[str, Any]:
+    """Keyword options of a step, without the columns it works on"""
+    return {key: value for key, value in step.args.items() if key not in ('type_map', 'columns', 'strategy')}
+
+
+def _fusable_columns(first: PipelineStep, second: PipelineStep) -> bool:
+    """
+    Whether two adjacent steps of one kind can run as one: only on different
+    columns, since the second step sees a column the first one already
+    converted (and auto-detected parse_numbers columns depend on it too)
+    """
+    key = 'type_map' if first.method == 'coerce_types' else 'columns'
+    if first.args[key] is None or second.args[key] is None:
+        return False
+    return set(first.args[key]).isdisjoint(second.args[key])
+
+
+def _fuse(first: PipelineStep, second: PipelineStep) -> PipelineStep:
+    """Internal: One step converting the columns of both"""
+    if first.method == 'coerce_types':
+        args = {**first.args, 'type_map': {**first.args['type_map'], **second.args['type_map']}}
+    else:
+        args = {**first.args, 'columns': first.args['columns'] + second.args['columns']}
+    return PipelineStep(f"{first.name}+{second.name}", first.method, args)
@@ -0,0 +1,232 @@
+"""
+Partitioned Pipeline Execution
+=====================================
+
+DataProcessor.run_pipeline(df, steps, parallel=N) splits the frame into
+partitions and runs the steps on them in a process pool:
+
+- Steps declare whether they only look at their own rows: decorate them
+  with @partition_safe (cleaning, casting, mapping, melting). Anything
+  else - undeclared steps and @barrier ones such as a global dedup or a
+  sort - runs as a barrier on the reassembled frame in this process.
+- Consecutive partition-safe steps form one stage, so a partition crosses
+  the process boundary once per stage, not once per step.
+- partition_by=None cuts the frame into contiguous row ranges;
+  partition_by=column hashes the column, so all rows with one key land in
+  the same partition (per-key dedup or ranking is then partition-safe).
+- Partitions travel as one Arrow IPC buffer each (frame_to_ipc, as in
+  load_many) when pyarrow is installed, pickled otherwise, and are
+  reassembled in the original row order.
+
+Steps run in worker processes, so they must be picklable: module-level
+functions, or functools.partial of them or of DataProcessor methods. With
+partition_by, partition-safe steps must keep the row index (filtering and
+column operations do), since it carries the original row positions.
+"""
+
+import logging
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from ..data_loader.batch_loading import TRANSFERS, frame_from_ipc, frame_to_ipc, require_pyarrow
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+Step = Callable[['pd.DataFrame'], 'pd.DataFrame']
+
+# Partitions get at least this many rows; smaller frames use fewer workers
+MIN_PARTITION_ROWS = 10_000
+
+
+def partition_safe(step: Step) -> Step:
+    """Declare a step row-independent: it may run on any partition of the frame"""
+    step.partition_safe = True
+    return step
+
+
+def barrier(step: Step) -> Step:
+    """Declare a step that needs the whole frame (the default for undeclared steps)"""
+    step.partition_safe = False
+    return step
+
+
+def is_partition_safe(step: Step) -> bool:
+    return getattr(step, 'partition_safe', False) is True
+
+
+def plan_stages(steps: List[Step]) -> List[Tuple[bool, List[Step]]]:
+    """(parallel, steps) stages: runs of partition-safe steps, each barrier step on its own"""
+    stages: List[Tuple[bool, List[Step]]] = []
+    for step in steps:
+        safe = is_partition_safe(step)
+        if safe and stages and stages[-1][0]:
+            stages[-1][1].append(step)
+        else:
+            stages.append((safe, [step]))
+    return stages
+
+
+def apply_steps(df: 'pd.DataFrame', steps: List[Step], *, stop_on_error: bool = True,
+                strict_mode: bool = False) -> 'pd.DataFrame':
+    """
+    Run steps one after the other; with stop_on_error=False (and not
+    strict_mode) a failing step is logged and skipped
+    """
+    result = df
+    for i, step in enumerate(steps, 1):
+        name = step_name(step)
+        start = time.perf_counter()
+        try:
+            result = step(result)
+        except Exception as e:
+            logger.error("run_pipeline: step %d/%d '%s' failed on %d rows: %s",
+                         i, len(steps), name, len(result), e)
+            if stop_on_error or strict_mode:
+                raise
+            continue
+        logger.debug("run_pipeline: step '%s' took %.3fs", name, time.perf_counter() - start)
+    return result
+
+
+def split_frame(df: 'pd.DataFrame', n: int, partition_by: Optional[str] = None) -> List['pd.DataFrame']:
+    """
+    n partitions of df: contiguous row ranges, or rows grouped by the hash
+    of partition_by with their positions in df as the index
+    """
+    import numpy as np
+    import pandas as pd
+
+    if partition_by is None:
+        bounds = np.linspace(0, len(df), n + 1).astype(int)
+        return [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+    if partition_by not in df.columns:
+        raise KeyError(f"partition_by column '{partition_by}' not in the frame")
+    keys = _partition_keys(df[partition_by], n)
+    positioned = df.set_axis(pd.RangeIndex(len(df)), axis=0)
+    return [positioned.iloc[np.flatnonzero(keys == part)] for part in range(n)]
+
+
+def reassemble(parts: List['pd.DataFrame'], original: 'pd.DataFrame',
+               partition_by: Optional[str] = None) -> 'pd.DataFrame':
+    """
+    Concatenate processed partitions in the original row order (and index, for partition_by)
+
+    With partition_by, every row must still carry the position of an
+    original row of its own partition; a step that renumbered the rows
+    raises ValueError instead of scrambling them.
+    """
+    import pandas as pd
+
+    if partition_by is not None:
+        keys = _partition_keys(original[partition_by], len(parts))
+        for number, part in enumerate(parts):
+            positions = part.index.to_numpy()
+            if len(positions) and (positions.dtype.kind not in 'iu' or positions.min() < 0
+                                   or positions.max() >= len(original) or (keys[positions] != number).any()):
+                raise ValueError("With partition_by, partition-safe steps must keep the row index "
+                                 "(it carries the original row positions)")
+
+    parts = [part for part in parts if len(part)] or parts[:1]  # Empty partitions may have other dtypes
+    combined = pd.concat(parts) if len(parts) > 1 else parts[0]
+    if partition_by is None:
+        return combined
+
+    combined = combined.sort_index(kind='stable')
+    return combined.set_axis(original.index.take(combined.index.to_numpy()), axis=0)
+
+
+def run_partitioned(df: 'pd.DataFrame', steps: List[Step], parallel: int, *,
+                    partition_by: Optional[str] = None, stop_on_error: bool = True,
+                    strict_mode: bool = False,
+                    transfer: Optional[str] = None) -> Tuple['pd.DataFrame', Dict[str, Any]]:
+    """
+    Run steps over partitions of df in up to parallel worker processes
+
+    Returns (result, stats) with stats: partitions, transfer and per stage
+    parallel, steps, rows_in, rows_out, seconds.
+    """
+    if transfer is None:
+        transfer = 'arrow' if _has_pyarrow() else 'pickle'
+    elif transfer not in TRANSFERS:
+        raise ValueError(f"transfer must be one of {TRANSFERS}, got {transfer!r}")
+    elif transfer == 'arrow':
+        require_pyarrow()
+
+    stages = plan_stages(steps)
+    n = max(1, min(parallel, len(df) // MIN_PARTITION_ROWS))
+    stats: Dict[str, Any] = {'partitions': n, 'transfer': transfer, 'stages': []}
+    pool = None
+    if n > 1 and any(safe for safe, _ in stages):
+        _check_picklable([step for safe, stage in stages if safe for step in stage])
+        pool = ProcessPoolExecutor(max_workers=n)
+
+    try:
+        result = df
+        for safe, stage in stages:
+            start = time.perf_counter()
+            rows_in = len(result)
+            if safe and pool is not None:
+                parts = split_frame(result, n, partition_by)
+                futures = [pool.submit(_run_partition, _to_payload(part, transfer), stage,
+                                       stop_on_error, strict_mode, transfer)
+                           for part in parts]
+                result = reassemble([frame_from_ipc(future.result()) for future in futures],
+                                    result, partition_by)
+            else:
+                result = apply_steps(result, stage, stop_on_error=stop_on_error, strict_mode=strict_mode)
+            stats['stages'].append({'parallel': safe and pool is not None,
+                                    'steps': [step_name(step) for step in stage],
+                                    'rows_in': rows_in, 'rows_out': len(result),
+                                    'seconds': time.perf_counter() - start})
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return result, stats
+
+
+def step_name(step: Step) -> str:
+    func = getattr(step, 'func', step)  # functools.partial
+    return getattr(func, '__name__', repr(step))
+
+
+def _partition_keys(column: 'pd.Series', n: int) -> 'np.ndarray':
+    """Internal: Partition number of every row, from the hash of its partition_by value"""
+    import numpy as np
+    import pandas as pd
+
+    return pd.util.hash_pandas_object(column, index=False).to_numpy() % np.uint64(n)
+
+
+def _run_partition(payload: Tuple[str, Any, Dict[str, Any]], steps: List[Step], stop_on_error: bool,
+                   strict_mode: bool, transfer: str) -> Tuple[str, Any, Dict[str, Any]]:
+    """Internal: worker, runs one stage on one partition"""
+    result = apply_steps(frame_from_ipc(payload), steps, stop_on_error=stop_on_error, strict_mode=strict_mode)
+    return _to_payload(result, transfer)
+
+
+def _to_payload(df: 'pd.DataFrame', transfer: str) -> Tuple[str, Any, Dict[str, Any]]:
+    return frame_to_ipc(df) if transfer == 'arrow' else ('pickle', df, {})
+
+
+def _check_picklable(steps: List[Step]) -> None:
+    for step in steps:
+        try:
+            pickle.dumps(step)
+        except Exception as e:
+            raise ValueError(f"Partition-safe step '{step_name(step)}' cannot be sent to a worker process "
+                             f"({e}); use a module-level function or functools.partial") from e
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
@@ -0,0 +1,442 @@
+"""
+Blocking-based POI Deduplication
+=====================================
+
+DataProcessor.deduplicate(df) finds the records of one place in a layer
+merged from several sources (vet clinics from BPT, TAEK and OSM, hospitals,
+pharmacies, ...) without comparing every pair of rows:
+
+1. Blocking: candidate pairs only come from rows sharing a block - the
+   same grid cell of about cell_meters or one of its 8 neighbours (so
+   places on either side of a cell edge still meet), or the same
+   normalized postcode. A block of k rows yields k(k-1)/2 pairs, so the
+   work grows with the block sizes instead of n²; blocks of more than
+   max_block_size rows are skipped and counted in the stats.
+2. Scoring: names and streets are normalized (case, umlauts and accents,
+   "Straße"/"Str.", NAME_STOPWORDS such as titles and legal forms) and
+   compared by the Jaccard similarity of their character trigrams, each
+   weighted by its rarity so words most records share count little (for
+   names averaged with the overlap coefficient, so a name contained in a
+   longer one still scores high), all pairs at once on integer trigram
+   codes. House numbers and
+   the distance between coordinates add to the weighted score. Conflicting
+   evidence scales it by MISMATCH_FACTOR: two different house numbers
+   (neighbours on one street) or two names less similar than NAME_MISMATCH
+   (two practices in one building). Fields missing on either side are
+   left out of the average; pairs with fewer than MIN_COMPONENTS comparable
+   fields never match.
+3. Clustering: pairs scoring at least threshold are linked and clusters
+   are their connected components (A~B and B~C put A, B and C together).
+4. Survivors: per cluster the record of the first source in
+   source_priority, then the most complete one, survives; with
+   coalesce=True its empty fields are filled from the other members in
+   the same order.
+
+Columns are found by role (name, street, housenumber, postcode, lat, lon,
+source) under the names in COLUMN_ALIASES, or passed as columns={role: col}.
+A street ending in a house number ("Rathenaustr. 9") is split when the
+house number column is missing or empty.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Edge of a blocking grid cell
+CELL_METERS = 150
+
+# Blocks with more rows are skipped (k(k-1)/2 pairs each)
+MAX_BLOCK_SIZE = 500
+
+# Pairs scoring at least this are the same place
+MATCH_THRESHOLD = 0.7
+
+# Weight of each compared field in the score
+WEIGHTS = {'name': 0.45, 'street': 0.3, 'housenumber': 0.1, 'distance': 0.15}
+
+# Coordinates this far apart (or farther) add nothing to the score
+MAX_DISTANCE_METERS = 250
+
+# Score factor for pairs with different house numbers or conflicting names
+MISMATCH_FACTOR = 0.5
+
+# Names less similar than this conflict
+NAME_MISMATCH = 0.4
+
+# Comparable fields a pair needs before it can match
+MIN_COMPONENTS = 2
+
+# Column names tried per role, in order
+COLUMN_ALIASES = {
+    'name': ('name', 'clinic_name', 'addr_name'),
+    'street': ('street', 'addr_street', 'addr:street'),
+    'housenumber': ('housenumber', 'house_number', 'addr_housenumber', 'addr:housenumber'),
+    'postcode': ('postcode', 'postal_code', 'addr_postcode', 'addr:postcode', 'plz'),
+    'lat': ('latitude', 'lat'),
+    'lon': ('longitude', 'lon', 'lng'),
+    'source': ('source',),
+}
+
+# Name tokens dropped before comparing: titles and legal forms
+NAME_STOPWORDS = frozenset({'dr', 'med', 'vet', 'dent', 'prof', 'dipl', 'gmbh', 'mbh', 'ag', 'kg',
+                            'ohg', 'ug', 'gbr', 'ev', 'e', 'v', 'und', 'co'})
+
+_UMLAUTS = {'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'}
+_HOUSENUMBER = r'\s(\d+(?: ?[a-z])?(?: \d+(?: ?[a-z])?)?)$'  # "str 12", "str 12 a", "str 12 14"
+_EARTH_RADIUS_M = 6_371_000.0
+
+
+@dataclass
+class DedupResult:
+    """Deduplicated frame plus what was matched"""
+    frame: 'pd.DataFrame'  # One row per cluster: the survivors, in input order
+    # Per input row (same index): cluster_id, cluster_size, is_survivor, survivor (index label)
+    clusters: 'pd.DataFrame'
+    # Scored candidate pairs (index labels left/right): name, street, housenumber,
+    # distance_m, score, matched, block ('cell', 'postcode' or 'cell+postcode')
+    pairs: 'pd.DataFrame'
+    # rows, naive_pairs, candidate_pairs, matched_pairs, clusters, duplicates,
+    # blocks, largest_block, skipped_blocks, columns and seconds per phase
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+
+def resolve_columns(df: 'pd.DataFrame', columns: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Role → column of df: columns as given (KeyError if missing), others by COLUMN_ALIASES"""
+    unknown = set(columns or {}) - set(COLUMN_ALIASES)
+    if unknown:
+        raise ValueError(f"Unknown column roles {sorted(unknown)}, expected some of {tuple(COLUMN_ALIASES)}")
+    resolved = {}
+    for role, aliases in COLUMN_ALIASES.items():
+        if columns and role in columns:
+            if columns[role] not in df.columns:
+                raise KeyError(f"{role} column '{columns[role]}' not in the frame")
+            resolved[role] = columns[role]
+            continue
+        found = next((col for col in aliases if col in df.columns), None)
+        if found is not None:
+            resolved[role] = found
+    if 'name' not in resolved and 'street' not in resolved:
+        raise ValueError("deduplicate needs a name or street column to compare records "
+                         f"(looked for {COLUMN_ALIASES['name'] + COLUMN_ALIASES['street']})")
+    if 'postcode' not in resolved and not {'lat', 'lon'} <= set(resolved):
+        raise ValueError("deduplicate needs a postcode column or latitude/longitude columns to block on")
+    return resolved
+
+
+def normalize_text(series: 'pd.Series', stopwords: Iterable[str] = ()) -> 'pd.Series':
+    """Lowercase ASCII words separated by single spaces (umlauts spelled out), stopwords dropped; NA if empty"""
+    import pandas as pd
+
+    text = series.astype('string').str.lower()
+    for umlaut, spelled in _UMLAUTS.items():
+        text = text.str.replace(umlaut, spelled, regex=False)
+    text = (text.str.normalize('NFKD').str.replace('[\u0300-\u036f]', '', regex=True)  # Accents
+            .str.replace(r'[^a-z0-9]+', ' ', regex=True).str.strip())
+    stopwords = frozenset(stopwords)
+    if stopwords:
+        # Per distinct value: names repeat across sources
+        codes, uniques = pd.factorize(text)
+        kept = [' '.join(word for word in value.split() if word not in stopwords) for value in uniques]
+        text = pd.Series(pd.array(kept, dtype='string').take(codes, allow_fill=True), index=series.index)
+    return text.mask(text == '')
+
+
+def normalize_street(street: 'pd.Series',
+                     housenumber: Optional['pd.Series'] = None) -> Tuple['pd.Series', 'pd.Series']:
+    """(street name, house number) normalized; a trailing number moves out of the street if housenumber is empty"""
+    import pandas as pd
+
+    text = normalize_text(street)
+    text = text.str.replace(r'(?<=[a-z])(strasse|str)\b', 'str', regex=True)
+    text = text.str.replace(r'\b(strasse|str)\b', 'str', regex=True)
+    if housenumber is None:
+        number = pd.Series(pd.NA, index=street.index, dtype='string')
+    else:
+        number = normalize_housenumber(housenumber)
+    trailing = text.str.extract(_HOUSENUMBER, expand=False)
+    split = number.isna() & trailing.notna()
+    text = text.where(~split, text.str.replace(_HOUSENUMBER, '', regex=True).str.strip())
+    number = number.fillna(trailing.str.replace(' ', '', regex=False))
+    return text.mask(text == ''), number
+
+
+def normalize_housenumber(series: 'pd.Series') -> 'pd.Series':
+    """House numbers without spaces: "12 a" as "12a", 12.0 as "12", "12-14" as "1214"; NA if empty"""
+    number = normalize_text(series.astype('string').str.replace(r'\.0$', '', regex=True))
+    return number.str.replace(' ', '', regex=False)
+
+
+def normalize_postcode(series: 'pd.Series') -> 'pd.Series':
+    """Five-digit postcode strings ("12683" from 12683, 12683.0 or "D-12683"), NA otherwise"""
+    digits = series.astype('string').str.extract(r'(\d{4,5})(?:\.0)?\b', expand=False)
+    return digits.str.zfill(5)
+
+
+def block_pairs(keys: 'pd.DataFrame', max_block_size: int = MAX_BLOCK_SIZE) -> Tuple['pd.DataFrame', Dict[str, int]]:
+    """
+    Candidate pairs (left < right row positions) of rows sharing all key
+    columns of keys (one row per record, NA keys never pair)
+
+    Returns (pairs, stats: blocks, largest_block, skipped_blocks, skipped_rows).
+    """
+    import numpy as np
+    import pandas as pd
+
+    keys = keys.dropna()
+    cols = list(keys.columns)
+    sizes = keys.groupby(cols, sort=False).size()
+    oversized = sizes[sizes > max_block_size]
+    if len(oversized):
+        keys = keys[~keys.set_index(cols).index.isin(oversized.index)]
+    stats = {'blocks': len(sizes), 'largest_block': int(sizes.max()) if len(sizes) else 0,
+             'skipped_blocks': len(oversized), 'skipped_rows': int(oversized.sum())}
+    rows = keys.reset_index(names='left')
+    pairs = rows.merge(rows.rename(columns={'left': 'right'}), on=cols)
+    pairs = pairs[pairs['left'].to_numpy() < pairs['right'].to_numpy()]
+    return pairs[['left', 'right']].astype(np.int64).reset_index(drop=True), stats
+
+
+def grid_pairs(lat: 'np.ndarray', lon: 'np.ndarray', cell_meters: float = CELL_METERS,
+               max_block_size: int = MAX_BLOCK_SIZE) -> Tuple['pd.DataFrame', Dict[str, int]]:
+    """Candidate pairs of rows in the same or neighbouring grid cells (NaN coordinates never pair)"""
+    import numpy as np
+    import pandas as pd
+
+    present = ~(np.isnan(lat) | np.isnan(lon))
+    if not present.any():
+        return pd.DataFrame({'left': [], 'right': []}, dtype=np.int64), {
+            'blocks': 0, 'largest_block': 0, 'skipped_blocks': 0, 'skipped_rows': 0}
+    lat_step = cell_meters / (math.pi * _EARTH_RADIUS_M / 180)
+    lon_step = lat_step / max(math.cos(math.radians(float(np.mean(lat[present])))), 0.01)
+    rows = np.flatnonzero(present)
+    cells = pd.DataFrame({'cx': np.floor(lon[rows] / lon_step).astype(np.int64),
+                          'cy': np.floor(lat[rows] / lat_step).astype(np.int64)}, index=rows)
+
+    sizes = cells.groupby(['cx', 'cy'], sort=False).size()
+    oversized = sizes[sizes > max_block_size]
+    if len(oversized):
+        cells = cells[~cells.set_index(['cx', 'cy']).index.isin(oversized.index)]
+    stats = {'blocks': len(sizes), 'largest_block': int(sizes.max()),
+             'skipped_blocks': len(oversized), 'skipped_rows': int(oversized.sum())}
+
+    # Each row meets the rows of its own cell and of the 8 around it
+    left = cells.reset_index(names='left')
+    shifted = pd.concat([pd.DataFrame({'right': left['left'], 'cx': left['cx'] + dx, 'cy': left['cy'] + dy})
+                         for dx in (-1, 0, 1) for dy in (-1, 0, 1)], ignore_index=True)
+    pairs = left.merge(shifted, on=['cx', 'cy'])
+    pairs = pairs[pairs['left'].to_numpy() < pairs['right'].to_numpy()]
+    return pairs[['left', 'right']].astype(np.int64).reset_index(drop=True), stats
+
+
+def trigram_similarity(text: 'pd.Series', left: 'np.ndarray', right: 'np.ndarray',
+                       containment: bool = False) -> 'np.ndarray':
+    """
+    Weighted Jaccard similarity of the character trigrams of text[left] and
+    text[right] (positions), NaN where either side is NA
+
+    Each trigram weighs log(1 + values / values containing it), so words
+    most values share ("tierarztpraxis", "apotheke", "str") count little
+    next to the distinctive ones. With containment it is the mean of
+    Jaccard and the overlap coefficient (shared weight over the smaller
+    side), so "Praxis Weber" still scores high against "Tierarztpraxis
+    Dr. Weber".
+
+    Trigrams are built once per distinct value and each distinct pair of
+    values is scored once: the left value's trigram codes are looked up in
+    the sorted (value, trigram) codes of all values.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(text, use_na_sentinel=True)
+    result = np.full(len(left), np.nan)
+    a, b = codes[left], codes[right]
+    both = (a >= 0) & (b >= 0)
+    if not both.any():
+        return result
+
+    grams = [{f"  {value} "[i:i + 3] for i in range(len(value) + 1)} for value in uniques]
+    sizes = np.array([len(value) for value in grams], dtype=np.int64)
+    owner = np.repeat(np.arange(len(grams)), sizes)
+    gram_codes, _ = pd.factorize(np.fromiter((g for value in grams for g in value), dtype=object,
+                                             count=int(sizes.sum())))
+    width = np.int64(gram_codes.max() + 1)
+    table = np.sort(owner * width + gram_codes)  # (value, trigram) keys
+    gram_weight = np.log1p(len(uniques) / np.bincount(gram_codes))
+    mass = np.bincount(owner, weights=gram_weight[gram_codes], minlength=len(uniques))
+
+    # Distinct (a, b) combinations only: the same two spellings recur across blocks
+    inverse, combos = pd.factorize(b[both].astype(np.int64) * len(uniques) + a[both], sort=True)
+    combo_b, combo_a = np.divmod(combos, len(uniques))  # By right value: lookups walk the table in order
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    lengths = sizes[combo_a]
+    combo = np.repeat(np.arange(len(combos)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    grams_a = gram_codes[starts[combo_a][combo] + offsets]
+    keys = combo_b[combo] * width + grams_a
+    found = np.searchsorted(table, keys)
+    hit = table[np.minimum(found, len(table) - 1)] == keys
+    inter = np.bincount(combo[hit], weights=gram_weight[grams_a[hit]], minlength=len(combos))
+    similarity = inter / (mass[combo_a] + mass[combo_b] - inter)
+    if containment:
+        similarity = (similarity + inter / np.minimum(mass[combo_a], mass[combo_b])) / 2
+    result[both] = similarity[inverse]
+    return result
+
+
+def haversine_meters(lat1: 'np.ndarray', lon1: 'np.ndarray',
+                     lat2: 'np.ndarray', lon2: 'np.ndarray') -> 'np.ndarray':
+    import numpy as np
+
+    lat1, lon1, lat2, lon2 = (np.radians(values) for values in (lat1, lon1, lat2, lon2))
+    h = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * _EARTH_RADIUS_M * np.arcsin(np.sqrt(h))
+
+
+def connected_components(n: int, left: 'np.ndarray', right: 'np.ndarray') -> 'np.ndarray':
+    """Component label per node 0..n-1 (the smallest node of its component) for edges left-right"""
+    import numpy as np
+
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[left], labels[right])
+        new = labels.copy()
+        np.minimum.at(new, left, low)
+        np.minimum.at(new, right, low)
+        new = new[new]  # Pointer jumping: follow labels to their own label
+        if np.array_equal(new, labels):
+            return labels
+        labels = new
+
+
+def deduplicate(df: 'pd.DataFrame', *, columns: Optional[Dict[str, str]] = None,
+                cell_meters: float = CELL_METERS, threshold: float = MATCH_THRESHOLD,
+                weights: Optional[Dict[str, float]] = None,
+                source_priority: Optional[Sequence[Any]] = None, coalesce: bool = True,
+                max_block_size: int = MAX_BLOCK_SIZE,
+                name_stopwords: Iterable[str] = NAME_STOPWORDS) -> DedupResult:
+    """Block, score, cluster and pick survivors (see the module docstring)"""
+    import numpy as np
+    import pandas as pd
+
+    weights = {**WEIGHTS, **(weights or {})}
+    unknown = set(weights) - set(WEIGHTS)
+    if unknown:
+        raise ValueError(f"Unknown weights {sorted(unknown)}, expected some of {tuple(WEIGHTS)}")
+    roles = resolve_columns(df, columns)
+    n = len(df)
+    seconds: Dict[str, float] = {}
+    start = time.perf_counter()
+
+    # Normalize the compared fields once per row
+    empty = pd.Series(pd.NA, index=pd.RangeIndex(n), dtype='string')
+    fields = {role: df[col].reset_index(drop=True) for role, col in roles.items()}
+    name = normalize_text(fields['name'], name_stopwords) if 'name' in fields else empty
+    if 'street' in fields:
+        street, number = normalize_street(fields['street'], fields.get('housenumber'))
+    else:
+        street = empty
+        number = normalize_housenumber(fields['housenumber']) if 'housenumber' in fields else empty
+    postcode = normalize_postcode(fields['postcode']) if 'postcode' in fields else empty
+    if {'lat', 'lon'} <= set(fields):
+        lat = pd.to_numeric(fields['lat'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        lon = pd.to_numeric(fields['lon'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    else:
+        lat = lon = np.full(n, np.nan)
+    seconds['normalize'] = time.perf_counter() - start
+
+    # Block: grid cells (with neighbours) and postcodes, one row per distinct pair
+    start = time.perf_counter()
+    cell, cell_stats = grid_pairs(lat, lon, cell_meters, max_block_size)
+    by_postcode, postcode_stats = block_pairs(pd.DataFrame({'postcode': postcode}), max_block_size)
+    found = np.concatenate([cell['left'].to_numpy() * n + cell['right'].to_numpy(),
+                            by_postcode['left'].to_numpy() * n + by_postcode['right'].to_numpy()])
+    pair_keys, inverse = np.unique(found, return_inverse=True)
+    block = np.zeros(len(pair_keys), dtype=np.int64)  # Bit 1: same cell area, bit 2: same postcode
+    np.bitwise_or.at(block, inverse, np.repeat([1, 2], [len(cell), len(by_postcode)]))
+    left, right = np.divmod(pair_keys, n) if n else (pair_keys, pair_keys)
+    seconds['block'] = time.perf_counter() - start
+
+    # Score every candidate pair at once
+    start = time.perf_counter()
+    numbers = number.to_numpy(dtype=object, na_value=None)
+    same_number = np.where(pd.isna(numbers[left]) | pd.isna(numbers[right]), np.nan,
+                           (numbers[left] == numbers[right]).astype(float))
+    distance = haversine_meters(lat[left], lon[left], lat[right], lon[right])
+    components = {
+        'name': trigram_similarity(name, left, right, containment=True),
+        'street': trigram_similarity(street, left, right),
+        'housenumber': same_number,
+        'distance': np.clip(1 - distance / MAX_DISTANCE_METERS, 0, 1),
+    }
+    total = np.zeros(len(pair_keys))
+    weight = np.zeros(len(pair_keys))
+    compared = np.zeros(len(pair_keys), dtype=np.int64)
+    for key, values in components.items():
+        present = ~np.isnan(values)
+        total += np.where(present, values * weights[key], 0)
+        weight += np.where(present, weights[key], 0)
+        compared += present
+    with np.errstate(invalid='ignore', divide='ignore'):
+        score = np.where(weight > 0, total / weight, np.nan)
+    score = np.where(same_number == 0, score * MISMATCH_FACTOR, score)
+    score = np.where(components['name'] < NAME_MISMATCH, score * MISMATCH_FACTOR, score)
+    matched = (compared >= MIN_COMPONENTS) & (score >= threshold)
+    seconds['score'] = time.perf_counter() - start
+
+    # Cluster: connected components of the matched pairs
+    start = time.perf_counter()
+    labels = connected_components(n, left[matched], right[matched])
+    cluster_id, _ = pd.factorize(labels)
+    cluster_size = np.bincount(cluster_id)[cluster_id]
+    seconds['cluster'] = time.perf_counter() - start
+
+    # Survivors: source priority, then completeness, then input order
+    start = time.perf_counter()
+    if source_priority is not None and 'source' in fields:
+        rank = {source: i for i, source in enumerate(source_priority)}
+        priority = fields['source'].map(rank).fillna(len(rank)).to_numpy(dtype=np.int64)
+    else:
+        priority = np.zeros(n, dtype=np.int64)
+    filled = df.notna().sum(axis=1).to_numpy()
+    order = np.lexsort((np.arange(n), -filled, priority, cluster_id))
+    first = np.ones(n, dtype=bool)
+    first[1:] = cluster_id[order][1:] != cluster_id[order][:-1]
+    survivor_of_cluster = order[first]  # Indexed by cluster id
+    survivor = survivor_of_cluster[cluster_id]
+    is_survivor = survivor == np.arange(n)
+
+    kept = np.flatnonzero(is_survivor)
+    frame = df.iloc[kept]
+    merged = order[cluster_size[order] > 1]
+    if coalesce and len(merged):
+        # First non-null value per column in survivor order, only for clusters with duplicates
+        values = df.iloc[merged].groupby(cluster_id[merged], sort=True).first()
+        values.index = np.searchsorted(kept, survivor_of_cluster[values.index.to_numpy()])
+        frame = frame.reset_index(drop=True).fillna(values).set_axis(frame.index, axis=0)
+    seconds['survivors'] = time.perf_counter() - start
+
+    clusters = pd.DataFrame({'cluster_id': cluster_id, 'cluster_size': cluster_size,
+                             'is_survivor': is_survivor, 'survivor': df.index.take(survivor)},
+                            index=df.index)
+    pairs = pd.DataFrame({'left': df.index.take(left), 'right': df.index.take(right),
+                          **{key: values for key, values in components.items() if key != 'distance'},
+                          'distance_m': distance, 'score': score, 'matched': matched,
+                          'block': np.array(['', 'cell', 'postcode', 'cell+postcode'])[block]})
+    stats = {
+        'rows': n,
+        'naive_pairs': n * (n - 1) // 2,
+        'candidate_pairs': len(pair_keys),
+        'matched_pairs': int(matched.sum()),
+        'clusters': int(cluster_id.max() + 1) if n else 0,
+        'duplicates': int((~is_survivor).sum()),
+        'blocks': {'cell': cell_stats, 'postcode': postcode_stats},
+        'columns': roles,
+        'seconds': seconds,
+    }
+    return DedupResult(frame=frame, clusters=clusters, pairs=pairs, stats=stats)
@@ -0,0 +1,236 @@
+"""
+Compiled Validation Rules
+=====================================
+
+DataProcessor.validate(df, checks) takes declarative checks instead of
+Python callables that loop over rows. compile_checks() turns them into
+Rule objects grouped by column, and evaluate_rules() computes one boolean
+failure mask per rule with NumPy/pandas vectorized operations:
+
+    checks = {
+        "required_columns": ["osm_id", "name", "latitude", "longitude"],
+        "non_null": ["osm_id", "name"],
+        "ranges": {"capacity": (0, None), "opened": ("1900-01-01", None)},
+        "regex": {"postcode": r"1[0-4]\\d{3}", "email": r"[^@\\s]+@[^@\\s]+\\.\\w+"},
+        "allowed_values": {"wheelchair": ["yes", "no", "limited", "unknown"]},
+        "unique": ["osm_id", ["street", "housenumber"]],
+        "within_bbox": {"lat": "latitude", "lon": "longitude"},   # Berlin by default
+        "foreign_keys": {"district_id": districts["district_id"]},
+    }
+
+Each column is read once: its null mask is computed once, and the text
+rules (regex, allowed_values, foreign_keys) plus single-column uniqueness
+share one pd.factorize() of the column - they are evaluated on the
+distinct values and mapped back to the rows through the codes, so a
+million-row column with a few thousand distinct postcodes runs the regex
+a few thousand times.
+
+Nulls only fail non_null; every other rule skips them (as SQL constraints
+do). Numeric ranges and within_bbox compare text columns as numbers, where
+text that is no number fails. Failing values are sampled up to max_samples
+per rule.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# (min_lat, min_lon, max_lat, max_lon) around Berlin's state border
+BERLIN_BBOX = (52.3383, 13.0884, 52.6755, 13.7611)
+
+# Failing values kept per rule in ValidationResult.sample_failures
+MAX_SAMPLES = 5
+
+# Check keys understood by compile_checks (plus "custom", run as callables)
+CHECK_KINDS = ('required_columns', 'non_null', 'ranges', 'regex', 'allowed_values',
+               'unique', 'within_bbox', 'foreign_keys')
+
+# Rule kinds evaluated on the distinct values of a factorized column
+_FACTORIZED = frozenset({'regex', 'allowed_values', 'foreign_keys', 'unique'})
+
+
+@dataclass
+class Rule:
+    """One compiled check on one column (or a column group for unique/within_bbox)"""
+    name: str  # e.g. "regex:postcode", used in issues, stats and sample_failures
+    kind: str
+    columns: Tuple[str, ...]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RuleOutcome:
+    """Evaluation of one rule"""
+    rule: Rule
+    failed: int
+    checked: int  # Non-null rows the rule looked at
+    seconds: float
+    samples: List[Any] = field(default_factory=list)
+    missing_columns: List[str] = field(default_factory=list)
+
+
+def compile_checks(checks: Dict[str, Any]) -> List[Rule]:
+    """
+    Rules from a checks dict (see the module docstring), validated up front:
+    unknown keys raise ValueError and regexes are compiled once
+    """
+    unknown = set(checks) - set(CHECK_KINDS) - {'custom'}
+    if unknown:
+        raise ValueError(f"Unknown checks {sorted(unknown)}, expected some of {CHECK_KINDS + ('custom',)}")
+
+    rules: List[Rule] = []
+    for col in checks.get('required_columns', []):
+        rules.append(Rule(f"required_columns:{col}", 'required_columns', (col,)))
+    for col in checks.get('non_null', []):
+        rules.append(Rule(f"non_null:{col}", 'non_null', (col,)))
+    for col, bounds in checks.get('ranges', {}).items():
+        low, high = bounds
+        rules.append(Rule(f"ranges:{col}", 'ranges', (col,), {'min': low, 'max': high}))
+    for col, pattern in checks.get('regex', {}).items():
+        rules.append(Rule(f"regex:{col}", 'regex', (col,), {'pattern': re.compile(pattern).pattern}))
+    for col, values in checks.get('allowed_values', {}).items():
+        rules.append(Rule(f"allowed_values:{col}", 'allowed_values', (col,), {'values': _as_index(values)}))
+    for col, keys in checks.get('foreign_keys', {}).items():
+        rules.append(Rule(f"foreign_keys:{col}", 'foreign_keys', (col,), {'values': _as_index(keys)}))
+    for cols in checks.get('unique', []):
+        cols = (cols,) if isinstance(cols, str) else tuple(cols)
+        rules.append(Rule(f"unique:{'+'.join(cols)}", 'unique', cols))
+    bbox = checks.get('within_bbox')
+    if bbox:
+        bbox = {} if bbox is True else dict(bbox)
+        lat, lon = bbox.get('lat', 'latitude'), bbox.get('lon', 'longitude')
+        rules.append(Rule(f"within_bbox:{lat}+{lon}", 'within_bbox', (lat, lon),
+                          {'bbox': tuple(bbox.get('bbox', BERLIN_BBOX))}))
+    return rules
+
+
+def evaluate_rules(df: 'pd.DataFrame', rules: List[Rule],
+                   max_samples: int = MAX_SAMPLES) -> List[RuleOutcome]:
+    """Evaluate rules column by column, sharing null masks and factorizations per column"""
+    import pandas as pd
+
+    nulls: Dict[str, 'np.ndarray'] = {}
+    factorized: Dict[str, Tuple['np.ndarray', 'pd.Index']] = {}
+    outcomes = []
+    for rule in sorted(rules, key=lambda rule: rule.columns):
+        start = time.perf_counter()
+        if rule.columns[0] not in factorized:
+            factorized.clear()  # Rules are grouped by column; keep one column's codes at a time
+        missing = [col for col in rule.columns if col not in df.columns]
+        if missing:
+            failed = len(missing) if rule.kind == 'required_columns' else 0
+            outcomes.append(RuleOutcome(rule, failed, 0, time.perf_counter() - start,
+                                        missing_columns=missing))
+            continue
+        if rule.kind == 'required_columns':
+            outcomes.append(RuleOutcome(rule, 0, 0, time.perf_counter() - start))
+            continue
+
+        for col in rule.columns:
+            if col not in nulls:
+                nulls[col] = df[col].isna().to_numpy()
+        if rule.kind in _FACTORIZED and len(rule.columns) == 1 and rule.columns[0] not in factorized:
+            factorized[rule.columns[0]] = pd.factorize(df[rule.columns[0]], use_na_sentinel=True)
+
+        mask = _failure_mask(df, rule, nulls, factorized)
+        skipped = nulls[rule.columns[0]] if rule.kind != 'within_bbox' else (
+            nulls[rule.columns[0]] | nulls[rule.columns[1]])
+        checked = len(df) if rule.kind == 'non_null' else len(df) - int(skipped.sum())
+        failed = int(mask.sum())
+        samples = _sample(df, rule, mask, max_samples) if failed and max_samples else []
+        outcomes.append(RuleOutcome(rule, failed, checked, time.perf_counter() - start, samples))
+
+    order = {id(rule): i for i, rule in enumerate(rules)}
+    return sorted(outcomes, key=lambda outcome: order[id(outcome.rule)])
+
+
+def _failure_mask(df: 'pd.DataFrame', rule: Rule, nulls: Dict[str, 'np.ndarray'],
+                  factorized: Dict[str, Tuple['np.ndarray', 'pd.Index']]) -> 'np.ndarray':
+    """Internal: True for rows failing the rule"""
+    import numpy as np
+    import pandas as pd
+
+    col = rule.columns[0]
+    if rule.kind == 'non_null':
+        return nulls[col]
+
+    if rule.kind == 'ranges':
+        series = df[col]
+        mask = np.zeros(len(df), dtype=bool)
+        bounds = [bound for bound in (rule.params['min'], rule.params['max']) if bound is not None]
+        if (all(isinstance(bound, (int, float, np.number)) for bound in bounds)
+                and not pd.api.types.is_numeric_dtype(series.dtype)
+                and not pd.api.types.is_datetime64_any_dtype(series.dtype)):
+            # Numbers read as text are compared as numbers (like within_bbox); other text fails
+            series = pd.to_numeric(series, errors='coerce')
+            mask |= series.isna().to_numpy()
+        for bound, fails in ((rule.params['min'], np.less), (rule.params['max'], np.greater)):
+            if bound is not None:
+                if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                    bound = pd.Timestamp(bound)
+                mask |= fails(series, bound).to_numpy(dtype=bool, na_value=False)
+        return mask & ~nulls[col]
+
+    if rule.kind == 'within_bbox':
+        lat_col, lon_col = rule.columns
+        min_lat, min_lon, max_lat, max_lon = rule.params['bbox']
+        lat = pd.to_numeric(df[lat_col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        lon = pd.to_numeric(df[lon_col], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        inside = (lat >= min_lat) & (lat <= max_lat) & (lon >= min_lon) & (lon <= max_lon)
+        return ~inside & ~nulls[lat_col] & ~nulls[lon_col]
+
+    if rule.kind == 'unique' and len(rule.columns) > 1:
+        subset = list(rule.columns)
+        present = ~df[subset].isna().any(axis=1).to_numpy()
+        return df.duplicated(subset=subset, keep=False).to_numpy() & present
+
+    codes, uniques = factorized[col]
+    if rule.kind == 'unique':
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        bad = counts > 1
+    elif rule.kind == 'regex':
+        matched = pd.Series(uniques.astype(str)).str.fullmatch(rule.params['pattern'])
+        bad = ~matched.to_numpy(dtype=bool, na_value=False)
+    else:  # allowed_values, foreign_keys
+        bad = ~uniques.isin(rule.params['values'])
+        bad = np.asarray(bad, dtype=bool)
+    # Nulls have code -1 and never fail
+    return np.concatenate([bad, [False]])[codes]
+
+
+def _sample(df: 'pd.DataFrame', rule: Rule, mask: 'np.ndarray', max_samples: int) -> List[Any]:
+    """Internal: First failing values (a dict per row for multi-column rules)"""
+    import numpy as np
+
+    # Scan in growing windows so a rule failing early does not visit the whole mask
+    rows = np.empty(0, dtype=np.intp)
+    window = 4096
+    start = 0
+    while start < len(mask) and len(rows) < max_samples:
+        rows = np.concatenate([rows, start + np.flatnonzero(mask[start:start + window])])
+        start += window
+        window *= 4
+    rows = rows[:max_samples]
+    if len(rule.columns) == 1:
+        return [_plain(value) for value in df[rule.columns[0]].iloc[rows]]
+    return [{col: _plain(value) for col, value in zip(rule.columns, values)}
+            for values in df[list(rule.columns)].iloc[rows].itertuples(index=False)]
+
+
+def _as_index(values: Union[Sequence[Any], 'pd.Series', 'pd.Index', set]) -> 'pd.Index':
+    """Internal: Allowed values or foreign keys as a hashed pd.Index (duplicates dropped)"""
+    import pandas as pd
+
+    if isinstance(values, (set, frozenset)):
+        values = list(values)
+    return pd.Index(pd.unique(pd.Series(values).dropna()))
+
+
+def _plain(value: Any) -> Any:
+    """NumPy scalars as Python values, for printing and JSON"""
+    return value.item() if hasattr(value, 'item') and not hasattr(value, 'tzinfo') else value
@@ -0,0 +1,14 @@
+"""
+Test setup: import the subpackages as db_population_utils.* without running
+db_population_utils/__init__, which needs the database dependencies
+"""
+
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+package = types.ModuleType('db_population_utils')
+package.__path__ = [str(ROOT)]
+sys.modules.setdefault('db_population_utils', package)
@@ -0,0 +1,57 @@
+"""on_bad_lines / error_tolerance: malformed CSV rows dropped in one pass"""
+
+import json
+
+import pytest
+
+from db_population_utils.data_loader.data_loader import BadLinesError, LoadOptions
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+
+@pytest.fixture
+def broken_csv(tmp_path):
+    """1000 rows, every 100th with an extra field"""
+    path = tmp_path / 'haltestellen.csv'
+    rows = [f'{i},Halt {i},{52 + i / 1000}' + (',zuviel' if i % 100 == 99 else '') for i in range(1000)]
+    path.write_text('id,name,lat\n' + '\n'.join(rows) + '\n')
+    return path
+
+
+def test_load_options_skip_drops_bad_lines_without_a_limit(broken_csv):
+    loader = SmartAutoDataLoader(verbose=False)
+
+    df = loader.load(str(broken_csv), options=LoadOptions(on_bad_lines='skip'))
+
+    assert len(df) == 990
+    assert 99 not in df['id'].tolist()
+    assert loader._last_load['bad_lines']['bad_rows'] == 10
+
+
+def test_load_options_warn_reports_every_bad_line(broken_csv):
+    with pytest.warns(UserWarning, match='bad line skipped') as caught:
+        df = SmartAutoDataLoader(verbose=False).load(str(broken_csv), options=LoadOptions(on_bad_lines='warn'))
+
+    assert len(df) == 990
+    assert len([w for w in caught if 'bad line skipped' in str(w.message)]) == 10
+
+
+def test_load_options_limit_skip_when_error_tolerance_is_set(broken_csv):
+    with pytest.raises(BadLinesError, match='error_tolerance=0.5%'):
+        SmartAutoDataLoader(verbose=False).load(str(broken_csv),
+                                                options=LoadOptions(on_bad_lines='skip', error_tolerance=0.5))
+
+
+def test_load_options_quarantine_keeps_the_default_limit(broken_csv):
+    with pytest.raises(BadLinesError, match='error_tolerance=0.0%'):
+        SmartAutoDataLoader(verbose=False).load(str(broken_csv), options=LoadOptions(on_bad_lines='quarantine'))
+
+
+def test_quarantine_writes_bad_rows_with_line_numbers(broken_csv, tmp_path):
+    quarantine = tmp_path / 'bad.jsonl'
+    df = SmartAutoDataLoader(verbose=False).load_csv(str(broken_csv), error_tolerance=2.0,
+                                                     quarantine_path=str(quarantine))
+
+    entries = [json.loads(line) for line in quarantine.read_text().splitlines()]
+    assert len(df) == 990
+    assert [entry['line'] for entry in entries] == [101 + 100 * k for k in range(10)]
+    assert entries[0]['raw'] == '99,Halt 99,52.099,zuviel'
@@ -0,0 +1,83 @@
+"""gzip/bz2/xz files and zip members read as decompressing streams (compressed_source.py)"""
+
+import bz2
+import gzip
+import lzma
+import zipfile
+
+import pandas as pd
+import pytest
+
+from db_population_utils.data_loader.compressed_source import (detect_compression, split_member,
+                                                               uncompressed_size)
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+CSV = ('id;name;betrag;datum\n'
+       + ''.join(f'{i};Verein {i};{i},50;{1 + i % 28:02d}.09.2025\n' for i in range(500))).encode('utf-8')
+
+COMPRESSORS = {'gzip': gzip.compress, 'bz2': bz2.compress, 'xz': lzma.compress}
+
+
+@pytest.fixture
+def plain(tmp_path):
+    path = tmp_path / 'vereine.csv'
+    path.write_bytes(CSV)
+    return SmartAutoDataLoader(verbose=False, use_profiles=False).load(str(path))
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = tmp_path / 'export.zip'
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('daten/vereine.csv', CSV)
+        zf.writestr('LIESMICH.txt', 'Vereine in Berlin')
+    return path
+
+
+@pytest.mark.parametrize('compression', sorted(COMPRESSORS))
+def test_compressed_file_loads_like_the_plain_one(tmp_path, plain, compression):
+    path = tmp_path / 'vereine.csv.gz'  # Misnamed for bz2/xz: the magic bytes decide
+    path.write_bytes(COMPRESSORS[compression](CSV))
+
+    df = SmartAutoDataLoader(verbose=False, use_profiles=False).load(str(path))
+
+    assert detect_compression(str(path)) == compression
+    pd.testing.assert_frame_equal(df, plain)
+
+
+def test_gzip_stream_in_chunks(tmp_path, plain):
+    path = tmp_path / 'vereine.csv.gz'
+    path.write_bytes(gzip.compress(CSV))
+
+    chunks = list(SmartAutoDataLoader(verbose=False, use_profiles=False).load(str(path), chunksize=200))
+
+    assert [len(chunk) for chunk in chunks] == [200, 200, 100]
+    assert uncompressed_size(str(path), None, 'gzip') == len(CSV)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), plain, check_dtype=False)
+
+
+def test_zip_member_loads_like_the_plain_file(archive, plain):
+    source = f'{archive}::daten/vereine.csv'
+
+    df = SmartAutoDataLoader(verbose=False, use_profiles=False).load(source)
+
+    assert split_member(source) == (str(archive), 'daten/vereine.csv')
+    assert uncompressed_size(str(archive), 'daten/vereine.csv', 'zip') == len(CSV)
+    pd.testing.assert_frame_equal(df, plain)
+
+
+def test_zip_member_is_required_with_several_files(archive):
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+
+    with pytest.raises(ValueError, match='pick one'):
+        loader.load(str(archive))
+    with pytest.raises(FileNotFoundError, match='fehlt.csv'):
+        loader.load(f'{archive}::fehlt.csv')
+
+
+def test_single_file_zip_needs_no_member(tmp_path, plain):
+    path = tmp_path / 'vereine.zip'
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('vereine.csv', CSV)
+
+    pd.testing.assert_frame_equal(SmartAutoDataLoader(verbose=False, use_profiles=False).load(str(path)), plain)
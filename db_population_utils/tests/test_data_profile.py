@@ -0,0 +1,84 @@
+"""DataProfile: mergeable streaming summaries (data_profile.py)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from db_population_utils.data_processor.data_profile import DataProfile, profile_chunks, profile_frame
+
+
+@pytest.fixture
+def listings():
+    rng = np.random.default_rng(9)
+    rows = 40000
+    miete = rng.lognormal(7, 0.4, rows)
+    miete[rng.random(rows) < 0.05] = np.nan
+    return pd.DataFrame({
+        'miete': miete,
+        'zimmer': rng.choice([1, 2, 3, 4], rows, p=[0.2, 0.4, 0.3, 0.1]),
+        'bezirk': rng.choice(['Mitte', 'Pankow', 'Neukölln', None], rows, p=[0.5, 0.3, 0.15, 0.05]),
+        'datum': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D'),
+    })
+
+
+def chunks_of(df, size):
+    return (df.iloc[start:start + size] for start in range(0, len(df), size))
+
+
+def test_merged_profiles_equal_a_single_pass(listings):
+    single = profile_frame(listings).summary()
+    merged = DataProfile()
+    for part in chunks_of(listings, 7000):
+        merged.merge(DataProfile().update(part))
+    merged = merged.summary()
+
+    assert merged['rows'] == single['rows'] == len(listings)
+    for name, column in single['columns'].items():
+        other = merged['columns'][name]
+        for key in ('dtype', 'nulls', 'min', 'max'):
+            assert other.get(key) == column.get(key), (name, key)
+        if column['topk_error'] == 0:  # Counted exactly; unique floats only have a bounded count
+            assert other['top_values'] == column['top_values'], name
+        for key in ('mean', 'std', 'memory_mb'):
+            if key in column:
+                assert other[key] == pytest.approx(column[key], rel=1e-9), (name, key)
+
+
+def test_moments_and_quantiles_match_pandas(listings):
+    stats = profile_chunks(chunks_of(listings, 5000)).summary()['columns']['miete']
+    miete = listings['miete'].dropna()
+
+    assert stats['nulls'] == listings['miete'].isna().sum()
+    assert stats['mean'] == pytest.approx(miete.mean(), rel=1e-12)
+    assert stats['std'] == pytest.approx(miete.std(), rel=1e-12)
+    for q in (0.01, 0.5, 0.99):
+        rank = (miete <= stats[f'p{round(q * 100):g}']).mean()
+        assert rank == pytest.approx(q, abs=0.01)
+
+
+def test_top_values_and_dates(listings):
+    columns = profile_chunks(chunks_of(listings, 5000)).summary()['columns']
+
+    assert columns['bezirk']['top_values'] == list(listings['bezirk'].value_counts().items())
+    assert [value for value, _ in columns['zimmer']['top_values']] == ['2', '3', '1', '4']
+    assert (columns['datum']['min'], columns['datum']['max']) == (listings['datum'].min(), listings['datum'].max())
+
+
+def test_saved_profile_merges_and_diffs(listings, tmp_path):
+    path = tmp_path / 'listings.profile.json'
+    profile_frame(listings.iloc[:20000]).save(path)
+    restored = DataProfile.load(path).merge(profile_frame(listings.iloc[20000:]))
+
+    assert restored.summary()['columns']['miete']['mean'] == pytest.approx(listings['miete'].mean(), rel=1e-9)
+
+    changed = listings.assign(miete=listings['miete'] * 1.5, balkon=True)
+    changes = profile_frame(changed).diff(profile_frame(listings))
+    assert changes['added_columns'] == ['balkon']
+    assert 'mean' in changes['columns']['miete']
+    assert 'bezirk' not in changes['columns']
+
+
+def test_column_first_seen_later_counts_nulls_before_it():
+    profile = DataProfile().update(pd.DataFrame({'a': [1, 2]})).update(pd.DataFrame({'a': [3], 'b': ['x']}))
+
+    assert profile.summary()['columns']['b']['nulls'] == 2
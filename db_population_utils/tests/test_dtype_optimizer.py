@@ -0,0 +1,61 @@
+"""plan_dtypes: compact dtypes planned from a parsed sample"""
+
+import pandas as pd
+import pytest
+
+from db_population_utils.data_loader import smart_auto_data_loader
+from db_population_utils.data_loader.data_loader import LoadStrategy
+from db_population_utils.data_loader.dtype_optimizer import plan_dtypes
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+
+@pytest.mark.parametrize('dtype', [object, 'str', 'string[pyarrow]'])
+def test_low_cardinality_text_becomes_category(dtype):
+    sample = pd.DataFrame({
+        'bezirk': pd.Series(['Mitte', 'Pankow', 'Neukölln'] * 100, dtype=dtype),
+        'name': pd.Series([f'Ort {i}' for i in range(300)], dtype=dtype),
+        'einwohner': range(300),
+    })
+
+    plan = plan_dtypes(sample)
+
+    assert plan['bezirk'] == 'category'
+    assert 'name' not in plan
+    assert plan['einwohner'] == 'Int32'
+
+
+def test_memory_efficient_load_reads_categories(tmp_path):
+    path = tmp_path / 'orte.csv'
+    path.write_text('bezirk,einwohner\n' + ''.join(f'{b},{i}\n' for i, b in
+                                                    enumerate(['Mitte', 'Pankow', 'Neukölln'] * 500)))
+
+    df = SmartAutoDataLoader(verbose=False, use_profiles=False,
+                             load_strategy=LoadStrategy.MEMORY_EFFICIENT).load(str(path))
+
+    assert isinstance(df['bezirk'].dtype, pd.CategoricalDtype)
+    assert set(df['bezirk'].cat.categories) == {'Mitte', 'Pankow', 'Neukölln'}
+
+
+@pytest.fixture
+def late_precision_csv(tmp_path):
+    """lat is 52.5 beyond the 10k-row sample, then needs float64; anteil always fits float32"""
+    path = tmp_path / 'koordinaten.csv'
+    rows = [f'{i},52.5,0.25\n' for i in range(15000)] + ['15000,52.5123456789,0.75\n']
+    path.write_text('id,lat,anteil\n' + ''.join(rows))
+    return path
+
+
+@pytest.mark.parametrize('parallel', [None, 2])
+def test_floats_are_not_rounded_beyond_the_sample(late_precision_csv, parallel, monkeypatch):
+    monkeypatch.setattr(smart_auto_data_loader, 'MIN_RANGE_BYTES', 64 * 1024)  # Split the small file
+    df = SmartAutoDataLoader(verbose=False, use_profiles=False,
+                             load_strategy=LoadStrategy.MEMORY_EFFICIENT).load_csv(str(late_precision_csv),
+                                                                                   parallel=parallel)
+
+    assert df['lat'].dtype == 'float64'
+    assert df['lat'].iloc[-1] == 52.5123456789
+    assert df['anteil'].dtype == 'float32'
+
+
+def test_plan_leaves_floats_to_the_full_parse():
+    assert plan_dtypes(pd.DataFrame({'anteil': [0.25, 0.5]})) == {}
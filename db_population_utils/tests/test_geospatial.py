@@ -0,0 +1,68 @@
+"""load_geospatial: pyogrio reads with bbox, column and attribute pushdown (geospatial.py)"""
+
+import json
+
+import pytest
+
+pytest.importorskip('pyogrio')
+geopandas = pytest.importorskip('geopandas')
+
+from db_population_utils.data_loader.data_loader import LoadOptions  # noqa: E402
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader  # noqa: E402
+
+PLACES = [
+    ('Spielplatz Mauerpark', 'Spielplatz', 13.4023, 52.5432),
+    ('Spielplatz Görlitzer Park', 'Spielplatz', 13.4378, 52.4967),
+    ('Tierpark Friedrichsfelde', 'Zoo', 13.5305, 52.5037),
+    ('Spielplatz Zitadelle', 'Spielplatz', 13.2128, 52.5413),
+]
+INNER_BBOX = (13.35, 52.45, 13.55, 52.56)  # Everything but Spandau
+
+
+@pytest.fixture
+def geojson_file(tmp_path):
+    features = [{'type': 'Feature', 'properties': {'name': name, 'kategorie': kategorie, 'eroeffnet': '2001-05-01'},
+                 'geometry': {'type': 'Point', 'coordinates': [lon, lat]}}
+                for name, kategorie, lon, lat in PLACES]
+    path = tmp_path / 'orte.geojson'
+    path.write_text(json.dumps({'type': 'FeatureCollection', 'features': features}), encoding='utf-8')
+    return path
+
+
+def test_bbox_and_columns_are_pushed_into_the_read(geojson_file):
+    df = SmartAutoDataLoader(verbose=False).load(str(geojson_file),
+                                                 options=LoadOptions(bbox=INNER_BBOX, columns=['name']))
+
+    assert isinstance(df, geopandas.GeoDataFrame)
+    assert sorted(df['name']) == ['Spielplatz Görlitzer Park', 'Spielplatz Mauerpark', 'Tierpark Friedrichsfelde']
+    assert list(df.columns) == ['name', 'geometry']
+    assert df.has_sindex  # Built by read_layer
+
+
+def test_filters_become_an_attribute_where(geojson_file):
+    loader = SmartAutoDataLoader(verbose=False)
+
+    df = loader.load_geospatial(str(geojson_file), filters=[('kategorie', '==', 'Spielplatz')], geometry=False)
+
+    assert not isinstance(df, geopandas.GeoDataFrame) and 'geometry' not in df.columns
+    assert len(df) == 3
+    assert df['eroeffnet'].dtype.kind == 'M'  # Date attributes parsed like any other load
+    assert loader._last_load['geo_params'].feature_count == len(PLACES)
+
+
+def test_layers_of_a_geopackage(tmp_path):
+    path = tmp_path / 'berlin.gpkg'
+    for layer, rows in (('spielplaetze', PLACES[:2]), ('zoos', PLACES[2:3])):
+        frame = geopandas.GeoDataFrame({'name': [row[0] for row in rows]},
+                                       geometry=geopandas.points_from_xy([row[2] for row in rows],
+                                                                         [row[3] for row in rows]),
+                                       crs='EPSG:4326')
+        frame.to_file(path, layer=layer, driver='GPKG')
+    loader = SmartAutoDataLoader(verbose=False)
+
+    params = loader.inspect_geospatial(str(path))
+    df = loader.load(str(path), options=LoadOptions(layer='zoos'))
+
+    assert params.available_layers == ['spielplaetze', 'zoos']
+    assert df['name'].tolist() == ['Tierpark Friedrichsfelde']
+    assert df.crs.to_epsg() == 4326
@@ -0,0 +1,64 @@
+"""Overpass documents read element by element from a bounded buffer (json_stream.py)"""
+
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from db_population_utils.data_loader.json_stream import (OVERPASS_RECORD_KEY, estimate_records, flatten_element,
+                                                         iter_records)
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+ELEMENTS = [
+    {'type': 'node', 'id': 1, 'lat': 52.5200066, 'lon': 13.404954,
+     'tags': {'amenity': 'cafe', 'name': 'Café "Zur Ecke" [Mitte]', 'opening_hours': 'Mo-Fr 08:00-18:00'}},
+    {'type': 'way', 'id': 23, 'center': {'lat': 52.4862, 'lon': 13.4251},
+     'tags': {'leisure': 'park', 'name': 'Tempelhofer Feld, {Ost}'}},
+    {'type': 'node', 'id': 4000000000, 'lat': -1.5e-3, 'lon': 1e2, 'tags': {'id': 'tag, not the OSM id'}},
+    {'type': 'relation', 'id': 5, 'center': {'lat': 52.51, 'lon': 13.38}},
+]
+
+
+@pytest.fixture
+def overpass_text():
+    return json.dumps({'version': 0.6, 'generator': 'Overpass API 0.7.62',
+                       'osm3s': {'timestamp_osm_base': '2025-09-24T10:00:00Z'},
+                       'elements': ELEMENTS, 'remark': 'trailing metadata'}, ensure_ascii=False, indent=1)
+
+
+@pytest.mark.parametrize('chunk_chars', [1, 7, 64, 100000])
+def test_records_cross_buffer_boundaries(overpass_text, chunk_chars):
+    records = list(iter_records(io.StringIO(overpass_text), OVERPASS_RECORD_KEY, chunk_chars=chunk_chars))
+
+    assert records == ELEMENTS
+
+
+def test_elements_flatten_to_one_row_each():
+    rows = [flatten_element(element) for element in ELEMENTS]
+
+    assert rows[0]['name'] == 'Café "Zur Ecke" [Mitte]'
+    assert (rows[1]['lat'], rows[1]['lon']) == (52.4862, 13.4251)  # From "center"
+    assert rows[2]['osm_id'] == 4000000000 and rows[2]['id'] == 'tag, not the OSM id'
+    assert flatten_element(ELEMENTS[1], tags=['name', 'amenity']) == {
+        'osm_type': 'way', 'osm_id': 23, 'lat': 52.4862, 'lon': 13.4251,
+        'name': 'Tempelhofer Feld, {Ost}', 'amenity': None}
+
+
+def test_record_count_is_exact_for_a_whole_document(overpass_text):
+    head = overpass_text.encode('utf-8')
+
+    assert estimate_records(head, len(head), 'utf-8', OVERPASS_RECORD_KEY) == len(ELEMENTS)
+
+
+def test_streamed_overpass_load_matches_a_whole_load(overpass_text, tmp_path):
+    path = tmp_path / 'cafes.json'
+    path.write_text(overpass_text, encoding='utf-8')
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+
+    whole = loader.load_json(str(path))
+    chunks = list(loader.load_json(str(path), chunksize=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert whole['osm_id'].tolist() == [1, 23, 4000000000, 5]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True)[whole.columns], whole, check_dtype=False)
@@ -0,0 +1,83 @@
+"""LazyPipeline: recorded DataProcessor steps run over a frame or a chunk stream"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from db_population_utils.data_processor.data_processor import DataProcessor
+
+
+@pytest.fixture
+def listings():
+    rng = np.random.default_rng(3)
+    rows = 1000
+    df = pd.DataFrame({
+        'Kalt Miete': [f'{v:.2f} €'.replace('.', ',') for v in rng.uniform(300, 3000, rows)],
+        'Baujahr': rng.choice(['1910', '1972', '2015', None], rows),
+        'Zimmer': rng.choice(['1', '2', '3', '4'], rows),
+        'Bezirk': rng.choice(['Mitte', 'Pankow', 'Neukölln', None], rows),
+    })
+    df.loc[250:252, 'Bezirk'] = None  # A gap at the start of the second chunk
+    return df
+
+
+def eager(processor, df):
+    df = processor.standardize_columns(df)
+    df = processor.parse_numbers(df, ['kalt_miete'])
+    df = processor.coerce_types(df, {'baujahr': 'float64'})
+    df = processor.coerce_types(df, {'zimmer': 'float64'})
+    return processor.handle_nulls(df, {'bezirk': 'ffill'})
+
+
+def lazy(processor):
+    return (processor.lazy()
+            .standardize_columns()
+            .parse_numbers(['kalt_miete'])
+            .coerce_types({'baujahr': 'float64'})
+            .coerce_types({'zimmer': 'float64'})
+            .handle_nulls({'bezirk': 'ffill'}))
+
+
+def chunks_of(df, size):
+    return (df.iloc[start:start + size].copy() for start in range(0, len(df), size))
+
+
+def test_streamed_pipeline_matches_the_eager_steps(listings):
+    processor = DataProcessor()
+    expected = eager(processor, listings)
+
+    df, result = lazy(processor).collect(chunks_of(listings, 250))
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert df.loc[250:252, 'bezirk'].tolist() == [listings.loc[249, 'Bezirk']] * 3  # ffill over the cut
+    assert (result.chunks, result.rows_in, result.rows_out, result.copies) == (4, 1000, 1000, 0)
+
+
+def test_frame_is_copied_once_and_left_untouched(listings):
+    processor = DataProcessor()
+    before = listings.copy()
+
+    df, result = lazy(processor).collect(listings)
+
+    pd.testing.assert_frame_equal(df, eager(processor, listings))
+    pd.testing.assert_frame_equal(listings, before)
+    assert result.copies == 1
+    assert result.plan == ['standardize_columns', 'parse_numbers', 'coerce_types+coerce_types_2', 'handle_nulls']
+
+
+def test_detected_number_columns_are_fixed_on_the_first_chunk():
+    first = pd.DataFrame({'preis': ['1,50', '2,00'], 'name': ['a', 'b']})
+    second = pd.DataFrame({'preis': ['3,25', '4,00'], 'name': ['7', '8']})  # name looks numeric here
+
+    df, _ = DataProcessor().lazy().parse_numbers().collect(iter([first, second]))
+
+    assert df['preis'].tolist() == [1.5, 2.0, 3.25, 4.0]
+    assert df['name'].tolist() == ['a', 'b', '7', '8']
+
+
+def test_whole_column_fills_are_rejected_for_streams(listings):
+    pipeline = DataProcessor().lazy().handle_nulls({'Baujahr': 'mode'})
+
+    with pytest.raises(ValueError, match='whole columns'):
+        pipeline.collect(chunks_of(listings, 250))
+    assert len(pipeline.collect(listings)[0]) == 1000
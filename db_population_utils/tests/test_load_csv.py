@@ -0,0 +1,101 @@
+"""SmartAutoDataLoader.load_csv: localized numbers and filters across strategies"""
+
+import pandas as pd
+import pytest
+
+from db_population_utils.data_loader.data_loader import LoadStrategy
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+STRATEGIES = [None, LoadStrategy.ROBUST, LoadStrategy.PERFORMANCE, LoadStrategy.MEMORY_EFFICIENT]
+
+
+def _loader(strategy=None):
+    kwargs = {} if strategy is None else {'load_strategy': strategy}
+    return SmartAutoDataLoader(verbose=False, use_profiles=False, **kwargs)
+
+
+@pytest.fixture
+def german_csv(tmp_path):
+    """';' file with decimal commas, thousands dots and a dotted date column"""
+    rows = [f'Wohnung {i};{i * 7 % 120},5;1.{i % 900 + 100},50;24.09.2025\n' for i in range(300)]
+    path = tmp_path / 'wohnungen.csv'
+    path.write_text('name;flaeche;preis;datum\n' + ''.join(rows), encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def placeholder_csv(tmp_path):
+    """Like german_csv, with a '-' for a missing number in every number column"""
+    rows = [f'Wohnung {i};{i * 7 % 120},5;1.{i % 900 + 100},50;24.09.2025\n' for i in range(300)]
+    path = tmp_path / 'wohnungen_fehlend.csv'
+    path.write_text('name;flaeche;preis;datum\n' + ''.join(rows) + 'Lager;-;-;24.09.2025\n',
+                    encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def late_placeholder_csv(tmp_path):
+    """Like placeholder_csv, with the '-' far past the head the number format is sniffed from"""
+    rows = [f'Wohnung {i};{i * 7 % 120},5;1.{i % 900 + 100},50;24.09.2025\n' for i in range(20000)]
+    path = tmp_path / 'wohnungen_spaet.csv'
+    path.write_text('name;flaeche;preis;datum\n' + ''.join(rows) + 'Lager;-;-;24.09.2025\n',
+                    encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize('strategy', STRATEGIES)
+@pytest.mark.parametrize('fixture', ['german_csv', 'placeholder_csv', 'late_placeholder_csv'])
+def test_numeric_filter_on_localized_numbers(request, fixture, strategy):
+    path = str(request.getfixturevalue(fixture))
+    expected = pd.read_csv(path, sep=';', decimal=',', thousands='.', na_values=['-'])
+    expected = expected[expected['flaeche'] > 50].reset_index(drop=True)
+
+    df = _loader(strategy).load(path, filters=[('flaeche', '>', 50)], columns=['name', 'flaeche', 'preis'])
+
+    assert len(df) == len(expected)
+    assert list(df.columns) == ['name', 'flaeche', 'preis']
+    assert (df['flaeche'] > 50).all()
+    assert df['preis'].tolist() == pytest.approx(expected['preis'].tolist())
+
+
+@pytest.mark.parametrize('strategy', [None, LoadStrategy.ROBUST])
+def test_numeric_filter_while_streaming(placeholder_csv, strategy):
+    chunks = list(_loader(strategy).load(str(placeholder_csv), chunksize=100,
+                                         filters=[('flaeche', '>', 50)], columns=['flaeche']))
+    df = pd.concat(chunks, ignore_index=True)
+
+    assert list(df.columns) == ['flaeche']
+    assert pd.api.types.is_float_dtype(df['flaeche'])
+    assert (df['flaeche'] > 50).all()
+    assert len(df) == 171
+
+
+@pytest.fixture
+def drifting_csv(tmp_path):
+    """Boolean and integer columns whose values stop fitting after the first chunk"""
+    rows = [f'{i},{"true" if i % 2 else "false"},{i}\n' for i in range(100)]
+    rows += ['100,maybe,12.5\n'] + [f'{i},true,{i}\n' for i in range(101, 150)]
+    path = tmp_path / 'drift.csv'
+    path.write_text('id,aktiv,anzahl\n' + ''.join(rows), encoding='utf-8')
+    return path
+
+
+def test_streaming_widens_columns_later_chunks_do_not_fit(drifting_csv):
+    loader = _loader()
+    chunks = list(loader.load(str(drifting_csv), chunksize=50))
+
+    assert [len(chunk) for chunk in chunks] == [50, 50, 50]
+    assert chunks[0]['aktiv'].dtype == 'boolean'
+    assert chunks[0]['anzahl'].dtype == 'Int64'
+    assert chunks[2]['aktiv'].dtype == object
+    assert chunks[2]['aktiv'].iloc[0] == 'maybe'
+    assert chunks[2]['anzahl'].iloc[0] == 12.5
+    assert chunks[2]['id'].dtype == 'Int64'
+    assert loader._last_load['widened_to_object'] == {'aktiv': 'boolean', 'anzahl': 'Int64'}
+
+
+def test_build_report_warns_about_widened_columns(drifting_csv):
+    report = _loader().build_report(str(drifting_csv), chunksize=50)
+
+    assert report.success
+    assert any("'aktiv' read as object" in warning for warning in report.warnings)
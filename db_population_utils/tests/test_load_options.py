@@ -0,0 +1,98 @@
+"""load(options=LoadOptions(...)): options forwarded to the format loaders"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from db_population_utils.data_loader.data_loader import LoadOptions, LoadStrategy
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+
+@pytest.fixture
+def geojson_file(tmp_path):
+    feature = {'type': 'Feature', 'properties': {'name': 'Spielplatz'},
+               'geometry': {'type': 'Point', 'coordinates': [13.4, 52.5]}}
+    path = tmp_path / 'spielplaetze.geojson'
+    path.write_text(json.dumps({'type': 'FeatureCollection', 'features': [feature]}))
+    return path
+
+
+def test_geo_options_reach_load_geospatial(geojson_file):
+    loader = SmartAutoDataLoader(verbose=False)
+    calls = []
+    loader.load_geospatial = lambda source, **kwargs: calls.append(kwargs)
+
+    loader.load(str(geojson_file), options=LoadOptions(layer='spielplaetze', bbox=(13.3, 52.4, 13.5, 52.6),
+                                                       geometry=False, columns=['name']))
+
+    assert calls == [{'layer': 'spielplaetze', 'bbox': (13.3, 52.4, 13.5, 52.6),
+                      'geometry': False, 'columns': ['name']}]
+
+
+@pytest.mark.parametrize('option', [{'chunksize': 100}, {'parallel': 4}])
+def test_geo_layers_cannot_be_split(geojson_file, option):
+    with pytest.raises(ValueError, match='geospatial'):
+        SmartAutoDataLoader(verbose=False).load(str(geojson_file), options=LoadOptions(**option))
+
+
+def test_layer_is_rejected_for_csv(tmp_path):
+    path = tmp_path / 'orte.csv'
+    path.write_text('name,lon,lat\nMitte,13.4,52.5\n')
+
+    with pytest.raises(ValueError, match='layer'):
+        SmartAutoDataLoader(verbose=False).load(str(path), options=LoadOptions(layer=0))
+
+
+@pytest.fixture
+def venues_csv(tmp_path):
+    path = tmp_path / 'venues.csv'
+    path.write_text('name,Longitude,Latitude\n' + ''.join(f'Ort {i},{13 + i / 100},{52 + i / 200}\n'
+                                                          for i in range(100)))
+    return path
+
+
+def test_bbox_filters_a_csv_on_its_coordinate_columns(venues_csv):
+    df = SmartAutoDataLoader(verbose=False).load(str(venues_csv),
+                                                 options=LoadOptions(bbox=(13.2, 52.1, 13.4, 52.15)))
+
+    assert df['name'].tolist() == [f'Ort {i}' for i in range(20, 31)]
+
+
+def test_streaming_without_matches_yields_an_empty_frame(venues_csv):
+    chunks = list(SmartAutoDataLoader(verbose=False).load(str(venues_csv), chunksize=10,
+                                                          columns=['name', 'Longitude'],
+                                                          filters=[('Longitude', '>', 20)]))
+
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert list(chunks[0].columns) == ['name', 'Longitude']
+    assert chunks[0]['Longitude'].dtype == 'float64'
+
+
+@pytest.fixture
+def bezirke_csv(tmp_path):
+    path = tmp_path / 'bezirke.csv'
+    path.write_text('bezirk,einwohner\n' + ''.join(f'{b},{i}\n' for i, b in
+                                                    enumerate(['Mitte', 'Pankow', 'Neukölln'] * 500)))
+    return path
+
+
+def test_load_strategy_overrides_the_loader_for_one_load(bezirke_csv):
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+
+    df = loader.load(str(bezirke_csv), options=LoadOptions(load_strategy=LoadStrategy.MEMORY_EFFICIENT))
+
+    assert isinstance(df['bezirk'].dtype, pd.CategoricalDtype)
+    assert loader.load_strategy is None
+    assert not isinstance(loader.load(str(bezirke_csv))['bezirk'].dtype, pd.CategoricalDtype)
+
+
+def test_load_strategy_holds_for_streamed_chunks(bezirke_csv):
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+
+    chunks = loader.load(str(bezirke_csv), options=LoadOptions(load_strategy=LoadStrategy.MEMORY_EFFICIENT,
+                                                               chunksize=500))
+
+    assert loader.load_strategy is None
+    assert all(isinstance(chunk['bezirk'].dtype, pd.CategoricalDtype) for chunk in chunks)
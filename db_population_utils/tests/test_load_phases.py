@@ -0,0 +1,51 @@
+"""Phase recording (load_phases.py) of loads and of streamed chunks"""
+
+import tracemalloc
+
+import pytest
+
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+
+@pytest.fixture
+def two_csvs(tmp_path):
+    paths = []
+    for name in ('a.csv', 'b.csv'):
+        path = tmp_path / name
+        path.write_text('id,wert\n' + ''.join(f'{i},{i * 2}\n' for i in range(1000)))
+        paths.append(path)
+    return paths
+
+
+def test_streamed_load_stops_tracemalloc_when_consumed(two_csvs):
+    assert not tracemalloc.is_tracing()
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False, track_allocations=True)
+
+    chunks = loader.load_csv(str(two_csvs[0]), chunksize=100)
+    assert not tracemalloc.is_tracing()
+    assert sum(len(chunk) for chunk in chunks) == 1000
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_closed_stream_stops_tracemalloc(two_csvs):
+    chunks = SmartAutoDataLoader(verbose=False, use_profiles=False,
+                                 track_allocations=True).load_csv(str(two_csvs[0]), chunksize=100)
+    next(chunks)
+    chunks.close()
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_stream_records_under_its_own_load(two_csvs):
+    calls = []
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False,
+                                 on_phase=lambda phase, stats: calls.append((phase, stats['source'])))
+
+    chunks = loader.load_csv(str(two_csvs[0]), chunksize=100)
+    loader.load(str(two_csvs[1]))
+    calls.clear()
+    list(chunks)
+
+    assert ('parse', str(two_csvs[0])) in calls
+    assert all(source == str(two_csvs[0]) for _, source in calls)
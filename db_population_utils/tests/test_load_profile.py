@@ -0,0 +1,21 @@
+"""Load profiles: repeat loads replay the dtypes of their own load strategy"""
+
+import pandas as pd
+
+from db_population_utils.data_loader.data_loader import LoadStrategy
+from db_population_utils.data_loader.load_profile import profile_path
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+
+def test_profile_is_kept_per_strategy(tmp_path):
+    path = tmp_path / 'bezirke_2025.csv'
+    path.write_text('bezirk,einwohner\n' + ''.join(f'Bezirk {i % 12},{1000 + i}\n' for i in range(200)))
+
+    default = SmartAutoDataLoader(verbose=False).load(str(path))
+    SmartAutoDataLoader(verbose=False, load_strategy=LoadStrategy.PERFORMANCE).load(str(path))
+    replayed = SmartAutoDataLoader(verbose=False).load(str(path))
+
+    assert replayed['einwohner'].dtype == 'int64'
+    pd.testing.assert_frame_equal(replayed, default)
+    assert profile_path(str(path)).exists()
+    assert profile_path(str(path), 'performance').exists()
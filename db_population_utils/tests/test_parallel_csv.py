@@ -0,0 +1,59 @@
+"""load_csv(parallel=N): byte ranges of whole records parse like one serial read"""
+
+import pandas as pd
+
+from db_population_utils.data_loader.byte_sampling import MIN_RANGE_BYTES, record_boundaries
+from db_population_utils.data_loader.smart_auto_data_loader import SmartAutoDataLoader
+
+PARTS = 4
+NOTE_WIDTH = 60
+HEADER = 'id,wert,notiz\n'
+MULTILINE_NOTE = 'Zeile ""zwei"", mit Komma\n' * 2
+
+
+def _row(i, note):
+    """Fixed-width record, so the record at a byte offset can be computed"""
+    return f'{i:07d},{i * 0.25:012.2f},"{note.rjust(NOTE_WIDTH)}"\n'
+
+
+def _naive_cuts(size, data_start):
+    """Where record_boundaries starts looking for each range end"""
+    return [data_start + (size - data_start) * i // PARTS for i in range(1, PARTS)]
+
+
+def _quoted_csv(path):
+    """CSV with quoted multi-line notes (with commas and "" escapes) around every cut point"""
+    rows = [_row(i, f'Notiz {i}') for i in range(2 * PARTS * MIN_RANGE_BYTES // len(_row(0, '')))]
+    size = len(HEADER) + sum(len(row) for row in rows)
+    row_bytes = len(rows[0])
+    for cut in _naive_cuts(size, len(HEADER)):
+        middle = (cut - len(HEADER)) // row_bytes
+        for i in range(middle - 3, middle + 4):
+            rows[i] = _row(i, MULTILINE_NOTE)
+    path.write_bytes((HEADER + ''.join(rows)).encode('utf-8'))
+    return path
+
+
+def test_parallel_matches_serial_read_across_quoted_newlines(tmp_path):
+    path = _quoted_csv(tmp_path / 'notizen.csv')
+    data = path.read_bytes()
+    data_start, boundaries = record_boundaries(str(path), PARTS)
+    # Every naive cut falls inside a quoted field, so a range end found by newline alone is wrong
+    for cut in _naive_cuts(len(data), data_start):
+        assert data.count(b'"', 0, data.index(b'\n', cut)) % 2 == 1
+    assert len(boundaries) == PARTS + 1
+
+    loader = SmartAutoDataLoader(verbose=False, use_profiles=False)
+    read_parallel, results = loader._read_csv_parallel, []
+
+    def spy(*args, **kwargs):
+        results.append(read_parallel(*args, **kwargs))
+        return results[-1]
+
+    loader._read_csv_parallel = spy
+    df = loader.load(str(path), parallel=PARTS)
+
+    assert results and results[0] is not None  # Not the serial fallback
+    expected = pd.read_csv(path)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert df['notiz'].str.contains('\n').sum() == 7 * (PARTS - 1)
@@ -0,0 +1,90 @@
+"""run_pipeline(parallel=N): partition-safe steps in a process pool (partitioned.py)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from db_population_utils.data_processor.data_processor import DataProcessor
+from db_population_utils.data_processor.partitioned import (MIN_PARTITION_ROWS, barrier, partition_safe,
+                                                           plan_stages)
+
+PARTS = 4
+
+
+@partition_safe
+def clean_gyms(df):
+    df = df.assign(website=df['website'].fillna('').str.lower().str.strip())
+    return df[pd.to_numeric(df['latitude'], errors='coerce').notna()]
+
+
+@partition_safe
+def latest_per_osm_id(df):
+    return df.drop_duplicates('osm_id', keep='last')
+
+
+@partition_safe
+def renumbered(df):
+    return df.reset_index(drop=True)
+
+
+def dedup_by_name(df):
+    return df.drop_duplicates('name')
+
+
+@barrier
+def sort_by_name(df):
+    return df.sort_values('name', kind='stable')
+
+
+@pytest.fixture
+def gyms():
+    rng = np.random.default_rng(4)
+    rows = PARTS * MIN_PARTITION_ROWS + 123
+    return pd.DataFrame({
+        'osm_id': rng.integers(0, rows // 2, rows),
+        'name': [f'Gym {v}' for v in rng.integers(0, rows // 3, rows)],
+        'website': rng.choice([' HTTPS://Gym.de ', None, 'https://fit.berlin'], rows),
+        'latitude': rng.choice(['52.5', '52,51', None, '52.49'], rows),
+    }, index=pd.RangeIndex(1000, 1000 + rows))
+
+
+def test_stages_group_consecutive_partition_safe_steps():
+    stages = plan_stages([clean_gyms, latest_per_osm_id, dedup_by_name, sort_by_name, clean_gyms])
+
+    assert [(safe, len(steps)) for safe, steps in stages] == [(True, 2), (False, 1), (False, 1), (True, 1)]
+
+
+@pytest.mark.parametrize('transfer', ['pickle', 'arrow'])
+def test_row_ranges_match_a_serial_run(gyms, transfer):
+    if transfer == 'arrow':
+        pytest.importorskip('pyarrow')
+    processor = DataProcessor()
+    steps = [clean_gyms, latest_per_osm_id, dedup_by_name]
+
+    df = processor.run_pipeline(gyms, steps, parallel=PARTS, transfer=transfer)
+
+    # Contiguous ranges: latest_per_osm_id keeps one row per id and range, so compare the partition-wise result
+    parts = np.array_split(np.arange(len(gyms)), PARTS)
+    expected = dedup_by_name(pd.concat([latest_per_osm_id(clean_gyms(gyms.iloc[part])) for part in parts]))
+    pd.testing.assert_frame_equal(df, expected)
+    stats = processor._pipeline_stats
+    assert (stats['partitions'], stats['transfer']) == (PARTS, transfer)
+    assert [stage['parallel'] for stage in stats['stages']] == [True, False]
+
+
+def test_partition_by_matches_a_serial_run(gyms):
+    steps = [clean_gyms, latest_per_osm_id, sort_by_name]
+
+    df = DataProcessor().run_pipeline(gyms, steps, parallel=PARTS, partition_by='osm_id', transfer='pickle')
+
+    pd.testing.assert_frame_equal(df, DataProcessor().run_pipeline(gyms, steps))
+
+
+def test_partition_by_needs_the_row_index(gyms):
+    with pytest.raises(ValueError, match='keep the row index'):
+        DataProcessor().run_pipeline(gyms, [renumbered], parallel=PARTS, partition_by='osm_id', transfer='pickle')
+
+
+def test_unpicklable_steps_are_rejected(gyms):
+    with pytest.raises(ValueError, match='cannot be sent to a worker'):
+        DataProcessor().run_pipeline(gyms, [partition_safe(lambda df: df)], parallel=PARTS)
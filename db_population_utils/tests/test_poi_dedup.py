@@ -0,0 +1,80 @@
+"""deduplicate: POIs merged across sources by blocking and scoring (poi_dedup.py)"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from db_population_utils.data_processor.data_processor import DataProcessor
+from db_population_utils.data_processor.poi_dedup import CELL_METERS, normalize_street
+
+COLUMNS = ['name', 'street', 'housenumber', 'postcode', 'latitude', 'longitude', 'source', 'phone']
+
+
+@pytest.fixture
+def clinics():
+    rows = [
+        ('Tierarztpraxis Dr. med. vet. Anna Müller', 'Rathenaustraße', '9', '10318', 52.48520, 13.52110, 'BPT', None),
+        ('Tierarztpraxis Müller', 'Rathenaustr. 9', None, '10318', 52.48535, 13.52125, 'OSM', '030 5081234'),
+        ('Tierarztpraxis Anna Mueller GmbH', 'Rathenau Str.', '9', '10318', None, None, 'TAEK', None),
+        # The neighbour on the same street and another practice in the same building
+        ('Tierarztpraxis Müller', 'Rathenaustraße', '11', '10318', 52.48560, 13.52160, 'OSM', None),
+        ('Zahnarztpraxis Schmidt', 'Rathenaustraße', '9', '10318', 52.48521, 13.52111, 'OSM', None),
+        ('Kleintierklinik Am Park', 'Parkstraße', '3a', '13086', 52.55410, 13.44560, 'BPT', '030 9261111'),
+        ('Kleintierklinik am Park', 'Parkstr.', '3 a', '13086', 52.55400, 13.44550, 'OSM', None),
+        ('Tierklinik Spandau', 'Seegefelder Straße', '120', '13583', 52.53800, 13.17900, 'BPT', None),
+    ]
+    return pd.DataFrame(rows, columns=COLUMNS, index=[f'r{i}' for i in range(len(rows))])
+
+
+def test_sources_collapse_into_one_record_per_place(clinics):
+    result = DataProcessor().deduplicate(clinics, source_priority=['BPT', 'TAEK', 'OSM'])
+
+    clusters = result.clusters.groupby('cluster_id').apply(lambda group: sorted(group.index)).tolist()
+    assert sorted(clusters) == [['r0', 'r1', 'r2'], ['r3'], ['r4'], ['r5', 'r6'], ['r7']]
+    assert result.frame.index.tolist() == ['r0', 'r3', 'r4', 'r5', 'r7']
+    assert result.frame.loc['r0', 'phone'] == '030 5081234'  # Coalesced from the OSM record
+    assert (result.stats['naive_pairs'], result.stats['duplicates']) == (28, 3)
+    assert result.stats['candidate_pairs'] < result.stats['naive_pairs']
+
+
+def test_source_priority_picks_the_survivor(clinics):
+    result = DataProcessor().deduplicate(clinics, source_priority=['OSM', 'BPT'], coalesce=False)
+
+    assert result.frame.index.tolist() == ['r1', 'r3', 'r4', 'r6', 'r7']
+    assert result.clusters.loc['r0', 'survivor'] == 'r1'
+    assert pd.isna(result.frame.loc['r6', 'phone'])  # Not coalesced from the BPT record
+
+
+def test_places_across_a_cell_edge_still_meet():
+    lat_step = CELL_METERS / (math.pi * 6_371_000 / 180)
+    edge = 350 * lat_step  # A cell boundary at 52.47° north
+    df = pd.DataFrame({'name': ['Apotheke am Markt', 'Apotheke Am Markt'],
+                       'street': ['Marktstraße 4', 'Marktstr. 4'],
+                       'latitude': [edge - 1e-5, edge + 1e-5], 'longitude': [13.4, 13.4]})
+
+    result = DataProcessor().deduplicate(df)
+
+    assert math.floor(df['latitude'][0] / lat_step) != math.floor(df['latitude'][1] / lat_step)
+    assert result.stats['clusters'] == 1
+
+
+def test_street_and_house_number_are_normalized():
+    street, number = normalize_street(pd.Series(['Rathenaustr. 9', 'Müller-Breslau-Straße 12 a', 'Parkstraße']),
+                                      pd.Series([None, None, '3A']))
+
+    assert street[0] == normalize_street(pd.Series(['Rathenaustraße']))[0][0]
+    assert number.tolist() == ['9', '12a', '3a']
+
+
+def test_blocking_scales_with_block_sizes_not_rows():
+    rng = np.random.default_rng(1)
+    rows = 5000
+    df = pd.DataFrame({'name': [f'Praxis {i}' for i in range(rows)],
+                       'latitude': 52.4 + rng.uniform(0, 0.2, rows), 'longitude': 13.2 + rng.uniform(0, 0.4, rows)})
+
+    stats = DataProcessor().deduplicate(df).stats
+
+    assert stats['clusters'] == rows
+    assert stats['candidate_pairs'] < stats['naive_pairs'] / 100
@@ -0,0 +1,82 @@
+"""QualitySketch: mergeable distinct, duplicate and null counts (quality_sketch.py)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from db_population_utils.data_loader.quality_sketch import EXACT_DISTINCT, QualitySketch, sketch_frame
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(7)
+    rows = 60000
+    df = pd.DataFrame({
+        'osm_id': rng.integers(0, 40000, rows),
+        'bezirk': rng.choice(['Mitte', 'Pankow', 'Neukölln', None], rows),
+        'wert': rng.normal(scale=50, size=rows).round(2),
+    })
+    return pd.concat([df, df.sample(900, random_state=7)], ignore_index=True)
+
+
+def test_distinct_counts_stay_within_the_error_bound(frame):
+    sketch = sketch_frame(frame, chunk_rows=10000)
+    stats = sketch.column_stats()
+
+    assert stats['bezirk'] == {**stats['bezirk'], 'distinct': 3, 'distinct_exact': True,
+                               'nulls': int(frame['bezirk'].isna().sum())}
+    for col in ('osm_id', 'wert'):
+        exact = frame[col].nunique()
+        assert exact > EXACT_DISTINCT and not stats[col]['distinct_exact']
+        assert abs(stats[col]['distinct'] - exact) <= sketch.distinct_relative_error * exact
+
+
+def test_merged_slices_count_duplicates_exactly(frame):
+    merged = QualitySketch()
+    for part in np.array_split(np.arange(len(frame)), 4):
+        merged.merge(sketch_frame(frame.iloc[part]))
+
+    assert merged.duplicates_exact
+    assert merged.duplicate_rows == frame.duplicated().sum()
+    assert merged.rows == len(frame)
+    assert merged.column_stats() == sketch_frame(frame).column_stats()
+    assert merged.quality_score == sketch_frame(frame).quality_score
+
+
+def test_negative_zero_equals_zero():
+    df = pd.DataFrame({'wert': [0.0, -0.0, 1.5]})
+
+    sketch = sketch_frame(df)
+
+    assert sketch.duplicate_rows == df.duplicated().sum() == 1
+    assert sketch.column_stats()['wert']['distinct'] == df['wert'].nunique() == 2
+
+
+def test_duplicates_are_estimated_past_max_exact_rows(frame):
+    sketch = sketch_frame(frame, chunk_rows=10000, max_exact_rows=20000)
+
+    assert not sketch.duplicates_exact
+    distinct_rows = len(frame) - frame.duplicated().sum()
+    assert abs(len(frame) - sketch.duplicate_rows - distinct_rows) <= sketch.distinct_relative_error * distinct_rows
+
+
+def test_min_and_max_merge_across_chunks():
+    sketch = QualitySketch().update(pd.DataFrame({'lat': [52.4, 52.6], 'datum': pd.to_datetime(['2025-01-02'] * 2)}))
+    sketch.merge(QualitySketch().update(pd.DataFrame({'lat': [52.3, None],
+                                                      'datum': pd.to_datetime(['2024-12-31', None])})))
+
+    stats = sketch.column_stats()
+    assert (stats['lat']['min'], stats['lat']['max'], stats['lat']['nulls']) == (52.3, 52.6, 1)
+    assert stats['datum']['min'] == pd.Timestamp('2024-12-31')
+
+
+def test_column_widened_to_object_drops_its_range():
+    sketch = QualitySketch().update(pd.DataFrame({'aktiv': pd.array([True, False], dtype='boolean')}))
+    sketch.update(pd.DataFrame({'aktiv': pd.Series([True, 'maybe'], dtype=object)}))
+
+    assert (sketch.column_stats()['aktiv']['min'], sketch.column_stats()['aktiv']['max']) == (None, None)
+
+
+def test_sketches_of_other_columns_do_not_merge():
+    with pytest.raises(ValueError, match='same columns'):
+        QualitySketch().update(pd.DataFrame({'a': [1]})).merge(QualitySketch().update(pd.DataFrame({'b': [1]})))
@@ -0,0 +1,14 @@
+"""DataProcessor.validate: declarative checks compiled into vectorized masks"""
+
+import pandas as pd
+
+from db_population_utils.data_processor.data_processor import DataProcessor
+
+
+def test_numeric_range_on_text_column():
+    df = pd.DataFrame({'capacity': ['120', '80', '-5', 'viele', None, '1500']})
+
+    result = DataProcessor().validate(df, {'ranges': {'capacity': (0, 1000)}})
+
+    assert not result.passed
+    assert result.sample_failures['ranges:capacity'] == ['-5', 'viele', '1500']